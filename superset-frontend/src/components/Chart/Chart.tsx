@@ -380,6 +380,7 @@ class Chart extends PureComponent<ChartProps, {}> {
           data-ui-anchor="chart"
           className="chart-container"
           data-test="chart-container"
+          data-chart-status={chartStatus}
           height={height}
           width={width}
         >
@@ -47,6 +47,7 @@ type AppConfig = Record<string, any>;
 type ListenerFn = (asyncEvent: AsyncEvent) => Promise<any>;
 
 const TRANSPORT_POLLING = 'polling';
+const TRANSPORT_LONG_POLLING = 'long-polling';
 const TRANSPORT_WS = 'ws';
 const JOB_STATUS = {
   PENDING: 'pending',
@@ -168,17 +169,21 @@ export const processEvents = async (events: AsyncEvent[]) => {
 
 const loadEventsFromApi = async () => {
   const eventArgs = lastReceivedEventId ? { last_id: lastReceivedEventId } : {};
+  // the server holds long-polling requests until events arrive, so poll again
+  // straight away unless there was nothing to wait for or the request failed
+  let delayMs = pollingDelayMs;
   if (Object.keys(listenersByJobId).length) {
     try {
       const { result: events } = await fetchEvents(eventArgs);
       if (events?.length) await processEvents(events);
+      if (transport === TRANSPORT_LONG_POLLING) delayMs = 0;
     } catch (err) {
       logging.warn(err);
     }
   }
 
-  if (transport === TRANSPORT_POLLING) {
-    pollingTimeoutId = window.setTimeout(loadEventsFromApi, pollingDelayMs);
+  if (transport === TRANSPORT_POLLING || transport === TRANSPORT_LONG_POLLING) {
+    pollingTimeoutId = window.setTimeout(loadEventsFromApi, delayMs);
   }
 };
 
@@ -245,7 +250,7 @@ export const init = (appConfig?: AppConfig) => {
     logging.warn('Failed to fetch last event Id from localStorage');
   }
 
-  if (transport === TRANSPORT_POLLING) {
+  if (transport === TRANSPORT_POLLING || transport === TRANSPORT_LONG_POLLING) {
     loadEventsFromApi();
   }
   if (transport === TRANSPORT_WS) {
@@ -47,7 +47,9 @@ class AsyncEventsRestApi(BaseSupersetApi):
           summary: Read off of the Redis events stream
           description: >-
             Reads off of the Redis events stream, using the user's JWT token and
-            optional query params for last event received.
+            optional query params for last event received. With the long-polling
+            transport the request is held until events arrive or the long-polling
+            timeout expires.
           parameters:
           - in: query
             name: last_id
@@ -93,7 +95,9 @@ class AsyncEventsRestApi(BaseSupersetApi):
                 request
             )
             last_event_id = request.args.get("last_id")
-            events = async_query_manager.read_events(async_channel_id, last_event_id)
+            events = async_query_manager.read_events(
+                async_channel_id, last_event_id, block=True
+            )
 
         except AsyncQueryTokenException:
             return self.response_401()
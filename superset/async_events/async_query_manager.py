@@ -112,7 +112,10 @@ class AsyncQueryManager:
         self._jwt_cookie_domain: Optional[str]
         self._jwt_cookie_samesite: Optional[Literal["None", "Lax", "Strict"]] = None
         self._jwt_secret: str
+        self._long_polling_timeout: Optional[int] = None
+        self._query_timeout: Optional[int] = None
         self._load_chart_data_into_cache_job: Any = None
+        self._load_chart_data_batch_into_cache_job: Any = None
         # pylint: disable=invalid-name
         self._load_explore_json_into_cache_job: Any = None
 
@@ -147,17 +150,25 @@ class AsyncQueryManager:
         ]
         self._jwt_cookie_domain = app.config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_DOMAIN"]
         self._jwt_secret = app.config["GLOBAL_ASYNC_QUERIES_JWT_SECRET"]
+        if app.config["GLOBAL_ASYNC_QUERIES_TRANSPORT"] == "long-polling":
+            self._long_polling_timeout = app.config[
+                "GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT"
+            ]
+
+        self._query_timeout = app.config["SQLLAB_ASYNC_TIME_LIMIT_SEC"]
 
         if app.config["GLOBAL_ASYNC_QUERIES_REGISTER_REQUEST_HANDLERS"]:
             self.register_request_handlers(app)
 
         # pylint: disable=import-outside-toplevel
         from superset.tasks.async_queries import (
+            load_chart_data_batch_into_cache,
             load_chart_data_into_cache,
             load_explore_json_into_cache,
         )
 
         self._load_chart_data_into_cache_job = load_chart_data_into_cache
+        self._load_chart_data_batch_into_cache_job = load_chart_data_batch_into_cache
         self._load_explore_json_into_cache_job = load_explore_json_into_cache
 
     def register_request_handlers(self, app: Flask) -> None:
@@ -257,15 +268,69 @@ class AsyncQueryManager:
         )
         return job_metadata
 
+    def submit_chart_data_jobs(
+        self,
+        channel_id: str,
+        form_datas: list[dict[str, Any]],
+        user_id: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Submit the chart data jobs of many query contexts as a single task, which
+        runs them one after the other. Each query context still gets its own job and
+        event on the channel, and its own share of the task soft time limit, and its
+        queries still open their own connections.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset import security_manager
+
+        jobs_metadata = [self.init_job(channel_id, user_id) for _ in form_datas]
+        guest_user = security_manager.get_current_guest_user_if_guest()
+        options = (
+            {"soft_time_limit": self._query_timeout * len(form_datas)}
+            if self._query_timeout
+            else {}
+        )
+        self._load_chart_data_batch_into_cache_job.apply_async(
+            (
+                [
+                    {**job_metadata, "guest_token": guest_user.guest_token}
+                    if guest_user
+                    else job_metadata
+                    for job_metadata in jobs_metadata
+                ],
+                form_datas,
+            ),
+            **options,
+        )
+        return jobs_metadata
+
     def read_events(
-        self, channel: str, last_id: Optional[str]
+        self, channel: str, last_id: Optional[str], block: bool = False
     ) -> list[Optional[dict[str, Any]]]:
+        """
+        Read the events of a channel received after `last_id`.
+
+        With `block` and the long-polling transport, wait up to
+        GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT milliseconds for new events with
+        XREAD BLOCK instead of returning an empty list straight away.
+        """
         if not self._cache:
             raise CacheBackendNotInitialized("Cache backend not initialized")
 
         stream_name = f"{self._stream_prefix}{channel}"
-        start_id = increment_id(last_id) if last_id else "-"
-        results = self._cache.xrange(stream_name, start_id, "+", self.MAX_EVENT_COUNT)
+        if block and self._long_polling_timeout:
+            # XREAD returns the entries after the given ID, `0-0` reads from the start
+            streams = self._cache.xread(
+                {stream_name: last_id or "0-0"},
+                self.MAX_EVENT_COUNT,
+                self._long_polling_timeout,
+            )
+            results = streams[0][1] if streams else []
+        else:
+            start_id = increment_id(last_id) if last_id else "-"
+            results = self._cache.xrange(
+                stream_name, start_id, "+", self.MAX_EVENT_COUNT
+            )
         # Decode bytes to strings, decode_responses is not supported at RedisCache and RedisSentinelCache  # noqa: E501
         if isinstance(self._cache, (RedisSentinelCacheBackend, RedisCacheBackend)):
             decoded_results = [
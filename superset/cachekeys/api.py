@@ -25,8 +25,9 @@ from marshmallow.exceptions import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
 
 from superset.cachekeys.schemas import CacheInvalidationRequestSchema
+from superset.commands.cachekeys.invalidate import CacheInvalidateCommand
 from superset.connectors.sqla.models import SqlaTable
-from superset.extensions import cache_manager, db, event_logger, stats_logger_manager
+from superset.extensions import event_logger
 from superset.models.cache import CacheKey
 from superset.views.base_api import BaseSupersetModelRestApi, statsd_metrics
 
@@ -52,16 +53,18 @@ class CacheRestApi(BaseSupersetModelRestApi):
     def invalidate(self) -> Response:
         """
         Take a list of datasources, find and invalidate the associated cache records
-        and remove the database records.
+        and thumbnails, and remove the database records.
         ---
         post:
           summary: Invalidate cache records and remove the database records
           description: >-
-            Takes a list of datasources, finds and invalidates the associated cache
-            records and removes the database records.
+            Takes a list of datasources or databases, finds and invalidates the
+            associated cache records and thumbnails, and removes the database records.
+            Can be called by ETL pipelines after reloading tables.
           requestBody:
             description: >-
-              A list of datasources uuid or the tuples of database and datasource names
+              A list of datasources uuid or the tuples of database and datasource
+              names, and/or a list of databases whose datasets are invalidated
             required: true
             content:
               application/json:
@@ -93,40 +96,11 @@ class CacheRestApi(BaseSupersetModelRestApi):
             if ds_obj:
                 datasource_uids.add(ds_obj.uid)
 
-        cache_key_objs = (
-            db.session.query(CacheKey)
-            .filter(CacheKey.datasource_uid.in_(datasource_uids))
-            .all()
-        )
-        cache_keys = [c.cache_key for c in cache_key_objs]
-        if cache_key_objs:
-            all_keys_deleted = cache_manager.cache.delete_many(*cache_keys)
-
-            if not all_keys_deleted:
-                # expected behavior as keys may expire and cache is not a
-                # persistent storage
-                logger.info(
-                    "Some of the cache keys were not deleted in the list %s", cache_keys
-                )
-
-            try:
-                delete_stmt = CacheKey.__table__.delete().where(  # pylint: disable=no-member
-                    CacheKey.cache_key.in_(cache_keys)
-                )
-
-                db.session.execute(delete_stmt)
-                db.session.commit()  # pylint: disable=consider-using-transaction
-
-                stats_logger_manager.instance.gauge(
-                    "invalidated_cache", len(cache_keys)
-                )
-                logger.info(
-                    "Invalidated %s cache records for %s datasources",
-                    len(cache_keys),
-                    len(datasource_uids),
-                )
-            except SQLAlchemyError as ex:  # pragma: no cover
-                db.session.rollback()  # pylint: disable=consider-using-transaction
-                logger.error(ex, exc_info=True)
-                return self.response_500(str(ex))
-        return self.response(201)
+        try:
+            result = CacheInvalidateCommand(
+                datasource_uids, datasources.get("database_ids", [])
+            ).run()
+        except SQLAlchemyError as ex:  # pragma: no cover
+            logger.error(ex, exc_info=True)
+            return self.response_500(str(ex))
+        return self.response(201, result=result)
@@ -1057,6 +1057,7 @@ class ChartRestApi(BaseSupersetModelRestApi):
                 body["chart_id"],
                 body.get("dashboard_id"),
                 body.get("extra_filters"),
+                body.get("query_context"),
             ).run()
             return self.response(200, result=[result])
         except CommandException as ex:
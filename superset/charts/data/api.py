@@ -42,7 +42,10 @@ from superset.commands.chart.exceptions import (
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.connectors.sqla.models import BaseDatasource
 from superset.daos.exceptions import DatasourceNotFound
-from superset.exceptions import QueryObjectValidationError
+from superset.exceptions import (
+    QueryObjectValidationError,
+    SupersetSecurityException,
+)
 from superset.extensions import event_logger
 from superset.models.sql_lab import Query
 from superset.utils import json
@@ -62,7 +65,7 @@ logger = logging.getLogger(__name__)
 
 
 class ChartDataRestApi(ChartRestApi):
-    include_route_methods = {"get_data", "data", "data_from_cache"}
+    include_route_methods = {"get_data", "data", "data_batch", "data_from_cache"}
 
     @expose("/<int:pk>/data/", methods=("GET",))
     @protect()
@@ -261,6 +264,157 @@ class ChartDataRestApi(ChartRestApi):
             command, form_data=form_data, datasource=query_context.datasource
         )
 
+    @expose("/data/batch", methods=("POST",))
+    @protect()
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}.data_batch",
+        log_to_statsd=False,
+    )
+    def data_batch(self) -> Response:
+        """
+        Take the query contexts of many charts, e.g. all the charts of a dashboard,
+        and return their cached data or submit async jobs for them.
+        ---
+        post:
+          summary: Return cached data or async jobs for many query contexts
+          description: >-
+            Takes a list of query contexts and returns, in the same order, either
+            the cached payload of each query context or the async job that will
+            load it. Query contexts with identical queries share a single job, and
+            jobs are submitted in batched tasks per datasource. Requires the
+            GLOBAL_ASYNC_QUERIES feature flag.
+          requestBody:
+            required: true
+            content:
+              application/json:
+                schema:
+                  type: object
+                  properties:
+                    queries:
+                      type: array
+                      items:
+                        $ref: "#/components/schemas/ChartDataQueryContextSchema"
+          responses:
+            200:
+              description: >-
+                One item per query context, with a `status` of `done` and the
+                query results in `result`, a `pending` async job or an `error`
+              content:
+                application/json:
+                  schema:
+                    type: object
+                    properties:
+                      result:
+                        type: array
+                        items:
+                          type: object
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        if not is_feature_enabled("GLOBAL_ASYNC_QUERIES"):
+            return self.response_400(message=_("Async queries are not enabled"))
+        json_body = request.json if request.is_json else None
+        if not isinstance(json_body, dict) or not isinstance(
+            json_body.get("queries"), list
+        ):
+            return self.response_400(message=_("Request is not JSON"))
+
+        async_command = CreateAsyncChartDataJobCommand()
+        try:
+            async_command.validate(request)
+        except AsyncQueryTokenException:
+            return self.response_401()
+
+        results: list[dict[str, Any]] = []
+        # query contexts to submit, grouped by datasource and keyed by their queries
+        pending: dict[str, dict[str, dict[str, Any]]] = {}
+        pending_indexes: dict[str, list[int]] = {}
+        for idx, form_data in enumerate(json_body["queries"]):
+            result, query_context = self._get_batch_result(form_data)
+            results.append(result or {})
+            if query_context is None:
+                continue
+
+            datasource_uid = query_context.datasource.uid
+            key = json.dumps(
+                [
+                    datasource_uid,
+                    [
+                        query_context.query_cache_key(query)
+                        for query in query_context.queries
+                    ],
+                ]
+            )
+            pending.setdefault(datasource_uid, {}).setdefault(key, form_data)
+            pending_indexes.setdefault(key, []).append(idx)
+
+        for form_datas in pending.values():
+            jobs_metadata = async_command.run_batch(
+                list(form_datas.values()), get_user_id()
+            )
+            for key, job_metadata in zip(form_datas, jobs_metadata, strict=True):
+                for idx in pending_indexes[key]:
+                    results[idx] = job_metadata
+
+        with event_logger.log_context(f"{self.__class__.__name__}.json_dumps"):
+            response_data = json.dumps(
+                {"result": results},
+                default=json.json_int_dttm_ser,
+                ignore_nan=True,
+            )
+        resp = make_response(response_data, 200)
+        resp.headers["Content-Type"] = "application/json; charset=utf-8"
+        return resp
+
+    def _get_batch_result(
+        self, form_data: dict[str, Any]
+    ) -> tuple[dict[str, Any] | None, QueryContext | None]:
+        """
+        Validate a query context of a batch and look its results up in the cache.
+
+        :param form_data: The chart form data
+        :returns: Either the cached results or the error of the query context, or the
+            query context to submit as an async job
+        """
+        try:
+            query_context = self._create_query_context_from_form(form_data)
+            command = ChartDataCommand(query_context)
+            command.validate()
+            if (
+                query_context.result_format != ChartDataResultFormat.JSON
+                or query_context.result_type != ChartDataResultType.FULL
+            ):
+                raise QueryObjectValidationError(
+                    _("Only full JSON results can be loaded in a batch")
+                )
+        except ValidationError as error:
+            return {
+                "status": "error",
+                "errors": [{"message": error.normalized_messages()}],
+            }, None
+        except (
+            DatasourceNotFound,
+            QueryObjectValidationError,
+            SupersetSecurityException,
+        ) as ex:
+            return {"status": "error", "errors": [{"message": ex.message}]}, None
+
+        with contextlib.suppress(ChartDataCacheLoadError, ChartDataQueryFailedError):
+            result = command.run(force_cached=True)
+            if result is not None:
+                queries = result["queries"]
+                if security_manager.is_guest_user():
+                    for query in queries:
+                        query.pop("query", None)
+                return {"status": "done", "result": queries}, None
+
+        return None, query_context
+
     @expose("/data/<cache_key>", methods=("GET",))
     @protect()
     @statsd_metrics
@@ -1601,6 +1601,12 @@ class ChartCacheWarmUpRequestSchema(Schema):
     extra_filters = fields.String(
         metadata={"description": "Extra filters to apply when warming up cache"}
     )
+    query_context = fields.Dict(
+        metadata={
+            "description": "Query context of the chart to warm up cache for instead "
+            "of the saved one"
+        }
+    )
 
 
 class ChartCacheWarmUpResponseSingleSchema(Schema):
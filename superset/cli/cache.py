@@ -0,0 +1,70 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import click
+from flask.cli import with_appcontext
+
+
+@click.command()
+@with_appcontext
+@click.option(
+    "--dataset-id",
+    "-d",
+    "dataset_ids",
+    type=int,
+    multiple=True,
+    help="Invalidate the cache of a dataset",
+)
+@click.option(
+    "--datasource-uid",
+    "-u",
+    "datasource_uids",
+    multiple=True,
+    help="Invalidate the cache of a datasource, eg 1__table",
+)
+@click.option(
+    "--database-id",
+    "-b",
+    "database_ids",
+    type=int,
+    multiple=True,
+    help="Invalidate the cache of all the datasets of a database",
+)
+def invalidate_cache(
+    dataset_ids: tuple[int, ...],
+    datasource_uids: tuple[str, ...],
+    database_ids: tuple[int, ...],
+) -> None:
+    """Invalidate the cached data and thumbnails of datasets, eg after ETL jobs"""
+    # pylint: disable=import-outside-toplevel
+    from superset.commands.cachekeys.invalidate import CacheInvalidateCommand
+    from superset.utils.core import DatasourceType
+
+    if not (dataset_ids or datasource_uids or database_ids):
+        raise click.UsageError("Pass at least one dataset, datasource or database")
+
+    result = CacheInvalidateCommand(
+        {
+            *datasource_uids,
+            *(f"{id_}__{DatasourceType.TABLE.value}" for id_ in dataset_ids),
+        },
+        database_ids,
+    ).run()
+    click.secho(
+        f"Invalidated {result['cache_keys']} cache records and "
+        f"{result['thumbnails']} thumbnails of {result['datasources']} datasources",
+        fg="green",
+    )
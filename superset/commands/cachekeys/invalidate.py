@@ -0,0 +1,160 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+from collections.abc import Iterable
+from typing import Any, TypedDict
+
+import sqlalchemy as sa
+
+from superset import db, thumbnail_cache
+from superset.commands.base import BaseCommand
+from superset.connectors.sqla.models import SqlaTable
+from superset.extensions import cache_manager, stats_logger_manager
+from superset.models.cache import CacheKey
+from superset.models.dashboard import Dashboard
+from superset.models.slice import Slice
+from superset.utils.core import DatasourceType
+from superset.utils.decorators import transaction
+from superset.utils.screenshots import ChartScreenshot, DashboardScreenshot
+
+logger = logging.getLogger(__name__)
+
+# SQLite has a IN clause limit of 999
+BATCH_SIZE = 999
+
+
+class CacheInvalidateResult(TypedDict):
+    datasources: int
+    cache_keys: int
+    thumbnails: int
+
+
+def batches(items: Iterable[Any]) -> Iterable[list[Any]]:
+    items = list(items)
+    for i in range(0, len(items), BATCH_SIZE):
+        yield items[i : i + BATCH_SIZE]
+
+
+class CacheInvalidateCommand(BaseCommand):
+    """
+    Invalidate everything cached for datasources, eg after an ETL job reloaded them.
+
+    Evicts the chart data and post-processed results recorded in the `cache_keys`
+    table (see STORE_CACHE_KEYS_IN_METADATA_DB), and the thumbnails of the charts of
+    the datasources and of their dashboards. Thumbnails rendered for the current user
+    can't be found and expire on their own.
+    """
+
+    def __init__(
+        self,
+        datasource_uids: Iterable[str] = (),
+        database_ids: Iterable[int] = (),
+    ):
+        """
+        :param datasource_uids: The uids of the datasources, eg `1__table`
+        :param database_ids: The ids of the databases whose datasets are invalidated
+        """
+        self._datasource_uids = set(datasource_uids)
+        self._database_ids = set(database_ids)
+
+    @transaction()
+    def run(self) -> CacheInvalidateResult:
+        self.validate()
+
+        cache_keys: list[str] = []
+        for uids in batches(self._datasource_uids):
+            cache_keys.extend(
+                db.session.execute(
+                    sa.select(CacheKey.cache_key).where(
+                        CacheKey.datasource_uid.in_(uids)
+                    )
+                ).scalars()
+            )
+        # the results are in the data cache, the query contexts in the default one
+        for cache in (cache_manager.data_cache, cache_manager.cache):
+            for keys in batches(cache_keys):
+                cache.delete_many(*keys)
+        for uids in batches(self._datasource_uids):
+            db.session.execute(
+                CacheKey.__table__.delete().where(  # pylint: disable=no-member
+                    CacheKey.datasource_uid.in_(uids)
+                )
+            )
+
+        thumbnails = self._invalidate_thumbnails()
+
+        stats_logger_manager.instance.gauge("invalidated_cache", len(cache_keys))
+        logger.info(
+            "Invalidated %s cache records and %s thumbnails for %s datasources",
+            len(cache_keys),
+            thumbnails,
+            len(self._datasource_uids),
+        )
+        return {
+            "datasources": len(self._datasource_uids),
+            "cache_keys": len(cache_keys),
+            "thumbnails": thumbnails,
+        }
+
+    def _invalidate_thumbnails(self) -> int:
+        if not thumbnail_cache:
+            return 0
+
+        table_ids = [
+            int(uid.split("__")[0])
+            for uid in self._datasource_uids
+            if uid.endswith(f"__{DatasourceType.TABLE.value}")
+            and uid.split("__")[0].isdigit()
+        ]
+        charts: list[Slice] = []
+        for ids in batches(table_ids):
+            charts.extend(
+                db.session.query(Slice).filter(
+                    Slice.datasource_type == DatasourceType.TABLE,
+                    Slice.datasource_id.in_(ids),
+                )
+            )
+        dashboards: dict[int, Dashboard] = {}
+        for ids in batches(chart.id for chart in charts):
+            dashboards.update(
+                (dashboard.id, dashboard)
+                for dashboard in db.session.query(Dashboard).filter(
+                    Dashboard.slices.any(Slice.id.in_(ids))
+                )
+            )
+
+        keys = [
+            ChartScreenshot(chart.url, digest).get_cache_key()
+            for chart in charts
+            if (digest := chart.digest)
+        ] + [
+            DashboardScreenshot(dashboard.url, digest).get_cache_key()
+            for dashboard in dashboards.values()
+            if (digest := dashboard.digest)
+        ]
+        for batch in batches(keys):
+            thumbnail_cache.delete_many(*batch)
+        return len(keys)
+
+    def validate(self) -> None:
+        for ids in batches(self._database_ids):
+            self._datasource_uids.update(
+                f"{table_id}__{DatasourceType.TABLE.value}"
+                for table_id in db.session.execute(
+                    sa.select(SqlaTable.id).where(SqlaTable.database_id.in_(ids))
+                ).scalars()
+            )
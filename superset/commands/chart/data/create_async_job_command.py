@@ -17,7 +17,7 @@
 import logging
 from typing import Any, Optional
 
-from flask import Request
+from flask import current_app as app, Request
 
 from superset.extensions import async_query_manager
 
@@ -36,3 +36,20 @@ class CreateAsyncChartDataJobCommand:
         return async_query_manager.submit_chart_data_job(
             self._async_channel_id, form_data, user_id
         )
+
+    def run_batch(
+        self, form_datas: list[dict[str, Any]], user_id: Optional[int]
+    ) -> list[dict[str, Any]]:
+        """
+        Submit jobs for query contexts sharing a datasource, in tasks of at most
+        GLOBAL_ASYNC_QUERIES_BATCH_SIZE query contexts.
+        """
+        batch_size = app.config["GLOBAL_ASYNC_QUERIES_BATCH_SIZE"]
+        jobs_metadata: list[dict[str, Any]] = []
+        for i in range(0, len(form_datas), batch_size):
+            jobs_metadata.extend(
+                async_query_manager.submit_chart_data_jobs(
+                    self._async_channel_id, form_datas[i : i + batch_size], user_id
+                )
+            )
+        return jobs_metadata
@@ -40,10 +40,14 @@ class ChartWarmUpCacheCommand(BaseCommand):
         chart_or_id: Union[int, Slice],
         dashboard_id: Optional[int],
         extra_filters: Optional[str],
+        query_context: Optional[dict[str, Any]] = None,
     ):
         self._chart_or_id = chart_or_id
         self._dashboard_id = dashboard_id
         self._extra_filters = extra_filters
+        # a query context of the chart to warm up instead of the saved one, eg with
+        # the filters applied by users
+        self._query_context = query_context
 
     def run(self) -> dict[str, Any]:
         self.validate()
@@ -52,7 +56,7 @@ class ChartWarmUpCacheCommand(BaseCommand):
         try:
             form_data = get_form_data(chart.id, use_slice_data=True)[0]
 
-            if form_data.get("viz_type") in viz_types:
+            if form_data.get("viz_type") in viz_types and not self._query_context:
                 # Legacy visualizations.
                 if not chart.datasource:
                     raise ChartInvalidError("Chart's datasource does not exist")
@@ -76,10 +80,21 @@ class ChartWarmUpCacheCommand(BaseCommand):
                 status = payload["status"]
             else:
                 # Non-legacy visualizations.
-                query_context = chart.get_query_context()
+                query_context = (
+                    chart.get_query_context_factory().create(**self._query_context)
+                    if self._query_context
+                    else chart.get_query_context()
+                )
 
                 if not query_context:
                     raise ChartInvalidError("Chart's query context does not exist")
+                if (
+                    self._query_context
+                    and query_context.datasource.id != chart.datasource_id
+                ):
+                    raise ChartInvalidError(
+                        "Query context does not use the chart's datasource"
+                    )
 
                 query_context.force = True
                 command = ChartDataCommand(query_context)
@@ -17,7 +17,7 @@
 import logging
 from abc import abstractmethod
 from functools import partial
-from typing import Any, Optional, TypedDict
+from typing import Any, Callable, Iterable, Iterator, Optional, TypedDict
 
 import pandas as pd
 from flask_babel import lazy_gettext as _
@@ -83,28 +83,42 @@ class BaseDataReader:
     @abstractmethod
     def file_metadata(self, file: FileStorage) -> FileMetadata: ...
 
+    def file_to_dataframes(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read the file in chunks, so large files are uploaded with bounded memory.
+        Readers that can't read a file in chunks return it as a single chunk.
+        """
+        yield self.file_to_dataframe(file)
+
     def read(
         self,
         file: FileStorage,
         database: Database,
         table_name: str,
         schema_name: Optional[str],
+        on_progress: Optional[Callable[[int], None]] = None,
     ) -> None:
-        self._dataframe_to_database(
-            self.file_to_dataframe(file), database, table_name, schema_name
+        self._dataframes_to_database(
+            self.file_to_dataframes(file),
+            database,
+            table_name,
+            schema_name,
+            on_progress,
         )
 
-    def _dataframe_to_database(
+    def _dataframes_to_database(
         self,
-        df: pd.DataFrame,
+        chunks: Iterable[pd.DataFrame],
         database: Database,
         table_name: str,
         schema_name: Optional[str],
+        on_progress: Optional[Callable[[int], None]] = None,
     ) -> None:
         """
-        Upload DataFrame to database
+        Upload DataFrame chunks to database
 
-        :param df:
+        :param chunks: The chunks of the DataFrame
+        :param on_progress: Called with the number of rows uploaded after each chunk
         :throws DatabaseUploadFailed: if there is an error uploading the DataFrame
         """
         try:
@@ -118,11 +132,12 @@ class BaseDataReader:
                 "dataframe_index"
             ):
                 to_sql_kwargs["index_label"] = self._options.get("index_label")
-            database.db_engine_spec.df_to_sql(
+            database.db_engine_spec.df_chunks_to_sql(
                 database,
                 data_table,
-                df,
+                chunks,
                 to_sql_kwargs=to_sql_kwargs,
+                on_progress=on_progress,
             )
         except ValueError as ex:
             raise DatabaseUploadFailed(
@@ -145,6 +160,7 @@ class UploadCommand(BaseCommand):
         file: Any,
         schema: Optional[str],
         reader: BaseDataReader,
+        on_progress: Optional[Callable[[int], None]] = None,
     ) -> None:
         self._model_id = model_id
         self._model: Optional[Database] = None
@@ -152,6 +168,7 @@ class UploadCommand(BaseCommand):
         self._schema = schema
         self._file = file
         self._reader = reader
+        self._on_progress = on_progress
 
     @transaction(on_error=partial(on_error, reraise=DatabaseUploadSaveMetadataFailed))
     def run(self) -> None:
@@ -159,7 +176,13 @@ class UploadCommand(BaseCommand):
         if not self._model:
             return
 
-        self._reader.read(self._file, self._model, self._table_name, self._schema)
+        self._reader.read(
+            self._file,
+            self._model,
+            self._table_name,
+            self._schema,
+            self._on_progress,
+        )
 
         sqla_table = (
             db.session.query(SqlaTable)
@@ -16,11 +16,13 @@
 # under the License.
 import logging
 from importlib import util
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
+import numpy as np
 import pandas as pd
 from flask import current_app
 from flask_babel import lazy_gettext as _
+from pandas.io.parsers import TextFileReader
 from werkzeug.datastructures import FileStorage
 
 from superset import is_feature_enabled
@@ -347,10 +349,63 @@ class CSVReader(BaseDataReader):
         return custom_types, pandas_types
 
     @staticmethod
-    def _read_csv(  # noqa: C901
+    def _get_common_dtype(left: Any, right: Any) -> Any:
+        """
+        Return the type holding the values of columns of both types, like `pd.concat`
+        does: the widest one for numbers, and objects otherwise.
+        """
+        if left == right:
+            return left
+        if all(
+            pd.api.types.is_numeric_dtype(dtype)
+            and not pd.api.types.is_bool_dtype(dtype)
+            for dtype in (left, right)
+        ):
+            return np.result_type(left, right)
+        return np.dtype("object")
+
+    @staticmethod
+    def _iter_chunks(
         file: FileStorage,
         kwargs: dict[str, Any],
-    ) -> pd.DataFrame:
+        types: Optional[dict[str, str]],
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read a CSV file in chunks of `chunksize` rows, up to `nrows` rows, casting the
+        column types of each chunk.
+        """
+        total_rows = 0
+        max_rows = kwargs.get("nrows")
+        chunk_iterator = pd.read_csv(filepath_or_buffer=file.stream, **kwargs)
+        try:
+            for chunk in chunk_iterator:
+                # Only take the needed rows from the chunk exceeding the row limit
+                if max_rows is not None and total_rows + len(chunk) > max_rows:
+                    chunk = chunk.iloc[: max_rows - total_rows]
+
+                total_rows += len(chunk)
+                if types:
+                    chunk = CSVReader._cast_column_types(chunk, types, kwargs)
+                yield chunk
+
+                # Break if we've reached the desired number of rows
+                if max_rows is not None and total_rows >= max_rows:
+                    break
+        finally:
+            # unlike dropping it, closing the reader leaves the file open to be read
+            # again
+            if isinstance(chunk_iterator, TextFileReader):
+                chunk_iterator.close()
+
+    @staticmethod
+    def _iter_csv(  # noqa: C901
+        file: FileStorage,
+        kwargs: dict[str, Any],
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read a CSV file, in chunks of `chunksize` rows when set, casting the column
+        types of each chunk.
+        """
         encoding = kwargs.get("encoding", DEFAULT_ENCODING)
 
         # PyArrow engine doesn't support iterator/chunksize/nrows
@@ -376,6 +431,8 @@ class CSVReader(BaseDataReader):
 
         kwargs["low_memory"] = False
 
+        # rows can't be read again once they've been handed over
+        yielded = False
         try:
             types = None
             if "dtype" in kwargs and kwargs["dtype"]:
@@ -389,54 +446,65 @@ class CSVReader(BaseDataReader):
                 types = custom_types if custom_types else None
 
             if "chunksize" in kwargs:
-                chunks = []
-                total_rows = 0
-                max_rows = kwargs.get("nrows")
-                chunk_iterator = pd.read_csv(
-                    filepath_or_buffer=file.stream,
-                    **kwargs,
-                )
-
-                for chunk in chunk_iterator:
-                    # Check if adding this chunk would exceed the row limit
-                    if max_rows is not None and total_rows + len(chunk) > max_rows:
-                        # Only take the needed rows from this chunk
-                        remaining_rows = max_rows - total_rows
-                        chunk = chunk.iloc[:remaining_rows]
-                        chunks.append(chunk)
-                        break
-
-                    chunks.append(chunk)
-                    total_rows += len(chunk)
-
-                    # Break if we've reached the desired number of rows
-                    if max_rows is not None and total_rows >= max_rows:
-                        break
-
-                if chunks:
-                    result = pd.concat(chunks, ignore_index=False)
-                    # When using chunking, we need to reset and rebuild the index
-                    if kwargs.get("index_col") is not None:
-                        # The index was already set by pandas during read_csv
-                        # Just need to ensure it's properly named after concatenation
-                        index_col = kwargs.get("index_col")
-                        if isinstance(index_col, str):
-                            result.index.name = index_col
-                    df = result
+                # pandas infers the types of each chunk on its own, while the first
+                # chunk creates the table, so read the file once to find the types
+                # holding the values of all the chunks, unless it has a single one
+                chunks = CSVReader._iter_chunks(file, kwargs, None)
+                first_chunk = next(chunks, None)
+                if first_chunk is None:
+                    # a file without rows still creates the table, from its header
+                    file.seek(0)
+                    df = pd.read_csv(
+                        filepath_or_buffer=file.stream,
+                        **{**kwargs, "chunksize": None, "iterator": False, "nrows": 0},
+                    )
+                    if types:
+                        df = CSVReader._cast_column_types(df, types, kwargs)
+                    yield df
+                    return
+
+                dtypes: Optional[dict[Any, Any]] = None
+                for chunk in chunks:
+                    if dtypes is None:
+                        dtypes = dict(first_chunk.dtypes)
+                    for column, dtype in chunk.dtypes.items():
+                        dtypes[column] = CSVReader._get_common_dtype(
+                            dtypes.get(column, dtype), dtype
+                        )
+                if dtypes is None:
+                    if types:
+                        first_chunk = CSVReader._cast_column_types(
+                            first_chunk, types, kwargs
+                        )
+                    yield first_chunk
+                    return
+
+                parse_dates = kwargs.get("parse_dates") or []
+                kwargs["dtype"] = {
+                    **{
+                        column: dtype
+                        for column, dtype in dtypes.items()
+                        if column not in (types or {}) and column not in parse_dates
+                    },
+                    **(kwargs.get("dtype") or {}),
+                }
+                file.seek(0)
+                for chunk in CSVReader._iter_chunks(file, kwargs, types):
+                    yield chunk
+                    yielded = True
             else:
                 df = pd.read_csv(
                     filepath_or_buffer=file.stream,
                     **kwargs,
                 )
 
-            if types:
-                df = CSVReader._cast_column_types(df, types, kwargs)
-
-            return df
+                if types:
+                    df = CSVReader._cast_column_types(df, types, kwargs)
+                yield df
         except DatabaseUploadFailed:
             raise
         except UnicodeDecodeError as ex:
-            if encoding != DEFAULT_ENCODING:
+            if encoding != DEFAULT_ENCODING or yielded:
                 raise DatabaseUploadFailed(
                     message=_("Parsing error: %(error)s", error=str(ex))
                 ) from ex
@@ -445,7 +513,8 @@ class CSVReader(BaseDataReader):
             detected_encoding = CSVReader._detect_encoding(file)
             if detected_encoding != encoding:
                 kwargs["encoding"] = detected_encoding
-                return CSVReader._read_csv(file, kwargs)
+                yield from CSVReader._iter_csv(file, kwargs)
+                return
             raise DatabaseUploadFailed(
                 message=_("Parsing error: %(error)s", error=str(ex))
             ) from ex
@@ -460,19 +529,27 @@ class CSVReader(BaseDataReader):
         except Exception as ex:
             raise DatabaseUploadFailed(_("Error reading CSV file")) from ex
 
-    def file_to_dataframe(self, file: FileStorage) -> pd.DataFrame:
-        """
-        Read CSV file into a DataFrame
-
-        :return: pandas DataFrame
-        :throws DatabaseUploadFailed: if there is an error reading the file
-        """
-        rows_to_read = self._options.get("rows_to_read")
-        chunk_size = current_app.config.get("READ_CSV_CHUNK_SIZE", 1000)
-
-        use_chunking = rows_to_read is None or rows_to_read > chunk_size * 2
+    @staticmethod
+    def _read_csv(
+        file: FileStorage,
+        kwargs: dict[str, Any],
+    ) -> pd.DataFrame:
+        chunks = list(CSVReader._iter_csv(file, kwargs))
+        if not chunks:
+            raise DatabaseUploadFailed(_("Error reading CSV file"))
+        if len(chunks) == 1:
+            return chunks[0]
+
+        df = pd.concat(chunks, ignore_index=False)
+        # When using chunking, we need to reset and rebuild the index
+        if isinstance(index_col := kwargs.get("index_col"), str):
+            # The index was already set by pandas during read_csv
+            # Just need to ensure it's properly named after concatenation
+            df.index.name = index_col
+        return df
 
-        kwargs = {
+    def _get_read_csv_kwargs(self) -> dict[str, Any]:
+        return {
             "encoding": self._options.get("encoding", DEFAULT_ENCODING),
             "header": self._options.get("header_row", 0),
             "decimal": self._options.get("decimal_character", "."),
@@ -489,7 +566,7 @@ class CSVReader(BaseDataReader):
                 if self._options.get("null_values")  # None if an empty list
                 else None
             ),
-            "nrows": rows_to_read,
+            "nrows": self._options.get("rows_to_read"),
             "parse_dates": self._options.get("column_dates"),
             "sep": self._options.get("delimiter", ","),
             "skip_blank_lines": self._options.get("skip_blank_lines", False),
@@ -503,12 +580,37 @@ class CSVReader(BaseDataReader):
             "cache_dates": True,
         }
 
+    def file_to_dataframe(self, file: FileStorage) -> pd.DataFrame:
+        """
+        Read CSV file into a DataFrame
+
+        :return: pandas DataFrame
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        rows_to_read = self._options.get("rows_to_read")
+        chunk_size = current_app.config.get("READ_CSV_CHUNK_SIZE", 1000)
+
+        use_chunking = rows_to_read is None or rows_to_read > chunk_size * 2
+
+        kwargs = self._get_read_csv_kwargs()
         if use_chunking:
             kwargs["chunksize"] = chunk_size
             kwargs["iterator"] = True
 
         return self._read_csv(file, kwargs)
 
+    def file_to_dataframes(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read CSV file in chunks of READ_CSV_CHUNK_SIZE rows
+
+        :return: Iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        kwargs = self._get_read_csv_kwargs()
+        kwargs["chunksize"] = current_app.config.get("READ_CSV_CHUNK_SIZE", 1000)
+        kwargs["iterator"] = True
+        return self._iter_csv(file, kwargs)
+
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         """
         Get metadata from a CSV file
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Optional, Union
 from uuid import UUID
@@ -22,8 +23,10 @@ from uuid import UUID
 import pandas as pd
 from celery.exceptions import SoftTimeLimitExceeded
 from flask import current_app as app
+from flask_appbuilder.security.sqla.models import User
+from flask_caching.backends import NullCache
 
-from superset import db, security_manager
+from superset import db, security_manager, thumbnail_cache
 from superset.commands.base import BaseCommand
 from superset.commands.dashboard.permalink.create import CreateDashboardPermalinkCommand
 from superset.commands.exceptions import CommandException, UpdateFailedError
@@ -72,12 +75,20 @@ from superset.reports.notifications.exceptions import (
     SlackV1NotificationError,
 )
 from superset.tasks.utils import get_executor
+from superset.thumbnails.digest import get_chart_data_digest, get_dashboard_data_digest
 from superset.utils import json
+from superset.utils.chart_renderer import can_render_chart, render_chart
 from superset.utils.core import HeaderDataType, override_user, recipients_string_to_list
 from superset.utils.csv import get_chart_csv_data, get_chart_dataframe
 from superset.utils.decorators import logs_context, transaction
+from superset.utils.hashing import md5_sha_from_dict
 from superset.utils.pdf import build_pdf_from_screenshots
-from superset.utils.screenshots import ChartScreenshot, DashboardScreenshot
+from superset.utils.screenshots import (
+    ChartScreenshot,
+    DashboardScreenshot,
+    ScreenshotCachePayload,
+    StatusValues,
+)
 from superset.utils.slack import get_channels_with_search, SlackChannelTypes
 from superset.utils.urls import get_url_path
 
@@ -99,6 +110,8 @@ class BaseReportState:
         self._scheduled_dttm = scheduled_dttm
         self._start_dttm = datetime.utcnow()
         self._execution_id = execution_id
+        # error of the screenshots that failed while the others were sent
+        self._screenshots_error: Optional[ReportScheduleScreenshotFailedError] = None
 
     def update_report_schedule_and_log(
         self,
@@ -352,6 +365,20 @@ class BaseReportState:
             height = self._report_schedule.custom_height or window_height
             window_size = (width, height)
 
+            if can_render_chart(self._report_schedule.chart):
+                try:
+                    return [
+                        render_chart(self._report_schedule.chart, user, window_size)
+                    ]
+                except SoftTimeLimitExceeded:
+                    raise
+                except Exception:  # pylint: disable=broad-except
+                    logger.warning(
+                        "Failed rendering chart %s on the server, taking a screenshot",
+                        self._report_schedule.chart.id,
+                        exc_info=True,
+                    )
+
             screenshots: list[Union[ChartScreenshot, DashboardScreenshot]] = [
                 ChartScreenshot(
                     url,
@@ -377,21 +404,181 @@ class BaseReportState:
                 for url in urls
             ]
         try:
-            imges = []
-            for screenshot in screenshots:
-                if imge := screenshot.get_screenshot(user=user):
-                    imges.append(imge)
+            results = self._take_screenshots(screenshots, username)
         except SoftTimeLimitExceeded as ex:
             logger.warning("A timeout occurred while taking a screenshot.")
             raise ReportScheduleScreenshotTimeout() from ex
-        except Exception as ex:
-            raise ReportScheduleScreenshotFailedError(
-                f"Failed taking a screenshot {str(ex)}"
-            ) from ex
+
+        imges = [result for result in results if isinstance(result, bytes)]
+        errors = [result for result in results if isinstance(result, Exception)]
         if not imges:
+            if errors:
+                raise ReportScheduleScreenshotFailedError(
+                    f"Failed taking a screenshot {str(errors[0])}"
+                ) from errors[0]
             raise ReportScheduleScreenshotFailedError()
+        if errors:
+            logger.warning(
+                "Failed taking %i out of %i screenshots, sending the others",
+                len(errors),
+                len(results),
+            )
+            self._screenshots_error = ReportScheduleScreenshotFailedError(
+                f"Failed taking {len(errors)} out of {len(results)} screenshots "
+                f"{str(errors[0])}"
+            )
         return imges
 
+    def _get_screenshot_concurrency(self, count: int) -> int:
+        """
+        Number of screenshots of the report to take concurrently, which can be set
+        per report with the `screenshot_concurrency` key of its extra.
+        """
+        concurrency = app.config["ALERT_REPORTS_SCREENSHOT_CONCURRENCY"]
+        if "screenshot_concurrency" in self._report_schedule.extra:
+            try:
+                concurrency = int(self._report_schedule.extra["screenshot_concurrency"])
+            except (TypeError, ValueError):
+                logger.warning(
+                    "Invalid screenshot concurrency %s for report %s, using %i",
+                    self._report_schedule.extra["screenshot_concurrency"],
+                    self._report_schedule.id,
+                    concurrency,
+                )
+        return max(
+            1,
+            min(
+                count,
+                concurrency,
+                app.config["ALERT_REPORTS_MAX_SCREENSHOT_CONCURRENCY"],
+            ),
+        )
+
+    def _get_data_digest(self, user: User) -> Optional[str]:
+        """
+        Digest of the data displayed by the report chart or dashboard, see
+        `get_chart_data_digest`.
+        """
+        with override_user(user):
+            if self._report_schedule.chart:
+                return get_chart_data_digest(self._report_schedule.chart)
+            return get_dashboard_data_digest(self._report_schedule.dashboard)
+
+    def _take_screenshots(
+        self,
+        screenshots: list[Union[ChartScreenshot, DashboardScreenshot]],
+        username: str,
+    ) -> list[Union[bytes, Exception, None]]:
+        """
+        Take the screenshots as the given user, possibly concurrently, keeping
+        their order. Each thread has its own session, so it loads its own
+        instance of the user.
+
+        A failing screenshot doesn't prevent the others from being taken: the
+        exception is returned in its place.
+        :raises: SoftTimeLimitExceeded
+        """
+        flask_app = app._get_current_object()  # pylint: disable=protected-access
+        reuse_unchanged = (
+            app.config["THUMBNAIL_SKIP_UNCHANGED_DATA"]
+            and not self._report_schedule.force_screenshot
+            and not isinstance(thumbnail_cache.cache, NullCache)
+        )
+        data_digest = (
+            self._get_data_digest(security_manager.find_user(username))
+            if reuse_unchanged
+            else None
+        )
+        # cache keys of the images that were rendered, to be cached with the digest
+        # of the data they display
+        rendered: dict[int, str] = {}
+
+        def take_screenshot(
+            index: int,
+            screenshot: Union[ChartScreenshot, DashboardScreenshot],
+        ) -> Union[bytes, Exception, None]:
+            try:
+                with flask_app.app_context():
+                    user = security_manager.find_user(username)
+                    if not reuse_unchanged:
+                        return screenshot.get_screenshot(user=user)
+
+                    cache_key = self._get_screenshot_cache_key(index, screenshot)
+                    payload = screenshot.get_from_cache_key(cache_key)
+                    if (
+                        data_digest
+                        and payload
+                        and payload.status == StatusValues.UPDATED
+                        and payload.data_digest == data_digest
+                    ):
+                        logger.info(
+                            "Skipping screenshot - data unchanged for %s",
+                            screenshot.url,
+                        )
+                        return payload.get_image().getvalue()
+
+                    image = screenshot.get_screenshot(user=user)
+                    rendered[index] = cache_key
+                    return image
+            except SoftTimeLimitExceeded:
+                raise
+            except Exception as ex:  # pylint: disable=broad-except
+                logger.warning(
+                    "Failed taking a screenshot of %s", screenshot.url, exc_info=True
+                )
+                return ex
+
+        concurrency = self._get_screenshot_concurrency(len(screenshots))
+        if concurrency == 1:
+            results = [
+                take_screenshot(index, screenshot)
+                for index, screenshot in enumerate(screenshots)
+            ]
+        else:
+            executor = ThreadPoolExecutor(max_workers=concurrency)
+            try:
+                results = list(
+                    executor.map(take_screenshot, range(len(screenshots)), screenshots)
+                )
+            finally:
+                # don't wait for pending screenshots when the soft time limit is hit
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        if reuse_unchanged and rendered:
+            # rendering the pages populated the results cache, so the digest now
+            # matches the data in the images
+            rendered_digest = self._get_data_digest(
+                security_manager.find_user(username)
+            )
+            for index, cache_key in rendered.items():
+                if isinstance(image := results[index], bytes):
+                    thumbnail_cache.set(
+                        cache_key,
+                        ScreenshotCachePayload(
+                            image, data_digest=rendered_digest
+                        ).to_dict(),
+                    )
+        return results
+
+    def _get_screenshot_cache_key(
+        self,
+        index: int,
+        screenshot: Union[ChartScreenshot, DashboardScreenshot],
+    ) -> str:
+        """
+        Cache key of the last image of a report screenshot, which is sent again as
+        long as the data it displays is unchanged.
+        """
+        return md5_sha_from_dict(
+            {
+                "report_schedule": self._report_schedule.id,
+                "index": index,
+                "url": screenshot.url,
+                "digest": screenshot.digest,
+                "window_size": screenshot.window_size,
+            }
+        )
+
     def _get_pdf(self) -> bytes:
         """
         Get chart or dashboard pdf
@@ -650,6 +837,9 @@ class BaseReportState:
         """
         notification_content = self._get_notification_content()
         self._send(notification_content, self._report_schedule.recipients)
+        if self._screenshots_error:
+            # the images that could be taken were sent, still fail the execution
+            raise self._screenshots_error
 
     def send_error(self, name: str, message: str) -> None:
         """
@@ -17,14 +17,18 @@
 from __future__ import annotations
 
 import copy
+import logging
 from typing import Any, Callable, TYPE_CHECKING
 
+from flask import current_app
 from flask_babel import _
 
 from superset.common.chart_data import ChartDataResultType
 from superset.common.db_query_status import QueryStatus
 from superset.connectors.sqla.models import BaseDatasource
 from superset.exceptions import QueryObjectValidationError
+from superset.extensions import cache_manager
+from superset.utils.cache import generate_cache_key, set_and_log_cache
 from superset.utils.core import (
     extract_column_dtype,
     extract_dataframe_dtypes,
@@ -34,9 +38,13 @@ from superset.utils.core import (
 )
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from superset.common.query_context import QueryContext
     from superset.common.query_object import QueryObject
 
+logger = logging.getLogger(__name__)
+
 
 def _get_datasource(
     query_context: QueryContext, query_obj: QueryObject
@@ -90,6 +98,71 @@ def _get_query(
     return result
 
 
+def _format_data(
+    query_context: QueryContext, datasource: BaseDatasource, df: pd.DataFrame
+) -> dict[str, Any]:
+    coltypes = extract_dataframe_dtypes(df, datasource)
+    return {
+        "colnames": list(df.columns),
+        "indexnames": list(df.index),
+        "coltypes": coltypes,
+        "data": query_context.get_data(df, coltypes),
+    }
+
+
+def _get_formatted_data(
+    query_context: QueryContext,
+    datasource: BaseDatasource,
+    payload: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Serialize the DataFrame of a df payload in the requested result format.
+
+    When `CACHE_FORMATTED_CHART_DATA` is enabled and the DataFrame was served from the
+    cache, the formatted data is cached as well. The key includes the timestamp of the
+    cached DataFrame, so a refreshed DataFrame is never paired with stale output.
+    """
+    df = payload["df"]
+    if not (
+        current_app.config["CACHE_FORMATTED_CHART_DATA"]
+        and payload["is_cached"]
+        and payload["cache_key"]
+        and payload["cached_dttm"]
+    ):
+        return _format_data(query_context, datasource, df)
+
+    cache_key = generate_cache_key(
+        {
+            "cache_key": payload["cache_key"],
+            "cached_dttm": payload["cached_dttm"],
+            "result_format": query_context.result_format,
+        },
+        "formatted_",
+    )
+    stats_logger = current_app.config["STATS_LOGGER"]
+    try:
+        cache_value = cache_manager.data_cache.get(cache_key)
+    except Exception as ex:  # pylint: disable=broad-except
+        # the cache backend being unavailable shouldn't prevent serving the data
+        logger.warning("Could not read cache key %s", cache_key)
+        logger.exception(ex)
+        cache_value = None
+
+    if cache_value is not None:
+        stats_logger.incr("loaded_from_formatted_cache")
+        return cache_value["formatted_data"]
+
+    formatted_data = _format_data(query_context, datasource, df)
+    set_and_log_cache(
+        cache_manager.data_cache,
+        cache_key,
+        {"formatted_data": formatted_data},
+        payload["cache_timeout"],
+        datasource.uid,
+    )
+    return formatted_data
+
+
 def _get_full(
     query_context: QueryContext,
     query_obj: QueryObject,
@@ -98,13 +171,9 @@ def _get_full(
     datasource = _get_datasource(query_context, query_obj)
     result_type = query_obj.result_type or query_context.result_type
     payload = query_context.get_df_payload(query_obj, force_cached=force_cached)
-    df = payload["df"]
     status = payload["status"]
     if status != QueryStatus.FAILED:
-        payload["colnames"] = list(df.columns)
-        payload["indexnames"] = list(df.index)
-        payload["coltypes"] = extract_dataframe_dtypes(df, datasource)
-        payload["data"] = query_context.get_data(df, payload["coltypes"])
+        payload.update(_get_formatted_data(query_context, datasource, payload))
         payload["result_format"] = query_context.result_format
     del payload["df"]
 
@@ -22,7 +22,7 @@ from datetime import datetime
 from pprint import pformat
 from typing import Any, NamedTuple, TYPE_CHECKING
 
-from flask import g
+from flask import current_app, g
 from flask_babel import gettext as _
 from jinja2.exceptions import TemplateError
 from pandas import DataFrame
@@ -30,14 +30,13 @@ from pandas import DataFrame
 from superset import feature_flag_manager
 from superset.common.chart_data import ChartDataResultType
 from superset.exceptions import (
-    InvalidPostProcessingError,
     QueryClauseValidationException,
     QueryObjectValidationError,
 )
 from superset.extensions import event_logger
 from superset.sql.parse import sanitize_clause
 from superset.superset_typing import Column, Metric, OrderBy
-from superset.utils import json, pandas_postprocessing
+from superset.utils import json
 from superset.utils.core import (
     DTTM_ALIAS,
     find_duplicates,
@@ -48,6 +47,7 @@ from superset.utils.core import (
 )
 from superset.utils.hashing import md5_sha_from_dict
 from superset.utils.json import json_int_dttm_ser
+from superset.utils.pandas_postprocessing.pipeline import PostProcessingPipeline
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import BaseDatasource
@@ -492,20 +492,19 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
                  is incorrect
         """
         logger.debug("post_processing: \n %s", pformat(self.post_processing))
+        pipeline = PostProcessingPipeline(self.post_processing)
         with event_logger.log_context(f"{self.__class__.__name__}.post_processing"):
-            for post_process in self.post_processing:
-                operation = post_process.get("operation")
-                if not operation:
-                    raise InvalidPostProcessingError(
-                        _("`operation` property of post processing object undefined")
-                    )
-                if not hasattr(pandas_postprocessing, operation):
-                    raise InvalidPostProcessingError(
-                        _(
-                            "Unsupported post processing operation: %(operation)s",
-                            type=operation,
-                        )
-                    )
-                options = post_process.get("options", {})
-                df = getattr(pandas_postprocessing, operation)(df, **options)
-            return df
+            df = pipeline.execute(df)
+
+        stats_logger = current_app.config["STATS_LOGGER"]
+        for step in pipeline.stats:
+            stats_logger.timing(f"post_processing.{step.operation}", step.duration_ms)
+            logger.debug(
+                "post_processing %s (%s step(s)): %.2f ms, %s rows, %s bytes",
+                step.operation,
+                step.fused,
+                step.duration_ms,
+                step.rows,
+                step.memory_bytes,
+            )
+        return df
@@ -82,6 +82,8 @@ STATS_LOGGER = DummyStatsLogger()
 
 # By default will log events to the metadata database with `DBEventLogger`
 # Note that you can use `StdOutEventLogger` for debugging
+# Note that `BufferedDBEventLogger()` saves the events to the metadata database in
+# batches from a background thread, instead of committing them in every request
 # Note that you can write your own event logger by extending `AbstractEventLogger`
 # https://github.com/apache/superset/blob/master/superset/utils/log.py
 EVENT_LOGGER = DBEventLogger()
@@ -832,6 +834,18 @@ EXTRA_SEQUENTIAL_COLOR_SCHEMES: list[dict[str, Any]] = []
 # CACHE_WARMUP_EXECUTORS = [ExecutorType.OWNER, FixedExecutor("admin")]
 CACHE_WARMUP_EXECUTORS = [ExecutorType.OWNER]
 
+# Warm up the cache in the Celery worker running the `cache-warmup` task, running the
+# charts directly instead of scheduling a `fetch_url` task that sends a request to the
+# web servers per chart. Charts sharing the same cache keys, eg on several dashboards,
+# are only warmed up once, and at most `max_concurrent_per_database` charts of each
+# database (capped by DATABASE_ADMISSION_CONTROL) are run at the same time by the
+# `max_workers` threads. The task returns the status and duration of each chart.
+CACHE_WARMUP_IN_PROCESS: dict[str, Any] = {
+    "enabled": False,
+    "max_workers": 4,
+    "max_concurrent_per_database": 2,
+}
+
 # ---------------------------------------------------
 # Thumbnail config (behind feature flag)
 # ---------------------------------------------------
@@ -871,6 +885,12 @@ THUMBNAIL_CACHE_CONFIG: CacheConfig = {
 }
 THUMBNAIL_ERROR_CACHE_TTL = int(timedelta(days=1).total_seconds())
 
+# Skip rendering forced thumbnails and report screenshots again when the data they
+# display hasn't changed. The data is compared using a digest of the cached query
+# results of the charts, so the previous image is only reused when all of them are
+# still in the data cache.
+THUMBNAIL_SKIP_UNCHANGED_DATA = False
+
 # Time before selenium times out after trying to locate an element on the page and wait
 # for that element to load for a screenshot.
 SCREENSHOT_LOCATE_WAIT = int(timedelta(seconds=10).total_seconds())
@@ -883,6 +903,13 @@ SCREENSHOT_SELENIUM_RETRIES = 5
 SCREENSHOT_SELENIUM_HEADSTART = 3
 # Wait for the chart animation, in seconds
 SCREENSHOT_SELENIUM_ANIMATION_WAIT = 5
+# Wait for every chart on the page to report a final status (rendered, failed or
+# stopped) through its `data-chart-status` attribute, instead of sleeping for
+# SCREENSHOT_SELENIUM_HEADSTART and SCREENSHOT_SELENIUM_ANIMATION_WAIT. Charts are
+# given SCREENSHOT_RENDERED_CHARTS_ANIMATION_WAIT seconds to finish their animations
+# once they have all rendered.
+SCREENSHOT_WAIT_FOR_RENDERED_CHARTS = False
+SCREENSHOT_RENDERED_CHARTS_ANIMATION_WAIT = 1
 # Replace unexpected errors in screenshots with real error messages
 SCREENSHOT_REPLACE_UNEXPECTED_ERRORS = False
 # Max time to wait for error message modal to show up, in seconds
@@ -954,9 +981,47 @@ EXPLORE_FORM_DATA_CACHE_CONFIG: CacheConfig = {
     "CODEC": JsonKeyValueCodec(),
 }
 
-# store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
+# store cache keys by datasource UID (via CacheKey) for custom processing/invalidation,
+# eg by ETL pipelines through `POST /api/v1/cachekey/invalidate` or the
+# `superset invalidate-cache` command after reloading tables
 STORE_CACHE_KEYS_IN_METADATA_DB = False
 
+# Timeout, in seconds, for the row level security filters resolved per dataset and set
+# of roles. Entries are kept in process and in the `CACHE_CONFIG` backend, and are
+# invalidated whenever an RLS filter, or its roles or tables, change. The cache is only
+# used when `CACHE_CONFIG` is not a `NullCache`; set to -1 to disable it.
+RLS_FILTERS_CACHE_TIMEOUT = int(timedelta(minutes=10).total_seconds())
+
+# Timeout, in seconds, for the permission snapshots computed per set of roles and used
+# by `can_access` and `raise_for_access`. Entries are kept in process and in the
+# `CACHE_CONFIG` backend, and are invalidated whenever a role, permission or view menu
+# changes. The cache is only used when `CACHE_CONFIG` is not a `NullCache`; set to -1
+# to disable it.
+PERMISSIONS_CACHE_TIMEOUT = int(timedelta(minutes=10).total_seconds())
+
+# Timeout, in seconds, for the tables referenced by SQL queries, per database and SQL,
+# used by `raise_for_access`. Queries using Jinja are not cached, and the default schema
+# the tables are qualified with is read on every check.
+# Entries are kept in process and in the `CACHE_CONFIG` backend, and only used when
+# `CACHE_CONFIG` is not a `NullCache`; set to -1 to disable it.
+QUERY_TABLES_CACHE_TIMEOUT = int(timedelta(hours=1).total_seconds())
+
+# Cache the formatted chart data (column metadata and the JSON records, CSV or XLSX
+# output) in `DATA_CACHE_CONFIG`, next to the cached DataFrame it was built from, so
+# that cache hits don't need to serialize the same DataFrame again. This roughly
+# doubles the space used by cached chart data.
+CACHE_FORMATTED_CHART_DATA = False
+
+# Timeout, in seconds, for the forecasts computed by the `prophet` post processing
+# operation. Forecasts are stored in `DATA_CACHE_CONFIG` per series and set of model
+# parameters, so a series is only fitted again when its data changes. Set to -1 to
+# disable caching forecasts.
+PROPHET_FORECAST_CACHE_TIMEOUT = int(timedelta(days=1).total_seconds())
+
+# Maximum number of series fitted concurrently by the `prophet` post processing
+# operation. Each fit runs in its own Stan subprocess.
+PROPHET_FORECAST_MAX_WORKERS = 4
+
 # CORS Options
 # NOTE: enabling this requires installing the cors-related python dependencies
 # `pip install .[cors]` or `pip install apache_superset[cors]`, depending
@@ -1135,6 +1200,17 @@ SQLLAB_SCHEDULE_WARNING_MESSAGE = None
 # Max payload size (MB) for SQL Lab to prevent browser hangs with large results.
 SQLLAB_PAYLOAD_MAX_MB = None
 
+# Cap the memory used by the results of SQL Lab queries: rows are fetched from the
+# cursor in chunks of `chunk_size` rows, and queries fail as soon as their fetched rows
+# grow beyond `max_memory_mb` instead of once they're all in memory. Results are still
+# returned all at once when the query is done. Engines that post-process their whole
+# result (see `supports_chunked_fetch`) fetch all their rows at once.
+SQLLAB_RESULTS_MEMORY_CAP: dict[str, Any] = {
+    "enabled": False,
+    "chunk_size": 10000,
+    "max_memory_mb": 1024,
+}
+
 # Force refresh while auto-refresh in dashboard
 DASHBOARD_AUTO_REFRESH_MODE: Literal["fetch", "force"] = "force"
 # Dashboard auto refresh intervals
@@ -1168,6 +1244,7 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         "superset.tasks.thumbnails",
         "superset.tasks.cache",
         "superset.tasks.slack",
+        "superset.tasks.uploads",
     )
     result_backend = "db+sqlite:///celery_results.sqlite"
     worker_prefetch_multiplier = 1
@@ -1209,6 +1286,34 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
 
 CELERY_CONFIG: type[CeleryConfig] | None = CeleryConfig
 
+# Scheduling of Celery tasks by class: "interactive" chart loads, "sqllab" queries and
+# "batch" work such as reports, thumbnails and cache warmups. When enabled:
+# - each class is routed to its own queue, `queue_prefix` followed by the class name.
+#   Run workers dedicated to the interactive queue so that dashboards always have
+#   capacity, e.g. `celery worker -Q superset.interactive` next to
+#   `celery worker -Q superset.sqllab,superset.batch`. Message `priorities` can also be
+#   set per class, their meaning depends on the broker.
+# - `user_concurrency` caps the number of tasks of a class running at the same time
+#   for a single user, tasks over the cap are retried after `retry_delay` seconds, at
+#   most `max_retries` times. Running tasks hold leases in the Redis cache configured by
+#   `cache_backend`, which takes the same keys as GLOBAL_ASYNC_QUERIES_CACHE_BACKEND and
+#   defaults to it. Leases are renewed while the task runs and released after
+#   `lease_timeout` seconds when its worker dies. Caps are disabled with a warning
+#   without a Redis cache.
+# - the queue depth and wait time of each class are sent to the STATS_LOGGER. Depths
+#   are kept in the cache configured in CACHE_CONFIG, so it needs to be shared between
+#   workers (Redis or Memcached). They are disabled with a warning otherwise.
+CELERY_TASK_SCHEDULING: dict[str, Any] = {
+    "enabled": False,
+    "queue_prefix": "superset.",
+    "priorities": {},
+    "user_concurrency": {"sqllab": 0, "batch": 0},
+    "retry_delay": 5,
+    "max_retries": 720,
+    "lease_timeout": int(timedelta(minutes=1).total_seconds()),
+    "cache_backend": None,
+}
+
 # Set celery config to None to disable all the above configuration
 # CELERY_CONFIG = None
 
@@ -1367,6 +1472,20 @@ REPORTS_CSV_NA_NAMES: list[str] | None = None
 # Smaller values use less memory but may be slower for large files
 READ_CSV_CHUNK_SIZE = 1000
 
+# Upload CSV files in a Celery task instead of the request thread. The file is saved to
+# UPLOAD_FOLDER, which must be shared with the Celery workers, and appended to the table
+# chunk by chunk, so the memory used doesn't grow with the size of the file. The upload
+# API then returns a job id, whose status and number of rows uploaded are kept for
+# `status_timeout` seconds and returned by `GET /api/v1/database/upload/<id>/`.
+# The status is kept in the Redis cache configured by `cache_backend`, which takes the
+# same keys as GLOBAL_ASYNC_QUERIES_CACHE_BACKEND and defaults to it, since it must be
+# shared by the web servers and the workers. Uploads are rejected without one.
+CSV_UPLOAD_ASYNC: dict[str, Any] = {
+    "enabled": False,
+    "status_timeout": int(timedelta(days=1).total_seconds()),
+    "cache_backend": None,
+}
+
 # A dictionary of items that gets merged into the Jinja context for
 # SQL Lab. The existing context gets updated with this dictionary,
 # meaning values for existing keys get overwritten by the content of this
@@ -1385,6 +1504,18 @@ JINJA_CONTEXT_ADDONS: dict[str, Callable[..., Any]] = {}
 # basis. Example value = `{"presto": CustomPrestoTemplateProcessor}`
 CUSTOM_TEMPLATE_PROCESSORS: dict[str, type[BaseTemplateProcessor]] = {}
 
+# The number of compiled Jinja templates kept by each process. Templates are compiled
+# once per engine and reused by every render of the same SQL, eg the virtual datasets
+# of a dashboard and the computation of their cache keys.
+JINJA_TEMPLATE_CACHE_SIZE = 1000
+
+# The number of results of the `dataset` Jinja macro kept by each process, by dataset,
+# database and their last change, and for how many seconds. Results of datasets using
+# Jinja themselves, or of DHIS2 databases, are not kept, since they can depend on the
+# request.
+JINJA_MACRO_CACHE_SIZE = 1000
+JINJA_MACRO_CACHE_TIMEOUT = int(timedelta(minutes=10).total_seconds())
+
 # Roles that are controlled by the API / Superset and should not be changed
 # by humans.
 ROBOT_PERMISSION_ROLES = ["Public", "Gamma", "Alpha", "Admin", "sql_lab"]
@@ -1727,6 +1858,16 @@ ALERT_REPORTS_QUERY_EXECUTION_MAX_TRIES = 1
 # Custom width for screenshots
 ALERT_REPORTS_MIN_CUSTOM_SCREENSHOT_WIDTH = 600
 ALERT_REPORTS_MAX_CUSTOM_SCREENSHOT_WIDTH = 2400
+# Number of screenshots taken concurrently for a report that captures several tabs of
+# a dashboard. It can be overridden per report with the `screenshot_concurrency` key
+# of the report extra, up to ALERT_REPORTS_MAX_SCREENSHOT_CONCURRENCY.
+ALERT_REPORTS_SCREENSHOT_CONCURRENCY = 1
+ALERT_REPORTS_MAX_SCREENSHOT_CONCURRENCY = 4
+# Viz types of chart reports that are rendered on the server with matplotlib instead
+# of being captured in a browser. Supported viz types are "table", "big_number_total",
+# "big_number", "echarts_timeseries_line" and "echarts_timeseries_bar". Requires the
+# `matplotlib` extra, reports fall back to a screenshot when rendering fails.
+ALERT_REPORTS_SERVER_SIDE_RENDERING_VIZ_TYPES: list[str] = []
 # Set a minimum interval threshold between executions (for each Alert/Report)
 # Value should be an integer i.e. int(timedelta(minutes=5).total_seconds())
 # You can also assign a function to the config that returns the expected integer
@@ -1775,6 +1916,22 @@ WEBDRIVER_CONFIGURATION = {
 # Note: If using Chrome, you'll want to add the "--marionette" arg.
 WEBDRIVER_OPTION_ARGS = ["--headless"]
 
+# Pool of warm Selenium webdrivers kept by each web server or Celery worker process,
+# so that screenshots don't pay the browser startup time. Idle drivers are reused,
+# preferably by the user they were last authenticated as.
+WEBDRIVER_POOL = {
+    # maximum number of idle drivers kept per process, 0 disables the pool
+    "max_size": 0,
+    # number of drivers started when a Celery worker process starts
+    "warm_size": 0,
+    # number of pages a driver renders before it's recycled
+    "max_usage": 50,
+    # idle drivers older than this are recycled
+    "max_idle_seconds": int(timedelta(minutes=5).total_seconds()),
+    # drivers whose last page used more JS heap than this are recycled (Chrome only)
+    "max_js_heap_bytes": 512 * 1024 * 1024,
+}
+
 # The base URL to query for accessing the user interface
 WEBDRIVER_BASEURL = "http://0.0.0.0:8080/"
 # The base URL for the email report hyperlinks.
@@ -2003,6 +2160,25 @@ SSL_CERT_PATH: str | None = None
 SQLA_TABLE_MUTATOR = lambda table: table  # noqa: E731
 
 
+# Admission control of the queries sent to each database. When enabled, at most
+# `max_in_flight` connections run queries on a database at the same time, across all
+# web servers and workers; a database can override it with `max_concurrent_queries` in
+# its extra, 0 disabling the cap. Queries wait up to `queue_timeout` seconds for a slot
+# before failing. Slots are kept in Redis, configured like
+# GLOBAL_ASYNC_QUERIES_CACHE_BACKEND which is used when `cache_backend` is None. They
+# are leases renewed every third of `lease_timeout` seconds while held, so they expire
+# shortly after a process dies while holding one. Wait times and rejections are sent
+# to the STATS_LOGGER.
+DATABASE_ADMISSION_CONTROL: dict[str, Any] = {
+    "enabled": False,
+    "max_in_flight": 10,
+    "queue_timeout": 30,
+    "poll_interval": 0.1,
+    "lease_timeout": int(timedelta(minutes=1).total_seconds()),
+    "key_prefix": "superset_database_slots_",
+    "cache_backend": None,
+}
+
 # Global async query config options.
 # Requires GLOBAL_ASYNC_QUERIES feature flag to be enabled.
 GLOBAL_ASYNC_QUERY_MANAGER_CLASS = (
@@ -2019,11 +2195,23 @@ GLOBAL_ASYNC_QUERIES_JWT_COOKIE_SAMESITE: None | (Literal["None", "Lax", "Strict
 )
 GLOBAL_ASYNC_QUERIES_JWT_COOKIE_DOMAIN = None
 GLOBAL_ASYNC_QUERIES_JWT_SECRET = "test-secret-change-me"  # noqa: S105
-GLOBAL_ASYNC_QUERIES_TRANSPORT: Literal["polling", "ws"] = "polling"
+GLOBAL_ASYNC_QUERIES_TRANSPORT: Literal["polling", "long-polling", "ws"] = "polling"
 GLOBAL_ASYNC_QUERIES_POLLING_DELAY = int(
     timedelta(milliseconds=500).total_seconds() * 1000
 )
+# With the "long-polling" transport the async events endpoint holds each request with
+# XREAD BLOCK until events arrive or this timeout (in milliseconds) expires, and the
+# frontend polls again straight away. Every waiting request holds a web server worker,
+# so this is best run with an async worker class (e.g. gunicorn's gevent workers), and
+# the timeout must stay below the web server and proxy request timeouts.
+GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT = int(
+    timedelta(seconds=25).total_seconds() * 1000
+)
 GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL = "ws://127.0.0.1:8080/"
+# Maximum number of chart queries run one after the other by a single Celery task when
+# the charts of a dashboard are submitted together to /api/v1/chart/data/batch. The
+# soft time limit of the task is SQLLAB_ASYNC_TIME_LIMIT_SEC times its number of charts.
+GLOBAL_ASYNC_QUERIES_BATCH_SIZE = 10
 
 # Global async queries cache backend configuration options:
 # - Set 'CACHE_TYPE' to 'RedisCache' for RedisCacheBackend.
@@ -89,6 +89,7 @@ from superset.exceptions import (
 )
 from superset.jinja_context import (
     BaseTemplateProcessor,
+    clear_macro_results,
     ExtraCache,
     get_template_processor,
 )
@@ -2030,6 +2031,27 @@ sa.event.listen(SqlaTable, "before_update", SqlaTable.before_update)
 sa.event.listen(SqlaTable, "after_insert", SqlaTable.after_insert)
 sa.event.listen(SqlaTable, "after_delete", SqlaTable.after_delete)
 
+
+def dataset_after_change(
+    mapper: Mapper,
+    connection: Connection,
+    target: SqlaTable | TableColumn | SqlMetric,
+) -> None:
+    """
+    Drop the SQL generated by the Jinja macro for the dataset that changed
+    """
+    clear_macro_results(target.id if isinstance(target, SqlaTable) else target.table_id)
+
+
+sa.event.listen(SqlaTable, "after_update", dataset_after_change)
+sa.event.listen(SqlaTable, "after_delete", dataset_after_change)
+sa.event.listen(TableColumn, "after_insert", dataset_after_change)
+sa.event.listen(TableColumn, "after_update", dataset_after_change)
+sa.event.listen(TableColumn, "after_delete", dataset_after_change)
+sa.event.listen(SqlMetric, "after_insert", dataset_after_change)
+sa.event.listen(SqlMetric, "after_update", dataset_after_change)
+sa.event.listen(SqlMetric, "after_delete", dataset_after_change)
+
 RLSFilterRoles = DBTable(
     "rls_filter_roles",
     metadata,
@@ -2075,3 +2097,35 @@ class RowLevelSecurityFilter(Model, AuditMixinNullable):
         backref="row_level_security_filters",
     )
     clause = Column(utils.MediumText(), nullable=False)
+
+
+sa.event.listen(
+    RowLevelSecurityFilter, "after_insert", security_manager.rls_filter_after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_update", security_manager.rls_filter_after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_delete", security_manager.rls_filter_after_change
+)
+# changes to ``rls_filter_roles`` and ``rls_filter_tables``
+sa.event.listen(
+    RowLevelSecurityFilter.roles,
+    "append",
+    security_manager.rls_filter_relationship_changed,
+)
+sa.event.listen(
+    RowLevelSecurityFilter.roles,
+    "remove",
+    security_manager.rls_filter_relationship_changed,
+)
+sa.event.listen(
+    RowLevelSecurityFilter.tables,
+    "append",
+    security_manager.rls_filter_relationship_changed,
+)
+sa.event.listen(
+    RowLevelSecurityFilter.tables,
+    "remove",
+    security_manager.rls_filter_relationship_changed,
+)
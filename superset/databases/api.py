@@ -19,6 +19,8 @@
 from __future__ import annotations
 
 import logging
+import os
+import uuid
 from datetime import datetime
 from io import BytesIO
 from typing import Any, cast
@@ -39,6 +41,7 @@ from marshmallow import ValidationError
 from sqlalchemy.exc import NoSuchTableError, OperationalError, SQLAlchemyError
 
 from superset import event_logger
+from superset.async_events.async_query_manager import UnsupportedCacheBackendError
 from superset.commands.database.create import CreateDatabaseCommand
 from superset.commands.database.delete import DeleteDatabaseCommand
 from superset.commands.database.exceptions import (
@@ -127,9 +130,16 @@ from superset.extensions import security_manager
 from superset.models.core import Database
 from superset.sql.parse import Table
 from superset.superset_typing import FlaskResponse
+from superset.tasks.uploads import (
+    get_upload_status,
+    set_upload_status,
+    upload_csv_file,
+    UploadStatus,
+)
 from superset.utils import json
 from superset.utils.core import (
     error_msg_from_exception,
+    get_user_id,
     get_username,
     parse_js_uri_path_item,
 )
@@ -176,6 +186,7 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         "get_connection",
         "upload_metadata",
         "upload",
+        "upload_status",
         "oauth2",
         "sync_permissions",
         "dhis2_metadata",
@@ -1769,17 +1780,105 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
                 reader = ColumnarReader(parameters)
             else:
                 return self.response_400(message="Unexpected Invalid file type")
-            UploadCommand(
+            command = UploadCommand(
                 pk,
                 parameters["table_name"],
                 parameters["file"],
                 parameters.get("schema"),
                 reader,
-            ).run()
+            )
+            if (
+                parameters["type"] == UploadFileType.CSV.value
+                and app.config["CSV_UPLOAD_ASYNC"]["enabled"]
+            ):
+                command.validate()
+                return self.response(202, job_id=self._upload_async(pk, parameters))
+            command.run()
         except ValidationError as error:
             return self.response_400(message=error.messages)
+        except UnsupportedCacheBackendError:
+            return self.response_500(
+                message="Asynchronous uploads require a Redis cache for their status"
+            )
         return self.response(201, message="OK")
 
+    @staticmethod
+    def _upload_async(pk: int, parameters: dict[str, Any]) -> str:
+        """
+        Save the file to the upload folder and upload it in a Celery task.
+
+        :return: The id of the upload job
+        """
+        job_id = str(uuid.uuid4())
+        user_id = get_user_id()
+        set_upload_status(job_id, user_id=user_id, status=UploadStatus.PENDING, rows=0)
+        file_path = os.path.join(app.config["UPLOAD_FOLDER"], f"{job_id}.csv")
+        parameters.pop("file").save(file_path)
+        upload_csv_file.delay(
+            job_id,
+            user_id,
+            pk,
+            parameters.pop("table_name"),
+            parameters.pop("schema", None),
+            file_path,
+            parameters,
+        )
+        return job_id
+
+    @expose("/upload/<job_id>/", methods=("GET",))
+    @protect()
+    @safe
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}"
+        f".upload_status",
+        log_to_statsd=False,
+    )
+    def upload_status(self, job_id: str) -> Response:
+        """Get the status of a file upload running in the background.
+        ---
+        get:
+          summary: Get the status of a file upload
+          parameters:
+          - in: path
+            schema:
+              type: string
+            name: job_id
+          responses:
+            200:
+              description: Upload status
+              content:
+                application/json:
+                  schema:
+                    type: object
+                    properties:
+                      result:
+                        type: object
+                        properties:
+                          status:
+                            type: string
+                            enum: [pending, running, success, failed]
+                          rows:
+                            type: integer
+                          error:
+                            type: string
+            401:
+              $ref: '#/components/responses/401'
+            404:
+              $ref: '#/components/responses/404'
+        """
+        status = get_upload_status(job_id)
+        if not status or status["user_id"] != get_user_id():
+            return self.response_404()
+        return self.response(
+            200,
+            result={
+                "status": status["status"],
+                "rows": status["rows"],
+                "error": status.get("error"),
+            },
+        )
+
     @expose("/<int:pk>/function_names/", methods=("GET",))
     @protect()
     @safe
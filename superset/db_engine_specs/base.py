@@ -29,6 +29,8 @@ from typing import (
     Callable,
     cast,
     ContextManager,
+    Iterable,
+    Iterator,
     NamedTuple,
     Optional,
     TYPE_CHECKING,
@@ -386,6 +388,9 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
 
     force_column_alias_quotes = False
     arraysize = 0
+    # Whether results can be fetched in chunks with `fetch_data_in_chunks`. Engines
+    # that post-process the whole result in `fetch_data` should disable it.
+    supports_chunked_fetch = True
     max_column_name_length: int | None = None
     try_remove_schema_from_table_name = True  # pylint: disable=invalid-name
     run_multiple_statements_as_one = False
@@ -984,32 +989,75 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             if cls.limit_method == LimitMethod.FETCH_MANY and limit:
                 return cursor.fetchmany(limit)
             data = cursor.fetchall()
-            description = cursor.description or []
-            # Create a mapping between column name and a mutator function to normalize
-            # values with. The first two items in the description row are
-            # the column name and type.
-            column_mutators = {
-                row[0]: func
-                for row in description
-                if (
-                    func := cls.column_type_mutators.get(
-                        type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
-                    )
-                )
-            }
-            if column_mutators:
-                indexes = {row[0]: idx for idx, row in enumerate(description)}
-                for row_idx, row in enumerate(data):
-                    new_row = list(row)
-                    for col, func in column_mutators.items():
-                        col_idx = indexes[col]
-                        new_row[col_idx] = func(row[col_idx])
-                    data[row_idx] = tuple(new_row)
-
-            return data
+            return cls._mutate_column_types(data, cursor.description or [])
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+    @classmethod
+    def fetch_data_in_chunks(
+        cls, cursor: Any, chunk_size: int, limit: int | None = None
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """
+        Fetch the results of a query in chunks, so they can be processed before the
+        whole result has been received.
+
+        :param cursor: Cursor instance
+        :param chunk_size: Maximum number of rows of a chunk
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Chunks of the result of the query
+        """
+        if cls.arraysize:
+            cursor.arraysize = cls.arraysize
+        description = cursor.description
+        if not description:
+            return
+
+        fetched = 0
+        while limit is None or fetched < limit:
+            size = chunk_size if limit is None else min(chunk_size, limit - fetched)
+            try:
+                data = cursor.fetchmany(size)
+            except Exception as ex:
+                raise cls.get_dbapi_mapped_exception(ex) from ex
+            if not data:
+                return
+
+            fetched += len(data)
+            yield cls._mutate_column_types(list(data), description)
+            if len(data) < size:
+                return
+
+    @classmethod
+    def _mutate_column_types(
+        cls, data: list[tuple[Any, ...]], description: Any
+    ) -> list[tuple[Any, ...]]:
+        """
+        Normalize the values of the columns that have a mutator in
+        `column_type_mutators`.
+        """
+        # Create a mapping between column name and a mutator function to normalize
+        # values with. The first two items in the description row are
+        # the column name and type.
+        column_mutators = {
+            row[0]: func
+            for row in description
+            if (
+                func := cls.column_type_mutators.get(
+                    type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
+                )
+            )
+        }
+        if column_mutators:
+            indexes = {row[0]: idx for idx, row in enumerate(description)}
+            for row_idx, row in enumerate(data):
+                new_row = list(row)
+                for col, func in column_mutators.items():
+                    col_idx = indexes[col]
+                    new_row[col_idx] = func(row[col_idx])
+                data[row_idx] = tuple(new_row)
+
+        return data
+
     @classmethod
     def expand_data(
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
@@ -1187,13 +1235,80 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             catalog=table.catalog,
             schema=table.schema,
         ) as engine:
-            if (
-                engine.dialect.supports_multivalues_insert
-                or cls.supports_multivalues_insert
-            ):
-                to_sql_kwargs["method"] = "multi"
+            if method := cls.get_df_to_sql_method(engine):
+                to_sql_kwargs["method"] = method
             df.to_sql(con=engine, **to_sql_kwargs)
 
+    @classmethod
+    def df_chunks_to_sql(
+        cls,
+        database: Database,
+        table: Table,
+        chunks: Iterable[pd.DataFrame],
+        to_sql_kwargs: dict[str, Any],
+        on_progress: Callable[[int], None] | None = None,
+    ) -> None:
+        """
+        Upload data from chunks of a Pandas DataFrame to a database.
+
+        The first chunk is uploaded following the `if_exists` of `to_sql_kwargs` and the
+        next ones are appended, in a single transaction so a failed upload leaves the
+        table untouched. Engines overriding `df_to_sql`, which may not support
+        appending, upload all the chunks at once with it instead.
+
+        :param database: The database to upload the data to
+        :param table: The table to upload the data to
+        :param chunks: The dataframes with data to be uploaded
+        :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
+        :param on_progress: Called with the number of rows uploaded after each chunk
+        """
+        rows = 0
+        df_to_sql = getattr(cls.df_to_sql, "__func__", cls.df_to_sql)
+        if df_to_sql is not BaseEngineSpec.df_to_sql.__func__:  # type: ignore
+            df = pd.concat(chunks)
+            cls.df_to_sql(database, table, df, to_sql_kwargs)
+            if on_progress:
+                on_progress(len(df))
+            return
+
+        to_sql_kwargs["name"] = table.table
+        if table.schema:
+            to_sql_kwargs["schema"] = table.schema
+
+        with cls.get_engine(
+            database,
+            catalog=table.catalog,
+            schema=table.schema,
+        ) as engine:
+            if method := cls.get_df_to_sql_method(engine):
+                to_sql_kwargs["method"] = method
+            with engine.begin() as conn:
+                for df in chunks:
+                    df.to_sql(con=conn, **to_sql_kwargs)
+                    to_sql_kwargs["if_exists"] = "append"
+                    rows += len(df)
+                    if on_progress:
+                        on_progress(rows)
+
+    @classmethod
+    def get_df_to_sql_method(cls, engine: Engine) -> str | Callable[..., Any] | None:
+        """
+        Return the `method` used by `pandas.DataFrame.to_sql` to insert the rows.
+
+        This is "multi" for engines supporting multi-values INSERTs, or None for a
+        chunked `executemany`. Engines with a native bulk loader can return a callable
+        with the signature `(table, conn, keys, data_iter)`, called once per chunk.
+
+        :param engine: The engine the data is uploaded with
+        :return: The `method` passed to `pandas.DataFrame.to_sql`
+        """
+        if (
+            engine.dialect.supports_multivalues_insert
+            or cls.supports_multivalues_insert
+        ):
+            return "multi"
+        return None
+
     @classmethod
     def convert_dttm(  # pylint: disable=unused-argument
         cls, target_type: str, dttm: datetime, db_extra: dict[str, Any] | None = None
@@ -122,6 +122,7 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
 
     engine = "bigquery"
     engine_name = "Google BigQuery"
+    supports_chunked_fetch = False
     max_column_name_length = 128
     disable_ssh_tunneling = True
 
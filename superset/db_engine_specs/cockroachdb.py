@@ -25,6 +25,8 @@ from superset.db_engine_specs.postgres import PostgresEngineSpec
 class CockroachDbEngineSpec(PostgresEngineSpec):
     engine = "cockroachdb"
     engine_name = "CockroachDB"
+    # `COPY FROM STDIN` isn't verified to load uploads like Postgres
+    supports_copy_from_stdin = False
 
     @classmethod
     def convert_dttm(
@@ -38,6 +38,7 @@ class DrillEngineSpec(BaseEngineSpec):
 
     engine = "drill"
     engine_name = "Apache Drill"
+    supports_chunked_fetch = False
     default_driver = "sadrill"
 
     supports_dynamic_schema = True
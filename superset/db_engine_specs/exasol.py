@@ -25,6 +25,7 @@ class ExasolEngineSpec(BaseEngineSpec):  # pylint: disable=abstract-method
 
     engine = "exa"
     engine_name = "Exasol"
+    supports_chunked_fetch = False
     max_column_name_length = 128
 
     # Exasol's DATE_TRUNC function is PostgresSQL compatible
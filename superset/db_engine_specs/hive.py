@@ -90,6 +90,7 @@ class HiveEngineSpec(PrestoEngineSpec):
 
     engine = "hive"
     engine_name = "Apache Hive"
+    supports_chunked_fetch = False
     max_column_name_length = 767
     allows_alias_to_source_column = True
     allows_hidden_orderby_agg = False
@@ -36,6 +36,7 @@ from sqlalchemy.dialects.mysql import (
     TINYINT,
     TINYTEXT,
 )
+from sqlalchemy.engine import Engine
 from sqlalchemy.engine.url import URL
 
 from superset.constants import TimeGrain
@@ -260,6 +261,13 @@ class MySQLEngineSpec(BasicParametersMixin, BaseEngineSpec):
     def epoch_to_dttm(cls) -> str:
         return "from_unixtime({col})"
 
+    @classmethod
+    def get_df_to_sql_method(cls, engine: Engine) -> Optional[str]:
+        # the MySQL drivers rewrite `executemany` INSERTs into batches of multi-values
+        # INSERTs sized to `max_allowed_packet`, without compiling a statement with a
+        # bound parameter per value like the "multi" method does
+        return None
+
     @classmethod
     def _extract_error_message(cls, ex: Exception) -> str:
         """Extract error message for queries"""
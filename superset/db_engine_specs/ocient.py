@@ -224,6 +224,7 @@ def _find_columns_to_sanitize(cursor: Any) -> list[PlacedSanitizeFunc]:
 class OcientEngineSpec(BaseEngineSpec):
     engine = "ocient"
     engine_name = "Ocient"
+    supports_chunked_fetch = False
     force_column_alias_quotes = True
     max_column_name_length = 30
 
@@ -26,6 +26,7 @@ from superset.db_engine_specs.base import BaseEngineSpec
 class OracleEngineSpec(BaseEngineSpec):
     engine = "oracle"
     engine_name = "Oracle"
+    supports_chunked_fetch = False
     force_column_alias_quotes = True
     max_column_name_length = 128
     supports_multivalues_insert = True
@@ -17,15 +17,17 @@
 
 from __future__ import annotations
 
+import io
 import logging
 import re
 from datetime import datetime
 from re import Pattern
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Callable, Iterable, Optional, TYPE_CHECKING
 
 from flask_babel import gettext as __
 from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, ENUM, JSON
 from sqlalchemy.dialects.postgresql.base import PGInspector
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 from sqlalchemy.types import Date, DateTime, String
@@ -40,6 +42,8 @@ from superset.utils import core as utils, json
 from superset.utils.core import GenericDataType, QuerySource
 
 if TYPE_CHECKING:
+    from pandas.io.sql import SQLTable
+
     from superset.models.core import Database  # pragma: no cover
 
 logger = logging.getLogger()
@@ -94,6 +98,44 @@ def parse_options(connect_args: dict[str, Any]) -> dict[str, str]:
     return {token[0]: token[1] for token in tokens}
 
 
+def copy_from_stdin(
+    table: SQLTable,
+    conn: Connection,
+    keys: list[str],
+    data_iter: Iterable[tuple[Any, ...]],
+) -> int:
+    """
+    Insert a chunk of rows with `COPY ... FROM STDIN`, as a `pandas.DataFrame.to_sql`
+    method. The rows are sent as CSV, which Postgres loads much faster than INSERTs.
+    """
+    buffer = io.StringIO()
+    rowcount = 0
+    for row in data_iter:
+        # every value is quoted but NULLs, which `COPY` loads from unquoted empty values
+        # so that they can't collide with any string
+        buffer.write(
+            ",".join(
+                "" if value is None else '"' + str(value).replace('"', '""') + '"'
+                for value in row
+            )
+            + "\n"
+        )
+        rowcount += 1
+    buffer.seek(0)
+
+    preparer = conn.dialect.identifier_preparer
+    table_name = preparer.quote(table.name)
+    if table.schema:
+        table_name = f"{preparer.quote_schema(table.schema)}.{table_name}"
+    columns = ", ".join(preparer.quote(key) for key in keys)
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    return rowcount
+
+
 class PostgresBaseEngineSpec(BaseEngineSpec):
     """Abstract class for Postgres 'like' databases"""
 
@@ -217,6 +259,8 @@ class PostgresEngineSpec(BasicParametersMixin, PostgresBaseEngineSpec):
 
     max_column_name_length = 63
     try_remove_schema_from_table_name = False  # pylint: disable=invalid-name
+    # Whether uploads are loaded with `COPY FROM STDIN`, see `copy_from_stdin`
+    supports_copy_from_stdin = True
 
     column_type_mappings = (
         (
@@ -449,6 +493,13 @@ WHERE datistemplate = false;
             return types[type_code].name
         return None
 
+    @classmethod
+    def get_df_to_sql_method(cls, engine: Engine) -> str | Callable[..., Any] | None:
+        # `COPY FROM STDIN` is only exposed by psycopg2 as `copy_expert`
+        if cls.supports_copy_from_stdin and engine.dialect.driver == "psycopg2":
+            return copy_from_stdin
+        return super().get_df_to_sql_method(engine)
+
     @classmethod
     def get_cancel_query_id(cls, cursor: Any, query: Query) -> str | None:
         """
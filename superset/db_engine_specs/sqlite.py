@@ -24,6 +24,7 @@ from typing import Any, TYPE_CHECKING
 
 from flask_babel import gettext as __
 from sqlalchemy import types
+from sqlalchemy.engine import Engine
 from sqlalchemy.engine.reflection import Inspector
 
 from superset.constants import TimeGrain
@@ -122,6 +123,12 @@ class SqliteEngineSpec(BaseEngineSpec):
             return f"""'{dttm.isoformat(sep=" ", timespec="seconds")}'"""
         return None
 
+    @classmethod
+    def get_df_to_sql_method(cls, engine: Engine) -> str | None:
+        # multi-values INSERTs are capped by the number of bound parameters allowed
+        # by SQLite, while `executemany` in a single transaction is much faster
+        return None
+
     @classmethod
     def get_table_names(
         cls,
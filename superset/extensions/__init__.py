@@ -44,6 +44,7 @@ from superset.async_events.async_query_manager_factory import AsyncQueryManagerF
 from superset.extensions.ssh import SSHManagerFactory
 from superset.extensions.stats_logger import BaseStatsLoggerManager
 from superset.security.manager import SupersetSecurityManager
+from superset.utils.admission_control import DatabaseAdmissionController
 from superset.utils.cache_manager import CacheManager
 from superset.utils.encrypt import EncryptedFieldFactory
 from superset.utils.feature_flag_manager import FeatureFlagManager
@@ -133,6 +134,7 @@ async_query_manager: AsyncQueryManager = LocalProxy(
     async_query_manager_factory.instance
 )
 cache_manager = CacheManager()
+database_admission_controller = DatabaseAdmissionController()
 celery_app = celery.Celery()
 csrf = CSRFProtect()
 db = get_sqla_class()()
@@ -51,6 +51,7 @@ from superset.extensions import (
     cache_manager,
     celery_app,
     csrf,
+    database_admission_controller,
     db,
     encrypted_field_factory,
     feature_flag_manager,
@@ -127,10 +128,21 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         """
 
     def configure_celery(self) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset.tasks.scheduling import task_scheduler
+
         celery_app.config_from_object(self.config["CELERY_CONFIG"])
         celery_app.set_default()
         superset_app = self.superset_app
 
+        task_scheduler.init_app(superset_app)
+        if task_scheduler.enabled:
+            # routes configured in CELERY_CONFIG still apply to the other tasks
+            task_routes = celery_app.conf.task_routes or []
+            if not isinstance(task_routes, (list, tuple)):
+                task_routes = [task_routes]
+            celery_app.conf.task_routes = [task_scheduler.route, *task_routes]
+
         # Here, we want to ensure that every call into Celery task has an app context
         # setup properly
         task_base = celery_app.Task
@@ -141,7 +153,7 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
 
             # Grab each call into the task and set up an app context
             def __call__(self, *args: Any, **kwargs: Any) -> Any:
-                with superset_app.app_context():
+                with superset_app.app_context(), task_scheduler.admit(self):
                     return task_base.__call__(self, *args, **kwargs)
 
         celery_app.Task = AppContextTask
@@ -570,6 +582,7 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         self.configure_async_queries()
         self.configure_ssh_manager()
         self.configure_stats_manager()
+        self.configure_database_admission_control()
 
         # Hook that provides administrators a handle on the Flask APP
         # after initialization
@@ -743,6 +756,9 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
     def configure_stats_manager(self) -> None:
         stats_logger_manager.init_app(self.superset_app)
 
+    def configure_database_admission_control(self) -> None:
+        database_admission_controller.init_app(self.superset_app)
+
     def setup_event_logger(self) -> None:
         _event_logger["event_logger"] = get_event_logger_from_cfg_value(
             self.superset_app.config.get("EVENT_LOGGER", DBEventLogger())
@@ -789,6 +805,7 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         appbuilder.indexview = SupersetIndexView
         appbuilder.security_manager_class = custom_sm
         appbuilder.init_app(self.superset_app, db.session)
+        appbuilder.sm.register_permissions_cache_listeners()
 
     def configure_url_map_converters(self) -> None:
         #
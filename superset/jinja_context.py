@@ -18,8 +18,10 @@
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import re
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache, partial
@@ -28,9 +30,16 @@ from typing import Any, Callable, cast, TYPE_CHECKING, TypedDict, Union
 import dateutil
 from flask import current_app, g, has_request_context, request
 from flask_babel import gettext as _
-from jinja2 import DebugUndefined, Environment, TemplateSyntaxError
+from jinja2 import DebugUndefined, Environment, Template, TemplateSyntaxError
+from jinja2.defaults import (
+    BLOCK_START_STRING,
+    COMMENT_START_STRING,
+    VARIABLE_START_STRING,
+)
 from jinja2.exceptions import SecurityError, UndefinedError
+from jinja2.lexer import newline_re
 from jinja2.sandbox import SandboxedEnvironment
+from jinja2.utils import LRUCache
 from sqlalchemy.engine.interfaces import Dialect
 from sqlalchemy.sql.expression import bindparam
 from sqlalchemy.types import String
@@ -56,6 +65,8 @@ from superset.utils.core import (
     get_username,
     merge_extra_filters,
 )
+from superset.utils.decorators import stats_timing
+from superset.utils.hashing import md5_sha_from_str
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import SqlaTable
@@ -87,6 +98,53 @@ def context_addons() -> dict[str, Any]:
     return current_app.config.get("JINJA_CONTEXT_ADDONS", {})
 
 
+@lru_cache(maxsize=1)
+def compiled_templates() -> LRUCache:
+    """
+    The compiled code of the templates rendered by this process, by processor class,
+    engine and template hash, see JINJA_TEMPLATE_CACHE_SIZE.
+    """
+    return LRUCache(current_app.config["JINJA_TEMPLATE_CACHE_SIZE"])
+
+
+@lru_cache(maxsize=1)
+def macro_results() -> LRUCache:
+    """
+    The SQL generated by the ``dataset`` macro in this process, by dataset ID first,
+    along with its expiry, see JINJA_MACRO_CACHE_SIZE.
+    """
+    return LRUCache(current_app.config["JINJA_MACRO_CACHE_SIZE"])
+
+
+def clear_macro_results(dataset_id: int | None) -> None:
+    """
+    Drops the SQL generated by the macro for a dataset, when it or its columns and
+    metrics change.
+    """
+    cache = macro_results()
+    for key in cache.keys():
+        if key[0] == dataset_id:
+            with contextlib.suppress(KeyError):
+                del cache[key]
+
+
+def has_jinja_syntax(*texts: str | None) -> bool:
+    """
+    Whether any of the texts has Jinja syntax, the SQL generated from texts without it
+    doesn't depend on the context of the request.
+    """
+    return any(
+        delimiter in text
+        for text in texts
+        if text
+        for delimiter in (
+            VARIABLE_START_STRING,
+            BLOCK_START_STRING,
+            COMMENT_START_STRING,
+        )
+    )
+
+
 class Filter(TypedDict):
     op: str  # pylint: disable=C0103
     col: str
@@ -689,6 +747,44 @@ class BaseTemplateProcessor:
         """
         return self._context.copy()
 
+    def is_templated(self, sql: str) -> bool:
+        """
+        Whether the SQL has any Jinja syntax, SQL without it renders as is.
+        """
+        return any(
+            delimiter and delimiter in sql
+            for delimiter in (
+                self.env.variable_start_string,
+                self.env.block_start_string,
+                self.env.comment_start_string,
+                self.env.line_statement_prefix,
+                self.env.line_comment_prefix,
+            )
+        )
+
+    def get_template(self, sql: str) -> Template:
+        """
+        Compiles the template, reusing the code compiled for the same template by this
+        process. Templates are only bound to the environment of the processor when
+        rendered, so the code can be shared between processors of the same engine.
+        """
+        key = (type(self), self.engine, md5_sha_from_str(sql))
+        cache = compiled_templates()
+        if (code := cache.get(key)) is None:
+            code = cache[key] = self.env.compile(sql)
+        return self.env.template_class.from_code(
+            self.env,
+            code,
+            self.env.make_globals(None),
+        )
+
+    def get_render_context(self, **kwargs: Any) -> dict[str, Any]:
+        """
+        Returns the validated context the template is rendered with.
+        """
+        kwargs.update(self._context)
+        return validate_template_context(self.engine, kwargs)
+
     def process_template(self, sql: str, **kwargs: Any) -> str:
         """Processes a sql template
 
@@ -696,8 +792,19 @@ class BaseTemplateProcessor:
         >>> process_template(sql)
         "SELECT '2017-01-01T00:00:00'"
         """
+        with stats_timing("jinja.process_template", current_app.config["STATS_LOGGER"]):
+            return self._process_template(sql, **kwargs)
+
+    def _process_template(self, sql: str, **kwargs: Any) -> str:
+        if not self.is_templated(sql):
+            # what Jinja renders, normalizing the newlines like its lexer does
+            lines = newline_re.split(sql)[::2]
+            if not self.env.keep_trailing_newline and lines[-1] == "":
+                del lines[-1]
+            return self.env.newline_sequence.join(lines)
+
         try:
-            template = self.env.from_string(sql)
+            template = self.get_template(sql)
         except (
             TemplateSyntaxError,
             SecurityError,
@@ -758,8 +865,7 @@ class BaseTemplateProcessor:
 
             raise SupersetTemplateException(message) from ex
 
-        kwargs.update(self._context)
-        context = validate_template_context(self.engine, kwargs)
+        context = self.get_render_context(**kwargs)
 
         try:
             return template.render(context)
@@ -924,27 +1030,23 @@ class HiveTemplateProcessor(PrestoTemplateProcessor):
 class SparkTemplateProcessor(HiveTemplateProcessor):
     engine = "spark"
 
-    def process_template(self, sql: str, **kwargs: Any) -> str:
-        template = self.env.from_string(sql)
-        kwargs.update(self._context)
+    def get_render_context(self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_render_context(**kwargs)
 
         # Backwards compatibility if migrating from Hive.
-        context = validate_template_context(self.engine, kwargs)
         context["hive"] = context["spark"]
-        return template.render(context)
+        return context
 
 
 class TrinoTemplateProcessor(PrestoTemplateProcessor):
     engine = "trino"
 
-    def process_template(self, sql: str, **kwargs: Any) -> str:
-        template = self.env.from_string(sql)
-        kwargs.update(self._context)
+    def get_render_context(self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_render_context(**kwargs)
 
         # Backwards compatibility if migrating from Presto.
-        context = validate_template_context(self.engine, kwargs)
         context["presto"] = context["trino"]
-        return template.render(context)
+        return context
 
 
 DEFAULT_PROCESSORS = {
@@ -1007,6 +1109,24 @@ def dataset_macro(
 
     columns = columns or [column.column_name for column in dataset.columns]
     metrics = [metric.metric_name for metric in dataset.metrics]
+    database = dataset.database
+    key = (
+        dataset.id,
+        "dataset",
+        dataset.changed_on,
+        database.id,
+        database.changed_on,
+        database.sqlalchemy_uri,
+        tuple(columns),
+        include_metrics,
+        from_dttm,
+        to_dttm,
+        tuple(security_manager.get_rls_cache_key(dataset)),
+    )
+    cached = macro_results().get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
     query_obj = {
         "is_timeseries": False,
         "filter": [],
@@ -1016,8 +1136,22 @@ def dataset_macro(
         "to_dttm": to_dttm,
     }
     sqla_query = dataset.get_query_str_extended(query_obj, mutate=False)
-    sql = sqla_query.sql
-    return f"(\n{sql}\n) AS dataset_{dataset_id}"
+    sql = f"(\n{sqla_query.sql}\n) AS dataset_{dataset_id}"
+
+    # templated datasets can depend on the user, the URL or the filters of the request,
+    # and the SQL of DHIS2 datasets is generated along with request parameters
+    if (
+        dataset.changed_on
+        and database.backend != "dhis2"
+        and not has_jinja_syntax(
+            dataset.sql,
+            *[column.expression for column in dataset.columns],
+            *[metric.expression for metric in dataset.metrics if include_metrics],
+        )
+    ):
+        expiry = time.monotonic() + current_app.config["JINJA_MACRO_CACHE_TIMEOUT"]
+        macro_results()[key] = (expiry, sql)
+    return sql
 
 
 def get_dataset_id_from_context(metric_key: str) -> int:
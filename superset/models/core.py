@@ -68,6 +68,7 @@ from superset.databases.utils import make_url_safe
 from superset.db_engine_specs.base import MetricType, TimeGrain
 from superset.extensions import (
     cache_manager,
+    database_admission_controller,
     encrypted_field_factory,
     event_logger,
     security_manager,
@@ -582,7 +583,7 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
             nullpool=nullpool,
             source=source,
         ) as engine:
-            with check_for_oauth2(self):
+            with check_for_oauth2(self), database_admission_controller.admit(self):
                 with closing(engine.raw_connection()) as conn:
                     # pre-session queries are used to set the selected catalog/schema
                     for prequery in self.db_engine_spec.get_prequeries(
@@ -16,8 +16,11 @@
 # under the License.
 from typing import TypedDict
 
+from typing_extensions import NotRequired
+
 from superset.dashboards.permalink.types import DashboardPermalinkState
 
 
 class ReportScheduleExtra(TypedDict):
     dashboard: DashboardPermalinkState
+    screenshot_concurrency: NotRequired[int]
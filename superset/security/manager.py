@@ -21,6 +21,7 @@ import logging
 import re
 import time
 from collections import defaultdict
+from functools import cached_property
 from typing import Any, Callable, cast, NamedTuple, Optional, TYPE_CHECKING
 
 from flask import current_app, Flask, g, Request
@@ -47,11 +48,10 @@ from flask_appbuilder.widgets import ListWidget
 from flask_babel import lazy_gettext as _
 from flask_login import AnonymousUserMixin, LoginManager
 from jwt.api_jwt import _jwt_global_obj
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_, event, inspect, or_
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.orm import eagerload
 from sqlalchemy.orm.mapper import Mapper
-from sqlalchemy.orm.query import Query as SqlaQuery
 from sqlalchemy.sql import exists
 
 from superset.constants import RouteMethod
@@ -78,6 +78,7 @@ from superset.utils.core import (
     RowLevelSecurityFilterType,
 )
 from superset.utils.filters import get_dataset_access_filters
+from superset.utils.hashing import md5_sha_from_str
 from superset.utils.urls import get_url_host
 
 if TYPE_CHECKING:
@@ -91,6 +92,7 @@ if TYPE_CHECKING:
     from superset.models.dashboard import Dashboard
     from superset.models.slice import Slice
     from superset.models.sql_lab import Query
+    from superset.utils.cache import VersionedCache
     from superset.viz import BaseViz
 
 logger = logging.getLogger(__name__)
@@ -109,6 +111,12 @@ class DatabaseCatalogSchema(NamedTuple):
     schema: str
 
 
+class RowLevelSecurityFilterClause(NamedTuple):
+    id: int
+    group_key: Optional[str]
+    clause: str
+
+
 class SupersetSecurityListWidget(ListWidget):  # pylint: disable=too-few-public-methods
     """
     Redeclaring to avoid circular imports
@@ -470,6 +478,147 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
     ) -> Optional[str]:
         return f"[{database_name}].[{dataset_name}](id:{dataset_id})"
 
+    @cached_property
+    def permissions_cache(self) -> "VersionedCache":
+        """
+        Cache of the permission snapshots computed per set of roles.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.utils.cache import VersionedCache
+
+        return VersionedCache("permissions", "PERMISSIONS_CACHE_TIMEOUT")
+
+    def register_permissions_cache_listeners(self) -> None:
+        """
+        Registers the SQLAlchemy events that invalidate the permissions cache when
+        roles, permissions, view menus or the role to permission associations change.
+        """
+        for model in (
+            self.role_model,
+            self.permission_model,
+            self.viewmenu_model,
+            self.permissionview_model,
+        ):
+            for identifier in ("after_update", "after_delete"):
+                if not event.contains(model, identifier, self.permissions_after_change):
+                    event.listen(model, identifier, self.permissions_after_change)
+
+        for identifier in ("append", "remove"):
+            if not event.contains(
+                self.role_model.permissions,
+                identifier,
+                self.role_permissions_changed,
+            ):
+                event.listen(
+                    self.role_model.permissions,
+                    identifier,
+                    self.role_permissions_changed,
+                )
+
+    def permissions_after_change(
+        self,
+        mapper: Mapper,
+        connection: Connection,
+        target: Model,
+    ) -> None:
+        """
+        Invalidates the permissions cache when a role, permission, view menu or
+        permission view is updated or deleted.
+        Triggered by SQLAlchemy after_update and after_delete events.
+
+        :param mapper: The SQLA mapper
+        :param connection: The SQLA connection
+        :param target: The changed object
+        """
+        self.permissions_cache.invalidate(self.session)
+
+    def role_permissions_changed(
+        self,
+        target: Role,
+        value: PermissionView,
+        initiator: Any,
+    ) -> None:
+        """
+        Invalidates the permissions cache when a permission view is granted to or
+        revoked from a role. Triggered by SQLAlchemy append and remove events.
+
+        :param target: The role whose permissions changed
+        :param value: The permission view being appended or removed
+        :param initiator: The SQLA event token
+        """
+        self.permissions_cache.invalidate(self.session)
+
+    def _get_permissions_snapshot(
+        self, roles: list[Role]
+    ) -> Optional[dict[str, frozenset[str]]]:
+        """
+        Returns the view menu names granted to the roles, grouped by permission name.
+
+        Snapshots are cached per set of roles, see ``PERMISSIONS_CACHE_TIMEOUT``. When
+        the cache is disabled ``None`` is returned, and callers should fall back to
+        querying the metadata database.
+
+        :param roles: The user roles
+        :returns: A mapping from permission name to view menu names, or None
+        """
+        if not self.permissions_cache.enabled:
+            return None
+
+        role_ids = tuple(sorted({role.id for role in roles if role}))
+        return self.permissions_cache.get_or_set(
+            role_ids,
+            lambda: self._get_role_ids_permissions(role_ids),
+        )
+
+    def _get_role_ids_permissions(
+        self, role_ids: tuple[int, ...]
+    ) -> dict[str, frozenset[str]]:
+        if not role_ids:
+            return {}
+
+        pvms = (
+            self.session.query(self.permission_model.name, self.viewmenu_model.name)
+            .join(
+                self.permissionview_model,
+                self.permissionview_model.permission_id == self.permission_model.id,
+            )
+            .join(
+                self.viewmenu_model,
+                self.permissionview_model.view_menu_id == self.viewmenu_model.id,
+            )
+            .join(
+                assoc_permissionview_role,
+                assoc_permissionview_role.c.permission_view_id
+                == self.permissionview_model.id,
+            )
+            .filter(assoc_permissionview_role.c.role_id.in_(role_ids))
+            .distinct()
+        )
+
+        view_menu_names: dict[str, set[str]] = defaultdict(set)
+        for permission_name, view_menu_name in pvms:
+            view_menu_names[permission_name].add(view_menu_name)
+
+        return {
+            permission_name: frozenset(names)
+            for permission_name, names in view_menu_names.items()
+        }
+
+    def _has_view_access(
+        self, user: object, permission_name: str, view_name: str
+    ) -> bool:
+        # anonymous users have no roles when there's no public role
+        roles = [role for role in self.get_user_roles(user) if role]
+        snapshot = self._get_permissions_snapshot(roles)
+        if snapshot is None:
+            return super()._has_view_access(user, permission_name, view_name)
+
+        return view_name in snapshot.get(permission_name, ()) or any(
+            role.name in self.builtin_roles
+            and self._has_access_builtin_roles(role, permission_name, view_name)
+            for role in roles
+        )
+
     def can_access(self, permission_name: str, view_name: str) -> bool:
         """
         Return True if the user can access the FAB permission/view, False otherwise.
@@ -483,7 +632,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         """
 
         user = g.user
-        if user.is_anonymous:
+        if user.is_anonymous and not self.permissions_cache.enabled:
             return self.is_item_public(permission_name, view_name)
         return self._has_view_access(user, permission_name, view_name)
 
@@ -840,6 +989,11 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         return True
 
     def user_view_menu_names(self, permission_name: str) -> set[str]:
+        if not self.is_guest_user():
+            snapshot = self._get_permissions_snapshot(self.get_user_roles(g.user))
+            if snapshot is not None:
+                return set(snapshot.get(permission_name, ()))
+
         base_query = (
             self.session.query(self.viewmenu_model.name)
             .join(self.permissionview_model)
@@ -1572,6 +1726,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             .where(view_menu_table.c.id == db_pvm.view_menu_id)
             .values(name=new_view_menu_name)
         )
+        self.permissions_cache.invalidate(self.session)
         if not new_view_menu_name:
             return None
         new_db_view_menu = self._find_view_menu_on_sqla_event(
@@ -1657,6 +1812,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                     new_dataset_view_menu,
                 )
                 updated_view_menus.append(new_dataset_view_menu)
+        self.permissions_cache.invalidate(self.session)
         return updated_view_menus
 
     def dataset_after_insert(
@@ -1985,6 +2141,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             .where(view_menu_table.c.name == old_permission_name)
             .values(name=new_permission_name)
         )
+        self.permissions_cache.invalidate(self.session)
         # VM changed, so call hook
         new_dataset_view_menu = self.find_view_menu(new_permission_name)
         self.on_view_menu_after_update(mapper, connection, new_dataset_view_menu)
@@ -2050,6 +2207,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         connection.execute(
             view_menu_table.delete().where(view_menu_table.c.id == pvm.view_menu_id)
         )
+        self.permissions_cache.invalidate(self.session)
 
     def _find_permission_on_sqla_event(
         self, connection: Connection, name: str
@@ -2274,6 +2432,67 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         """
         return []
 
+    @cached_property
+    def query_tables_cache(self) -> "VersionedCache":
+        """
+        Cache of the tables referenced by SQL queries, per database, catalog, schema and
+        SQL.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.utils.cache import VersionedCache
+
+        return VersionedCache("query_tables", "QUERY_TABLES_CACHE_TIMEOUT")
+
+    def get_query_tables(
+        self,
+        database: "Database",
+        query: "Query",
+        default_catalog: Optional[str],
+        template_params: Optional[dict[str, Any]] = None,
+    ) -> set[Table]:
+        """
+        Returns the tables referenced by the query, qualified with the default catalog
+        and schema.
+
+        The tables parsed from queries without Jinja are cached, since templated SQL can
+        reference different tables depending on the user or the template parameters.
+        The default schema is read on every call, since it can depend on the user and
+        on the connection settings.
+
+        :param database: The database running the query
+        :param query: The query
+        :param default_catalog: The default catalog of the database
+        :param template_params: Optional template parameters for Jinja templating
+        :returns: The tables referenced by the query
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.jinja_context import has_jinja_syntax
+
+        def get_tables() -> set[Table]:
+            return process_jinja_sql(query.sql, database, template_params).tables
+
+        if database.id is None or has_jinja_syntax(query.sql):
+            tables = get_tables()
+        else:
+            key = (database.id, database.changed_on, md5_sha_from_str(query.sql))
+            tables = self.query_tables_cache.get_or_set(key, get_tables)
+
+        # Getting the default schema for a query is hard. Users can select the schema in
+        # SQL Lab, but there's no guarantee that the query actually will run in that
+        # schema. Each DB engine spec needs to implement the necessary logic to enforce
+        # that the query runs in the selected schema. If the DB engine spec doesn't
+        # implement the logic the schema is read from the SQLAlchemy URI if possible; if
+        # not, we use the SQLAlchemy inspector to read it.
+        default_schema = database.get_default_schema_for_query(query, template_params)
+        return {
+            Table(
+                table_.table,
+                table_.schema or default_schema,
+                table_.catalog or query.catalog or default_catalog,
+            )
+            for table_ in tables
+        }
+
     def raise_for_access(  # noqa: C901
         # pylint: disable=too-many-arguments,too-many-branches,too-many-locals,too-many-statements
         self,
@@ -2335,26 +2554,12 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                 return
 
             if query:
-                # Getting the default schema for a query is hard. Users can select the
-                # schema in SQL Lab, but there's no guarantee that the query actually
-                # will run in that schema. Each DB engine spec needs to implement the
-                # necessary logic to enforce that the query runs in the selected schema.
-                # If the DB engine spec doesn't implement the logic the schema is read
-                # from the SQLAlchemy URI if possible; if not, we use the SQLAlchemy
-                # inspector to read it.
-                default_schema = database.get_default_schema_for_query(
-                    query, template_params
+                tables = self.get_query_tables(
+                    database,
+                    query,
+                    default_catalog,
+                    template_params,
                 )
-                tables = {
-                    Table(
-                        table_.table,
-                        table_.schema or default_schema,
-                        table_.catalog or query.catalog or default_catalog,
-                    )
-                    for table_ in process_jinja_sql(
-                        query.sql, database, template_params
-                    ).tables
-                }
             elif table:
                 # Make sure table has the default catalog, if not specified.
                 tables = {
@@ -2580,11 +2785,60 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             ]
         return []
 
-    def get_rls_filters(self, table: "BaseDatasource") -> list[SqlaQuery]:
+    @cached_property
+    def rls_filters_cache(self) -> "VersionedCache":
+        """
+        Cache of the RLS filters resolved per table and set of roles.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.utils.cache import VersionedCache
+
+        return VersionedCache("rls_filters", "RLS_FILTERS_CACHE_TIMEOUT")
+
+    def rls_filter_after_change(
+        self,
+        mapper: Mapper,
+        connection: Connection,
+        target: "RowLevelSecurityFilter",
+    ) -> None:
+        """
+        Invalidates the RLS filters cache when a filter is created, updated or deleted.
+        Triggered by SQLAlchemy after_insert, after_update and after_delete events.
+
+        :param mapper: The SQLA mapper
+        :param connection: The SQLA connection
+        :param target: The changed RLS filter
+        """
+        self.rls_filters_cache.invalidate(self.session)
+
+    def rls_filter_relationship_changed(
+        self,
+        target: "RowLevelSecurityFilter",
+        value: Any,
+        initiator: Any,
+    ) -> None:
+        """
+        Invalidates the RLS filters cache when the roles or tables of a filter change,
+        ie, when rows are added to or removed from ``rls_filter_roles`` or
+        ``rls_filter_tables``. Triggered by SQLAlchemy append and remove events.
+
+        :param target: The RLS filter whose relationship changed
+        :param value: The role or table being appended or removed
+        :param initiator: The SQLA event token
+        """
+        self.rls_filters_cache.invalidate(self.session)
+
+    def get_rls_filters(
+        self, table: "BaseDatasource"
+    ) -> list[RowLevelSecurityFilterClause]:
         """
         Retrieves the appropriate row level security filters for the current user and
         the passed table.
 
+        Filters are cached per table and set of roles, see
+        ``RLS_FILTERS_CACHE_TIMEOUT``.
+        Guest users bypass the cache.
+
         :param table: The table to check against
         :returns: A list of filters
         """
@@ -2592,6 +2846,27 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if not (hasattr(g, "user") and g.user is not None):
             return []
 
+        user_roles = tuple(sorted(role.id for role in self.get_user_roles(g.user)))
+        if self.is_guest_user():
+            filters = self._get_rls_filters(table.id, user_roles)
+        else:
+            filters = self.rls_filters_cache.get_or_set(
+                (table.id, user_roles),
+                lambda: self._get_rls_filters(table.id, user_roles),
+            )
+
+        return [RowLevelSecurityFilterClause(*filter_) for filter_ in filters]
+
+    def _get_rls_filters(
+        self, table_id: int, user_roles: tuple[int, ...]
+    ) -> list[tuple[int, Optional[str], str]]:
+        """
+        Queries the row level security filters for a table and set of roles.
+
+        :param table_id: The id of the table to check against
+        :param user_roles: The ids of the user roles
+        :returns: A list of (id, group_key, clause) tuples
+        """
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterRoles,
@@ -2599,7 +2874,6 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.session.query(RLSFilterRoles.c.rls_filter_id)
             .join(RowLevelSecurityFilter)
@@ -2617,7 +2891,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             .filter(RLSFilterRoles.c.role_id.in_(user_roles))
         )
         filter_tables = self.session.query(RLSFilterTables.c.rls_filter_id).filter(
-            RLSFilterTables.c.table_id == table.id
+            RLSFilterTables.c.table_id == table_id
         )
         query = (
             self.session.query(
@@ -2641,9 +2915,11 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                 )
             )
         )
-        return query.all()
+        return [tuple(row) for row in query.all()]
 
-    def get_rls_sorted(self, table: "BaseDatasource") -> list["RowLevelSecurityFilter"]:
+    def get_rls_sorted(
+        self, table: "BaseDatasource"
+    ) -> list[RowLevelSecurityFilterClause]:
         """
         Retrieves a list RLS filters sorted by ID for
         the current user and the passed table.
@@ -21,12 +21,15 @@ import copy
 import enum
 import logging
 import re
+import time
 import urllib.parse
 from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Generic, Optional, TYPE_CHECKING, TypeVar
 
 import sqlglot
+from flask import current_app, has_app_context
 from jinja2 import nodes, Template
 from sqlglot import exp
 from sqlglot.dialects.dialect import (
@@ -43,6 +46,7 @@ from sqlglot.optimizer.scope import (
     traverse_scope,
 )
 
+from superset.constants import LRU_CACHE_MAX_SIZE
 from superset.exceptions import QueryClauseValidationException, SupersetParseError
 from superset.sql.dialects import Dremio, Firebolt, Pinot
 
@@ -541,47 +545,29 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         ast: exp.Expression | None = None,
     ):
         self._dialect = SQLGLOT_DIALECTS.get(engine)
+        # ASTs parsed from a statement are shared with the parsed SQL cache
+        self._shared = ast is None
         super().__init__(statement, engine, ast)
 
+    def _copy_on_write(self) -> exp.Expression:
+        """
+        Return the AST to be modified inplace, copying it first if it's shared with the
+        parsed SQL cache.
+        """
+        if self._shared:
+            self._parsed = self._parsed.copy()
+            self._shared = False
+        return self._parsed
+
     @classmethod
     def _parse(cls, script: str, engine: str) -> list[exp.Expression]:
         """
         Parse helper.
-        """
-        dialect = SQLGLOT_DIALECTS.get(engine)
-        try:
-            statements = sqlglot.parse(script, dialect=dialect)
-        except sqlglot.errors.ParseError as ex:
-            kwargs = (
-                {
-                    "highlight": ex.errors[0]["highlight"],
-                    "line": ex.errors[0]["line"],
-                    "column": ex.errors[0]["col"],
-                }
-                if ex.errors
-                else {}
-            )
-            raise SupersetParseError(script, engine, **kwargs) from ex
-        except sqlglot.errors.SqlglotError as ex:
-            raise SupersetParseError(
-                script,
-                engine,
-                message="Unable to parse script",
-            ) from ex
-
-        # `sqlglot` will parse comments after the last semicolon as a separate
-        # statement; move them back to the last token in the last real statement
-        if len(statements) > 1 and isinstance(statements[-1], exp.Semicolon):
-            last_statement = statements.pop()
-            target = statements[-1]
-            for node in statements[-1].walk():
-                if hasattr(node, "comments"):  # pragma: no cover
-                    target = node
 
-            target.comments = target.comments or []
-            target.comments.extend(last_statement.comments)
-
-        return statements
+        The ASTs are shared with the parsed SQL cache, and must be copied before being
+        modified, see `_copy_on_write`.
+        """
+        return list(parse_sql(script, engine))
 
     @classmethod
     def split_script(
@@ -589,9 +575,14 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         script: str,
         engine: str,
     ) -> list[SQLStatement]:
-        return [
-            cls(ast=ast, engine=engine) for ast in cls._parse(script, engine) if ast
-        ]
+        statements = []
+        for ast in cls._parse(script, engine):
+            if ast:
+                statement = cls(ast=ast, engine=engine)
+                statement._shared = True
+                statements.append(statement)
+
+        return statements
 
     @classmethod
     def _parse_statement(
@@ -719,7 +710,7 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         if not self._dialect:
             return SQLStatement(ast=self._parsed.copy(), engine=self.engine)
 
-        optimized = pushdown_predicates(self._parsed, dialect=self._dialect)
+        optimized = pushdown_predicates(self._copy_on_write(), dialect=self._dialect)
 
         return SQLStatement(ast=optimized, engine=self.engine)
 
@@ -762,7 +753,7 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         Modify the `LIMIT` or `TOP` value of the SQL statement inplace.
         """
         if method == LimitMethod.FORCE_LIMIT:
-            self._parsed.args["limit"] = exp.Limit(
+            self._copy_on_write().args["limit"] = exp.Limit(
                 expression=exp.Literal(this=str(limit), is_string=False)
             )
         elif method == LimitMethod.WRAP_SQL:
@@ -795,8 +786,9 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         :param alias: The alias to use for the CTE.
         :return: A new SQLStatement with the CTE.
         """
-        existing_ctes = self._parsed.args["with"].expressions if self.has_cte() else []
-        self._parsed.args["with"] = None
+        parsed = self._copy_on_write()
+        existing_ctes = parsed.args["with"].expressions if self.has_cte() else []
+        parsed.args["with"] = None
         new_cte = exp.CTE(
             this=self._parsed.copy(),
             alias=exp.TableAlias(this=exp.Identifier(this=alias)),
@@ -879,6 +871,77 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         self._parsed = self._parsed.transform(transformer)
 
 
+# total time spent parsing scripts by `parse_sql`, in seconds
+_parse_time = 0.0
+
+
+@lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+def parse_sql(script: str, engine: str) -> tuple[exp.Expression, ...]:
+    """
+    Parse a script with sqlglot, keeping the ASTs of the last scripts parsed.
+
+    The same SQL is parsed many times when running a query (DML and function checks,
+    RLS, limits, tables for security, cache keys), so the ASTs are shared by all the
+    statements of the script and copied only when a statement modifies them. Use
+    `get_parse_stats` for the number of scripts parsed and the time spent parsing them.
+    """
+    global _parse_time  # pylint: disable=global-statement
+
+    start = time.perf_counter()
+    dialect = SQLGLOT_DIALECTS.get(engine)
+    try:
+        statements = sqlglot.parse(script, dialect=dialect)
+    except sqlglot.errors.ParseError as ex:
+        kwargs = (
+            {
+                "highlight": ex.errors[0]["highlight"],
+                "line": ex.errors[0]["line"],
+                "column": ex.errors[0]["col"],
+            }
+            if ex.errors
+            else {}
+        )
+        raise SupersetParseError(script, engine, **kwargs) from ex
+    except sqlglot.errors.SqlglotError as ex:
+        raise SupersetParseError(
+            script,
+            engine,
+            message="Unable to parse script",
+        ) from ex
+
+    # `sqlglot` will parse comments after the last semicolon as a separate
+    # statement; move them back to the last token in the last real statement
+    if len(statements) > 1 and isinstance(statements[-1], exp.Semicolon):
+        last_statement = statements.pop()
+        target = statements[-1]
+        for node in statements[-1].walk():
+            if hasattr(node, "comments"):  # pragma: no cover
+                target = node
+
+        target.comments = target.comments or []
+        target.comments.extend(last_statement.comments)
+
+    duration = time.perf_counter() - start
+    _parse_time += duration
+    if has_app_context():
+        current_app.config["STATS_LOGGER"].timing("sql.parse", duration)
+
+    return tuple(statements)
+
+
+def get_parse_stats() -> dict[str, float]:
+    """
+    Return the hits and misses of the parsed SQL cache, and the time spent parsing.
+    """
+    info = parse_sql.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "parse_time": _parse_time,
+    }
+
+
 class KQLSplitState(enum.Enum):
     """
     State machine for splitting a KQL script.
@@ -87,6 +87,10 @@ class SqlLabQueryStoppedException(SqlLabException):
     pass
 
 
+class SqlLabResultTooLargeException(SupersetErrorException):
+    pass
+
+
 def handle_query_error(
     ex: Exception,
     query: Query,
@@ -246,6 +250,46 @@ def apply_limit(query: Query, parsed_statement: BaseSQLStatement[Any]) -> None:
         )
 
 
+def _fetch_data_in_chunks(
+    query: Query,
+    cursor: Any,
+    limit: Optional[int],
+) -> list[tuple[Any, ...]]:
+    """
+    Fetch the results of a query in chunks, and fail the query as soon as its rows grow
+    beyond the memory cap instead of once they're all fetched. The rows are still all
+    returned at once.
+    """
+    db_engine_spec = query.database.db_engine_spec
+    config = app.config["SQLLAB_RESULTS_MEMORY_CAP"]
+    max_memory_mb = config["max_memory_mb"]
+    data: list[tuple[Any, ...]] = []
+    row_size = 0.0
+    for chunk in db_engine_spec.fetch_data_in_chunks(
+        cursor, config["chunk_size"], limit
+    ):
+        if not data and chunk:
+            # estimate the size of the whole result from its first rows
+            result_set = SupersetResultSet(chunk, cursor.description, db_engine_spec)
+            row_size = result_set.pa_table.nbytes / len(chunk)
+
+        data.extend(chunk)
+        if max_memory_mb and len(data) * row_size > max_memory_mb * BYTES_IN_MB:
+            logger.info("Query %d: Result size exceeds the memory cap.", query.id)
+            raise SqlLabResultTooLargeException(
+                SupersetError(
+                    message=__(
+                        "The query returned more than %(max_memory_mb)s MB of data.",
+                        max_memory_mb=max_memory_mb,
+                    ),
+                    error_type=SupersetErrorType.RESULT_TOO_LARGE_ERROR,
+                    level=ErrorLevel.ERROR,
+                )
+            )
+
+    return data
+
+
 def execute_query(  # pylint: disable=too-many-statements, too-many-locals  # noqa: C901
     query: Query,
     cursor: Any,
@@ -283,7 +327,13 @@ def execute_query(  # pylint: disable=too-many-statements, too-many-locals  # no
                     str(query.to_dict()),
                 )
                 increased_limit = None if query.limit is None else query.limit + 1
-                data = db_engine_spec.fetch_data(cursor, increased_limit)
+                if (
+                    app.config["SQLLAB_RESULTS_MEMORY_CAP"]["enabled"]
+                    and db_engine_spec.supports_chunked_fetch
+                ):
+                    data = _fetch_data_in_chunks(query, cursor, increased_limit)
+                else:
+                    data = db_engine_spec.fetch_data(cursor, increased_limit)
                 if query.limit is None or len(data) <= query.limit:
                     query.limiting_factor = LimitingFactor.NOT_LIMITED
                 else:
@@ -308,6 +358,8 @@ def execute_query(  # pylint: disable=too-many-statements, too-many-locals  # no
     except OAuth2RedirectError:
         # user needs to authenticate with OAuth2 in order to run query
         raise
+    except SqlLabResultTooLargeException:
+        raise
     except Exception as ex:
         # query is stopped in another thread/worker
         # stopping raises expected exceptions which we should skip
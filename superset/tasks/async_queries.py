@@ -79,8 +79,7 @@ def _load_user_from_job_metadata(job_metadata: dict[str, Any]) -> User:
     return user
 
 
-@celery_app.task(name="load_chart_data_into_cache", soft_time_limit=query_timeout)
-def load_chart_data_into_cache(
+def _load_chart_data_into_cache(
     job_metadata: dict[str, Any],
     form_data: dict[str, Any],
 ) -> None:
@@ -113,6 +112,50 @@ def load_chart_data_into_cache(
             raise
 
 
+@celery_app.task(name="load_chart_data_into_cache", soft_time_limit=query_timeout)
+def load_chart_data_into_cache(
+    job_metadata: dict[str, Any],
+    form_data: dict[str, Any],
+) -> None:
+    _load_chart_data_into_cache(job_metadata, form_data)
+
+
+@celery_app.task(name="load_chart_data_batch_into_cache", soft_time_limit=query_timeout)
+def load_chart_data_batch_into_cache(
+    jobs_metadata: list[dict[str, Any]],
+    form_datas: list[dict[str, Any]],
+) -> None:
+    """
+    Load the data of a batch of charts sharing a datasource into the cache, one after
+    the other. A failing chart only fails its own job, while a timeout fails the jobs
+    that didn't run yet.
+
+    Each chart still opens its own connection to the database; batching only saves the
+    request and task per chart, and the queries of charts with the same cache key.
+    """
+    for idx, (job_metadata, form_data) in enumerate(
+        zip(jobs_metadata, form_datas, strict=True)
+    ):
+        try:
+            _load_chart_data_into_cache(job_metadata, form_data)
+        except SoftTimeLimitExceeded:
+            errors = [{"message": "A timeout occurred while loading chart data"}]
+            for pending_job_metadata in jobs_metadata[idx + 1 :]:
+                pending_job_metadata.pop("guest_token", None)
+                async_query_manager.update_job(
+                    pending_job_metadata,
+                    async_query_manager.STATUS_ERROR,
+                    errors=errors,
+                )
+            raise
+        except Exception:  # pylint: disable=broad-except
+            logger.warning(
+                "Failed loading chart data for job %s",
+                job_metadata.get("job_id"),
+                exc_info=True,
+            )
+
+
 @celery_app.task(name="load_explore_json_into_cache", soft_time_limit=query_timeout)
 def load_explore_json_into_cache(  # pylint: disable=too-many-locals
     job_metadata: dict[str, Any],
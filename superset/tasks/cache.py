@@ -17,6 +17,12 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import chain, zip_longest
 from typing import Any, Optional, TypedDict, Union
 from urllib import request
 from urllib.error import URLError
@@ -27,7 +33,7 @@ from flask import current_app
 from sqlalchemy import and_, func
 
 from superset import db, security_manager
-from superset.extensions import celery_app
+from superset.extensions import celery_app, database_admission_controller
 from superset.models.core import Log
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
@@ -35,6 +41,7 @@ from superset.tags.models import Tag, TaggedObject
 from superset.tasks.exceptions import ExecutorNotFoundError, InvalidExecutorError
 from superset.tasks.utils import fetch_csrf_token, get_executor
 from superset.utils import json
+from superset.utils.core import override_user
 from superset.utils.date_parser import parse_human_datetime
 from superset.utils.machine_auth import MachineAuthProvider
 from superset.utils.urls import get_url_path, is_secure_url
@@ -46,6 +53,8 @@ logger.setLevel(logging.INFO)
 class CacheWarmupPayload(TypedDict, total=False):
     chart_id: int
     dashboard_id: int | None
+    # query context to warm up instead of the saved one of the chart
+    query_context: dict[str, Any]
 
 
 class CacheWarmupTask(TypedDict):
@@ -53,6 +62,15 @@ class CacheWarmupTask(TypedDict):
     username: str | None
 
 
+class CacheWarmupResult(TypedDict):
+    chart_id: int
+    dashboard_id: int | None
+    status: str | None
+    error: str | None
+    # seconds spent running the queries of the chart
+    duration: float
+
+
 def get_task(chart: Slice, dashboard: Optional[Dashboard] = None) -> CacheWarmupTask:
     """Return task for warming up a given chart/table cache."""
     executors = current_app.config["CACHE_WARMUP_EXECUTORS"]
@@ -233,7 +251,123 @@ class DashboardTagsStrategy(Strategy):  # pylint: disable=too-few-public-methods
         return tasks
 
 
-strategies = [DummyStrategy, TopNDashboardsStrategy, DashboardTagsStrategy]
+class PredictedQueriesStrategy(Strategy):  # pylint: disable=too-few-public-methods
+    """
+    Warm up the queries users are likely to run in the next `window` minutes.
+
+    Replays the chart data requests logged since `since`, with the filters users
+    applied to the charts and dashboards, that were made at the same time of the day
+    as the next `window` minutes. The `top_n` most frequent ones made at least
+    `min_requests` times are warmed up, so the task should be scheduled shortly before
+    each window:
+
+        beat_schedule = {
+            'cache-warmup-predicted': {
+                'task': 'cache-warmup',
+                'schedule': crontab(minute=50, hour='*'),  # 10 minutes to the hour
+                'kwargs': {
+                    'strategy_name': 'predicted_queries',
+                    'top_n': 100,
+                    'since': '14 days ago',
+                    'window': 70,
+                },
+            },
+        }
+
+    """
+
+    name = "predicted_queries"
+
+    # the keys of a logged chart data request making up its query context
+    query_context_keys = (
+        "datasource",
+        "queries",
+        "form_data",
+        "result_format",
+        "result_type",
+    )
+
+    def __init__(
+        self,
+        top_n: int = 100,
+        since: str = "7 days ago",
+        window: int = 60,
+        min_requests: int = 2,
+    ) -> None:
+        super().__init__()
+        self.top_n = top_n
+        self.since = parse_human_datetime(since) if since else None
+        self.window = window
+        self.min_requests = min_requests
+
+    def in_window(self, dttm: datetime, now: datetime) -> bool:
+        minutes = (dttm.hour - now.hour) * 60 + dttm.minute - now.minute
+        return minutes % (24 * 60) < self.window
+
+    def get_tasks(self) -> list[CacheWarmupTask]:
+        now = datetime.utcnow()
+        logs = (
+            db.session.query(Log.slice_id, Log.dttm, Log.json)
+            .filter(
+                and_(
+                    Log.action == "ChartDataRestApi.data",
+                    Log.slice_id.isnot(None),
+                    Log.dttm >= self.since,
+                )
+            )
+            .yield_per(1000)
+        )
+
+        requests: Counter[tuple[int, str]] = Counter()
+        for chart_id, dttm, record in logs:
+            if not self.in_window(dttm, now):
+                continue
+            try:
+                payload = json.loads(record)
+            except (TypeError, json.JSONDecodeError):
+                continue
+            if not isinstance(payload, dict) or "queries" not in payload:
+                continue
+            query_context = {
+                key: payload[key] for key in self.query_context_keys if key in payload
+            }
+            requests[(chart_id, json.dumps(query_context, sort_keys=True))] += 1
+
+        predicted = [
+            (chart_id, json.loads(query_context))
+            for (chart_id, query_context), count in requests.most_common(self.top_n)
+            if count >= self.min_requests
+        ]
+        charts = {
+            chart.id: chart
+            for chart in db.session.query(Slice).filter(
+                Slice.id.in_({chart_id for chart_id, _ in predicted})
+            )
+        }
+
+        tasks = []
+        for chart_id, query_context in predicted:
+            chart = charts.get(chart_id)
+            datasource = query_context.get("datasource") or {}
+            # the filters may have been applied to a previous datasource of the chart
+            if not chart or datasource.get("id") != chart.datasource_id:
+                continue
+            task = get_task(chart)
+            task["payload"]["query_context"] = query_context
+            form_data = query_context.get("form_data") or {}
+            if dashboard_id := form_data.get("dashboardId"):
+                task["payload"]["dashboard_id"] = dashboard_id
+            tasks.append(task)
+
+        return tasks
+
+
+strategies = [
+    DummyStrategy,
+    TopNDashboardsStrategy,
+    DashboardTagsStrategy,
+    PredictedQueriesStrategy,
+]
 
 
 @celery_app.task(name="fetch_url")
@@ -278,10 +412,139 @@ def fetch_url(data: str, headers: dict[str, str]) -> dict[str, str]:
     return result
 
 
+def get_cache_keys(chart: Slice, payload: CacheWarmupPayload) -> tuple[Any, ...]:
+    """
+    Return the keys under which the data of a chart is cached, so that the charts
+    sharing them, eg on several dashboards, are only warmed up once. The data of legacy
+    charts depends on the filters of their dashboard.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.viz import viz_types
+
+    if chart.viz_type not in viz_types or "query_context" in payload:
+        try:
+            if query_context := (
+                chart.get_query_context_factory().create(**payload["query_context"])
+                if "query_context" in payload
+                else chart.get_query_context()
+            ):
+                keys = tuple(
+                    query_context.query_cache_key(query)
+                    for query in query_context.queries
+                )
+                if keys and None not in keys:
+                    return keys
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Failed computing the cache keys of chart %s", chart.id)
+    return (chart.id, payload.get("dashboard_id"))
+
+
+def get_database_limit(chart: Slice) -> int:
+    """
+    Return the number of charts of the database of a chart warmed up at the same time,
+    which is also capped by the admission control of the database.
+    """
+    limit = current_app.config["CACHE_WARMUP_IN_PROCESS"]["max_concurrent_per_database"]
+    if chart.datasource and database_admission_controller.enabled:
+        admitted = database_admission_controller.get_limit(chart.datasource.database)
+        if admitted > 0:
+            limit = min(limit, admitted)
+    return max(limit, 1)
+
+
+def warm_up_charts(tasks: list[CacheWarmupTask]) -> list[CacheWarmupResult]:
+    """
+    Warm up the cache of charts in the current process, see CACHE_WARMUP_IN_PROCESS.
+
+    The charts are run by a pool of threads, as the executor of their task, interleaving
+    the databases so that the charts of a busy database don't hold all the threads.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.commands.chart.warm_up_cache import ChartWarmUpCacheCommand
+
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    config = app.config["CACHE_WARMUP_IN_PROCESS"]
+    stats_logger = app.config["STATS_LOGGER"]
+
+    results: list[CacheWarmupResult] = []
+    seen: set[tuple[Any, ...]] = set()
+    jobs: dict[int | None, list[tuple[int | None, CacheWarmupTask]]] = defaultdict(list)
+    semaphores: dict[int | None, threading.BoundedSemaphore] = {}
+    for task in tasks:
+        chart_id = task["payload"]["chart_id"]
+        dashboard_id = task["payload"].get("dashboard_id")
+        if not task["username"]:
+            logger.warning("Executor not found for chart %s", chart_id)
+            continue
+        user = security_manager.get_user_by_username(task["username"])
+        with override_user(user):
+            if not (chart := db.session.query(Slice).get(chart_id)):
+                continue
+            keys = get_cache_keys(chart, task["payload"])
+            if keys in seen:
+                results.append(
+                    {
+                        "chart_id": chart_id,
+                        "dashboard_id": dashboard_id,
+                        "status": "duplicate",
+                        "error": None,
+                        "duration": 0.0,
+                    }
+                )
+                continue
+            seen.add(keys)
+            database_id = chart.datasource.database_id if chart.datasource else None
+            if database_id not in semaphores:
+                semaphores[database_id] = threading.BoundedSemaphore(
+                    get_database_limit(chart)
+                )
+            jobs[database_id].append((database_id, task))
+
+    def warm_up(job: tuple[int | None, CacheWarmupTask]) -> CacheWarmupResult:
+        database_id, task = job
+        chart_id = task["payload"]["chart_id"]
+        dashboard_id = task["payload"].get("dashboard_id")
+        with app.app_context():
+            user = security_manager.get_user_by_username(task["username"])
+            with semaphores[database_id], override_user(user):
+                start = time.perf_counter()
+                try:
+                    result = ChartWarmUpCacheCommand(
+                        chart_id,
+                        dashboard_id,
+                        None,
+                        task["payload"].get("query_context"),
+                    ).run()
+                    status, error = result["viz_status"], result["viz_error"]
+                except Exception as ex:  # pylint: disable=broad-except
+                    status, error = None, str(ex)
+                duration = time.perf_counter() - start
+
+        stats_logger.timing("cache_warmup.chart", duration)
+        logger.info(
+            "Warmed up chart %s in %.2f s, status: %s", chart_id, duration, status
+        )
+        return {
+            "chart_id": chart_id,
+            "dashboard_id": dashboard_id,
+            "status": status,
+            "error": error,
+            "duration": duration,
+        }
+
+    interleaved = [
+        job for job in chain.from_iterable(zip_longest(*jobs.values())) if job
+    ]
+    with ThreadPoolExecutor(max_workers=config["max_workers"]) as executor:
+        results.extend(executor.map(warm_up, interleaved))
+
+    return results
+
+
 @celery_app.task(name="cache-warmup")
 def cache_warmup(
     strategy_name: str, *args: Any, **kwargs: Any
-) -> Union[dict[str, list[str]], str]:
+) -> Union[dict[str, list[str]], list[CacheWarmupResult], str]:
     """
     Warm up cache.
 
@@ -307,6 +570,9 @@ def cache_warmup(
         logger.exception(message)
         return message
 
+    if current_app.config["CACHE_WARMUP_IN_PROCESS"]["enabled"]:
+        return warm_up_charts(strategy.get_tasks())
+
     results: dict[str, list[str]] = {"scheduled": [], "errors": []}
     for task in strategy.get_tasks():
         username = task["username"]
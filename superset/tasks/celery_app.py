@@ -20,9 +20,10 @@ This is the main entrypoint used by Celery workers. As such,
 it needs to call create_app() in order to initialize things properly
 """
 
+import logging
 from typing import Any
 
-from celery.signals import task_postrun, worker_process_init
+from celery.signals import task_postrun, worker_process_init, worker_process_shutdown
 
 # Superset framework imports
 from superset import create_app
@@ -39,6 +40,8 @@ from . import cache, scheduler
 # Export the celery app globally for Celery (as run on the cmd line) to find
 app = celery_app
 
+logger = logging.getLogger(__name__)
+
 
 @worker_process_init.connect
 def reset_db_connection_pool(**kwargs: Any) -> None:  # pylint: disable=unused-argument
@@ -47,6 +50,29 @@ def reset_db_connection_pool(**kwargs: Any) -> None:  # pylint: disable=unused-a
         db.engine.dispose()
 
 
+@worker_process_init.connect
+def warm_webdriver_pool(**kwargs: Any) -> None:  # pylint: disable=unused-argument
+    # pylint: disable=import-outside-toplevel
+    from superset.utils.webdriver import webdriver_pool, WebDriverSelenium
+
+    with flask_app.app_context():
+        if webdriver_pool.enabled and flask_app.config["WEBDRIVER_POOL"]["warm_size"]:
+            try:
+                webdriver_pool.warm(
+                    WebDriverSelenium(flask_app.config["WEBDRIVER_TYPE"])
+                )
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Failed to warm up the webdriver pool")
+
+
+@worker_process_shutdown.connect
+def clear_webdriver_pool(**kwargs: Any) -> None:  # pylint: disable=unused-argument
+    # pylint: disable=import-outside-toplevel
+    from superset.utils.webdriver import webdriver_pool
+
+    webdriver_pool.clear()
+
+
 @task_postrun.connect
 def teardown(  # pylint: disable=unused-argument
     retval: Any,
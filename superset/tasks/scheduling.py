@@ -0,0 +1,244 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Scheduling of Celery tasks by class.
+
+Tasks are grouped in classes: interactive chart loads, SQL Lab queries and batch work
+such as reports, thumbnails and cache warmups. Each class is routed to its own queue, so
+workers can be dedicated to interactive work and never be starved by batch work, the
+number of tasks of a class running at the same time for a single user can be capped,
+and the queue depth and wait time of each class are reported to the stats logger.
+
+Running tasks hold leases in Redis, renewed while they run, so the slots of tasks whose
+worker crashed are released after `lease_timeout` seconds.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Iterator, TYPE_CHECKING
+
+from celery.signals import before_task_publish
+
+from superset.async_events.async_query_manager import (
+    get_cache_backend,
+    UnsupportedCacheBackendError,
+)
+from superset.utils.admission_control import Leases
+from superset.utils.backports import StrEnum
+from superset.utils.core import get_user_id
+
+if TYPE_CHECKING:
+    from celery import Task
+    from flask import Flask
+
+logger = logging.getLogger(__name__)
+
+USER_ID_HEADER = "superset_user_id"
+PUBLISHED_AT_HEADER = "superset_published_at"
+
+
+class TaskClass(StrEnum):
+    INTERACTIVE = "interactive"
+    SQLLAB = "sqllab"
+    BATCH = "batch"
+
+
+TASK_CLASSES: dict[str, TaskClass] = {
+    "load_chart_data_into_cache": TaskClass.INTERACTIVE,
+    "load_chart_data_batch_into_cache": TaskClass.INTERACTIVE,
+    "load_explore_json_into_cache": TaskClass.INTERACTIVE,
+    "sql_lab.get_sql_results": TaskClass.SQLLAB,
+    "reports.scheduler": TaskClass.BATCH,
+    "reports.execute": TaskClass.BATCH,
+    "cache_chart_thumbnail": TaskClass.BATCH,
+    "cache_dashboard_thumbnail": TaskClass.BATCH,
+    "cache_dashboard_screenshot": TaskClass.BATCH,
+    "cache-warmup": TaskClass.BATCH,
+    "fetch_url": TaskClass.BATCH,
+    "upload_csv_file": TaskClass.BATCH,
+}
+
+
+def _get_header(task: Task, name: str) -> Any:
+    return (task.request.headers or {}).get(name, getattr(task.request, name, None))
+
+
+def _is_shared_cache(cache_config: dict[str, Any]) -> bool:
+    """
+    Whether the cache is shared between processes, i.e. Redis or Memcached.
+    """
+    cache_type = str(cache_config.get("CACHE_TYPE") or "").rsplit(".", 1)[-1].lower()
+    return cache_type.startswith("redis") or "memcached" in cache_type
+
+
+class TaskScheduler:
+    """
+    Routes tasks to the queue of their class and admits them to run, see
+    CELERY_TASK_SCHEDULING. Queue depths are shared between processes through the
+    cache configured in CACHE_CONFIG, and are disabled when it isn't shared. Per user
+    caps are kept as leases in a Redis cache, and are disabled without one.
+    """
+
+    def __init__(self) -> None:
+        self._app: Flask | None = None
+        self._config: dict[str, Any] = {}
+        self._counters = False
+        self._leases: Leases | None = None
+
+    def init_app(self, app: Flask) -> None:
+        self._app = app
+        self._config = app.config["CELERY_TASK_SCHEDULING"]
+        if not self.enabled:
+            return
+
+        self._counters = _is_shared_cache(app.config["CACHE_CONFIG"])
+        if self._counters:
+            before_task_publish.connect(self.on_publish, weak=False)
+        else:
+            logger.warning(
+                "CELERY_TASK_SCHEDULING requires CACHE_CONFIG to be shared between "
+                "processes (Redis or Memcached), queue depths are disabled"
+            )
+
+        try:
+            cache_backend = get_cache_backend(
+                {
+                    "GLOBAL_ASYNC_QUERIES_CACHE_BACKEND": self._config["cache_backend"]
+                    or app.config["GLOBAL_ASYNC_QUERIES_CACHE_BACKEND"]
+                }
+            )
+        except UnsupportedCacheBackendError:
+            logger.warning(
+                "CELERY_TASK_SCHEDULING requires a Redis cache backend, per user caps "
+                "are disabled"
+            )
+        else:
+            self._leases = Leases(cache_backend, self._config["lease_timeout"])
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._config.get("enabled"))
+
+    @staticmethod
+    def _depth_key(task_class: TaskClass) -> str:
+        return f"superset_tasks_queued_{task_class}"
+
+    @staticmethod
+    def _running_key(task_class: TaskClass, user_id: Any) -> str:
+        return f"superset_tasks_running_{task_class}_{user_id}"
+
+    def route(
+        self,
+        name: str,
+        args: Any,
+        kwargs: Any,
+        options: dict[str, Any],
+        task: Task | None = None,
+        **kw: Any,
+    ) -> dict[str, Any] | None:
+        """
+        Celery router sending each task class to its own queue.
+        """
+        if not self.enabled or (task_class := TASK_CLASSES.get(name)) is None:
+            return None
+
+        route: dict[str, Any] = {"queue": f"{self._config['queue_prefix']}{task_class}"}
+        if (priority := self._config["priorities"].get(task_class)) is not None:
+            route["priority"] = priority
+        return route
+
+    def on_publish(
+        self,
+        sender: str | None = None,
+        headers: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        if headers is None or (task_class := TASK_CLASSES.get(sender or "")) is None:
+            return
+
+        # retried tasks keep the user of the original request
+        headers.setdefault(USER_ID_HEADER, get_user_id())
+        headers[PUBLISHED_AT_HEADER] = time.time()
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        with self._app.app_context():  # type: ignore
+            cache_manager.cache.cache.inc(self._depth_key(task_class))
+
+    @contextmanager
+    def admit(self, task: Task) -> Iterator[None]:
+        """
+        Admit a task to run, or retry it later when its user already runs as many
+        tasks of its class as allowed.
+        """
+        task_class = TASK_CLASSES.get(task.name)
+        if task_class is None:
+            yield
+            return
+
+        # every published task was counted in the queue depth, even when it then runs
+        # eagerly
+        if self._counters and (published_at := _get_header(task, PUBLISHED_AT_HEADER)):
+            # pylint: disable=import-outside-toplevel
+            from superset.extensions import cache_manager
+
+            stats_logger = self._app.config["STATS_LOGGER"]  # type: ignore
+            # the backend, which unlike the extension exposes dec
+            depth = cache_manager.cache.cache.dec(self._depth_key(task_class)) or 0
+            stats_logger.gauge(f"celery_tasks.{task_class}.queue_depth", max(depth, 0))
+            stats_logger.timing(
+                f"celery_tasks.{task_class}.queue_time", time.time() - published_at
+            )
+
+        user_id = _get_header(task, USER_ID_HEADER)
+        limit = self._config["user_concurrency"].get(task_class)
+        if (
+            task.request.called_directly
+            or task.request.is_eager
+            or self._leases is None
+            or user_id is None
+            or not limit
+        ):
+            yield
+            return
+
+        running_key = self._running_key(task_class, user_id)
+        token = task.request.id or uuid.uuid4().hex
+        if not self._leases.acquire(running_key, token, limit):
+            self._app.config["STATS_LOGGER"].incr(  # type: ignore
+                f"celery_tasks.{task_class}.deferred"
+            )
+            logger.info(
+                "User %s runs too many %s tasks, retrying task %s later",
+                user_id,
+                task_class,
+                task.request.id,
+            )
+            raise task.retry(
+                countdown=self._config["retry_delay"],
+                max_retries=self._config["max_retries"],
+            )
+
+        with self._leases.hold(running_key, token):
+            yield
+
+
+task_scheduler = TaskScheduler()
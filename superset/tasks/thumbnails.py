@@ -18,6 +18,7 @@
 """Utility functions used across Superset"""
 
 import logging
+from functools import partial
 from typing import cast, Optional
 
 from flask import current_app
@@ -26,6 +27,7 @@ from superset import security_manager, thumbnail_cache
 from superset.extensions import celery_app
 from superset.security.guest_token import GuestToken
 from superset.tasks.utils import get_executor
+from superset.thumbnails.digest import get_chart_data_digest, get_dashboard_data_digest
 from superset.utils.core import override_user
 from superset.utils.screenshots import ChartScreenshot, DashboardScreenshot
 from superset.utils.urls import get_url_path
@@ -67,6 +69,11 @@ def cache_chart_thumbnail(
             window_size=window_size,
             thumb_size=thumb_size,
             force=force,
+            data_digest=(
+                partial(get_chart_data_digest, chart)
+                if current_app.config["THUMBNAIL_SKIP_UNCHANGED_DATA"]
+                else None
+            ),
         )
     return None
 
@@ -105,6 +112,11 @@ def cache_dashboard_thumbnail(
             thumb_size=thumb_size,
             force=force,
             cache_key=cache_key,
+            data_digest=(
+                partial(get_dashboard_data_digest, dashboard)
+                if current_app.config["THUMBNAIL_SKIP_UNCHANGED_DATA"]
+                else None
+            ),
         )
 
 
@@ -0,0 +1,130 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Upload of CSV files to databases in Celery tasks, see CSV_UPLOAD_ASYNC.
+
+The file is saved to UPLOAD_FOLDER by the web server and read in chunks by the worker,
+which keeps the status and the number of rows uploaded of each job in a Redis cache
+shared by the web servers and the workers.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+from typing import Any, Optional
+
+from cachelib.base import BaseCache
+from flask import current_app
+from werkzeug.datastructures import FileStorage
+
+from superset.async_events.async_query_manager import get_cache_backend
+from superset.extensions import celery_app, security_manager
+from superset.utils.backports import StrEnum
+from superset.utils.core import override_user
+
+logger = logging.getLogger(__name__)
+
+
+class UploadStatus(StrEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCESS = "success"
+    FAILED = "failed"
+
+
+def _get_status_key(job_id: str) -> str:
+    return f"superset_upload_{job_id}"
+
+
+def _get_status_cache() -> BaseCache:
+    """
+    Return the cache keeping the status of the uploads, which must be shared by the web
+    servers and the workers, so only the Redis backends of GLOBAL_ASYNC_QUERIES are
+    supported.
+
+    :raises UnsupportedCacheBackendError: If no Redis cache is configured
+    """
+    if "superset_upload_status_cache" not in current_app.extensions:
+        cache_config = (
+            current_app.config["CSV_UPLOAD_ASYNC"]["cache_backend"]
+            or current_app.config["GLOBAL_ASYNC_QUERIES_CACHE_BACKEND"]
+        )
+        current_app.extensions["superset_upload_status_cache"] = get_cache_backend(
+            {"GLOBAL_ASYNC_QUERIES_CACHE_BACKEND": cache_config}
+        )
+    return current_app.extensions["superset_upload_status_cache"]
+
+
+def get_upload_status(job_id: str) -> Optional[dict[str, Any]]:
+    return _get_status_cache().get(_get_status_key(job_id))
+
+
+def set_upload_status(job_id: str, **status: Any) -> None:
+    cache = _get_status_cache()
+    key = _get_status_key(job_id)
+    cache.set(
+        key,
+        {**(cache.get(key) or {}), **status},
+        timeout=current_app.config["CSV_UPLOAD_ASYNC"]["status_timeout"],
+    )
+
+
+@celery_app.task(name="upload_csv_file")
+def upload_csv_file(  # pylint: disable=too-many-arguments
+    job_id: str,
+    user_id: int,
+    database_id: int,
+    table_name: str,
+    schema: Optional[str],
+    file_path: str,
+    options: dict[str, Any],
+) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.commands.database.uploaders.base import UploadCommand
+    from superset.commands.database.uploaders.csv_reader import CSVReader
+
+    def on_progress(rows: int) -> None:
+        set_upload_status(job_id, rows=rows)
+
+    set_upload_status(job_id, status=UploadStatus.RUNNING)
+    try:
+        with (
+            override_user(security_manager.get_user_by_id(user_id)),
+            open(file_path, "rb") as stream,
+        ):
+            UploadCommand(
+                database_id,
+                table_name,
+                FileStorage(stream, os.path.basename(file_path)),
+                schema,
+                CSVReader(options),  # type: ignore
+                on_progress=on_progress,
+            ).run()
+    except Exception as ex:  # pylint: disable=broad-except
+        logger.warning("Upload %s failed", job_id, exc_info=True)
+        set_upload_status(
+            job_id,
+            status=UploadStatus.FAILED,
+            error=ex.message if getattr(ex, "message", None) else str(ex),  # type: ignore
+        )
+    else:
+        set_upload_status(job_id, status=UploadStatus.SUCCESS)
+    finally:
+        with contextlib.suppress(OSError):
+            os.remove(file_path)
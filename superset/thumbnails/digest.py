@@ -27,7 +27,7 @@ from superset.tasks.exceptions import ExecutorNotFoundError
 from superset.tasks.types import ExecutorType
 from superset.tasks.utils import get_current_user, get_executor
 from superset.utils.core import override_user
-from superset.utils.hashing import md5_sha_from_str
+from superset.utils.hashing import md5_sha_from_dataframe, md5_sha_from_str
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import BaseDatasource, SqlaTable
@@ -134,3 +134,63 @@ def get_chart_digest(chart: Slice) -> str | None:
     unique_string = _adjust_string_with_rls(unique_string, [chart.datasource], executor)
 
     return md5_sha_from_str(unique_string)
+
+
+def _get_chart_results_string(chart: Slice) -> str | None:
+    """
+    Return a string made out of the cache keys of the chart queries and a hash of
+    their cached results, or None if any result isn't cached.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.extensions import cache_manager
+
+    unique_string = ""
+    try:
+        if not (query_context := chart.get_query_context()):
+            return None
+        for query_obj in query_context.queries:
+            query_obj.validate()
+            cache_key = query_context.query_cache_key(query_obj)
+            cache_value = cache_manager.data_cache.get(cache_key) if cache_key else None
+            if not cache_value:
+                return None
+            df_hash = md5_sha_from_dataframe(cache_value["df"])
+            unique_string += f"{cache_key}\t{df_hash}\n"
+    except Exception:  # pylint: disable=broad-except
+        logger.warning(
+            "Failed to get the cached results of chart %s", chart.id, exc_info=True
+        )
+        return None
+
+    return unique_string
+
+
+def get_chart_data_digest(chart: Slice) -> str | None:
+    """
+    Return a digest of the chart metadata and of the data it displays, based on the
+    cached results of its queries. When a result isn't cached there's no cheap way to
+    tell whether the data changed, and None is returned.
+
+    Needs to be called as the user the chart is rendered for, as the query cache keys
+    depend on the row level security filters.
+    """
+    if not (digest := get_chart_digest(chart)):
+        return None
+    if (results := _get_chart_results_string(chart)) is None:
+        return None
+    return md5_sha_from_str(f"{digest}\n{results}")
+
+
+def get_dashboard_data_digest(dashboard: Dashboard) -> str | None:
+    """
+    Return a digest of the dashboard metadata and of the data displayed by all of its
+    charts, or None when the data of a chart isn't cached.
+    """
+    if not (digest := get_dashboard_digest(dashboard)):
+        return None
+    unique_string = digest
+    for chart in sorted(dashboard.slices, key=lambda chart: chart.id):
+        if (results := _get_chart_results_string(chart)) is None:
+            return None
+        unique_string += f"\n{chart.id}\n{results}"
+    return md5_sha_from_str(unique_string)
@@ -0,0 +1,232 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Admission control of the queries sent to each database.
+
+Every connection opened to run queries takes a slot of its database, and waits for one
+to be released when the database already has as many queries in flight as allowed.
+Slots are leases stored in a Redis sorted set per database, scored by their expiry, so
+they are shared by all the web servers and workers. Leases are short and renewed by a
+heartbeat while the connection is held, so the slots of a crashed process are quickly
+reclaimed.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, cast, Iterator, TYPE_CHECKING
+
+from flask_babel import gettext as _
+
+from superset.async_events.async_query_manager import get_cache_backend
+from superset.errors import ErrorLevel, SupersetErrorType
+from superset.exceptions import SupersetTimeoutException
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+    from superset.models.core import Database
+
+logger = logging.getLogger(__name__)
+
+# drop the expired leases, then take a slot if there's one left
+ACQUIRE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local expiry = tonumber(ARGV[2])
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now)
+if redis.call("ZCARD", KEYS[1]) < tonumber(ARGV[3]) then
+    redis.call("ZADD", KEYS[1], expiry, ARGV[4])
+    redis.call("EXPIRE", KEYS[1], math.ceil(expiry - now))
+    return 1
+end
+return 0
+"""
+
+RELEASE_SCRIPT = """
+return redis.call("ZREM", KEYS[1], ARGV[1])
+"""
+
+# extend a lease unless it already expired
+RENEW_SCRIPT = """
+if redis.call("ZSCORE", KEYS[1], ARGV[1]) then
+    redis.call("ZADD", KEYS[1], ARGV[2], ARGV[1])
+    redis.call("EXPIRE", KEYS[1], math.ceil(tonumber(ARGV[3])))
+    return 1
+end
+return 0
+"""
+
+
+class Leases:
+    """
+    Leases stored in Redis sorted sets, scored by their expiry, capping how many are
+    held at the same time under each key. Leases are short and renewed by a heartbeat
+    while held, so the leases of a crashed process are quickly reclaimed.
+    """
+
+    def __init__(self, cache_backend: Any, lease_timeout: float) -> None:
+        self._lease_timeout = lease_timeout
+        self._acquire_script = cache_backend.register_script(ACQUIRE_SCRIPT)
+        self._release_script = cache_backend.register_script(RELEASE_SCRIPT)
+        self._renew_script = cache_backend.register_script(RENEW_SCRIPT)
+
+    def acquire(self, key: str, token: str, limit: int) -> bool:
+        """
+        Take a lease under the key, unless `limit` leases are already held.
+        """
+        now = time.time()
+        return bool(
+            self._acquire_script(
+                keys=[key],
+                args=[now, now + self._lease_timeout, limit, token],
+            )
+        )
+
+    @contextmanager
+    def hold(self, key: str, token: str) -> Iterator[None]:
+        """
+        Renew an acquired lease while the block runs, and release it afterwards.
+        """
+        stop = threading.Event()
+        threading.Thread(
+            target=self._heartbeat,
+            args=(key, token, stop),
+            name=f"lease-{key}",
+            daemon=True,
+        ).start()
+        try:
+            yield
+        finally:
+            stop.set()
+            try:
+                self._release_script(keys=[key], args=[token])
+            except Exception:  # pylint: disable=broad-except
+                # the lease expires on its own
+                logger.warning("Failed releasing a lease of %s", key, exc_info=True)
+
+    def _heartbeat(self, key: str, token: str, stop: threading.Event) -> None:
+        """
+        Renew a lease until it's released, a few times per `lease_timeout`.
+        """
+        while not stop.wait(self._lease_timeout / 3):
+            try:
+                renewed = self._renew_script(
+                    keys=[key],
+                    args=[
+                        token,
+                        time.time() + self._lease_timeout,
+                        self._lease_timeout,
+                    ],
+                )
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Failed renewing a lease of %s", key, exc_info=True)
+                continue
+            if not renewed:
+                logger.warning("A lease of %s expired while it was held", key)
+                return
+
+
+class DatabaseAdmissionController:
+    """
+    Caps the number of queries in flight per database, see DATABASE_ADMISSION_CONTROL.
+    The cap of a database can be overridden with `max_concurrent_queries` in its extra.
+    """
+
+    def __init__(self) -> None:
+        self._config: dict[str, Any] = {}
+        self._stats_logger: Any = None
+        self._leases: Leases | None = None
+        # databases for which the current thread already holds a slot
+        self._local = threading.local()
+
+    def init_app(self, app: Flask) -> None:
+        self._config = app.config["DATABASE_ADMISSION_CONTROL"]
+        self._stats_logger = app.config["STATS_LOGGER"]
+        if not self.enabled:
+            return
+
+        cache_backend = get_cache_backend(
+            {
+                "GLOBAL_ASYNC_QUERIES_CACHE_BACKEND": self._config["cache_backend"]
+                or app.config["GLOBAL_ASYNC_QUERIES_CACHE_BACKEND"]
+            }
+        )
+        self._leases = Leases(cache_backend, self._config["lease_timeout"])
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._config.get("enabled"))
+
+    def get_limit(self, database: Database) -> int:
+        return int(
+            database.get_extra().get(
+                "max_concurrent_queries", self._config["max_in_flight"]
+            )
+        )
+
+    @contextmanager
+    def admit(self, database: Database) -> Iterator[None]:
+        """
+        Hold a slot of the database while the block runs, waiting up to
+        `queue_timeout` seconds for one to be released.
+
+        :raises SupersetTimeoutException: If no slot was released in time
+        """
+        held: set[int] = self._local.__dict__.setdefault("held", set())
+        if (
+            not self.enabled
+            or database.id in held
+            or (limit := self.get_limit(database)) <= 0
+        ):
+            yield
+            return
+
+        key = f"{self._config['key_prefix']}{database.id}"
+        token = uuid.uuid4().hex
+        queue_timeout = self._config["queue_timeout"]
+        start = time.monotonic()
+        leases = cast(Leases, self._leases)
+        while True:
+            if leases.acquire(key, token, limit):
+                break
+            if time.monotonic() - start >= queue_timeout:
+                self._stats_logger.incr(f"database_admission.{database.id}.rejected")
+                raise SupersetTimeoutException(
+                    error_type=SupersetErrorType.BACKEND_TIMEOUT_ERROR,
+                    message=_(
+                        "The database %(name)s is running too many queries, please "
+                        "try again later",
+                        name=database.database_name,
+                    ),
+                    level=ErrorLevel.ERROR,
+                    extra={"timeout": queue_timeout, "database_id": database.id},
+                )
+            time.sleep(self._config["poll_interval"])
+
+        self._stats_logger.timing(
+            f"database_admission.{database.id}.wait_time", time.monotonic() - start
+        )
+        held.add(database.id)
+        try:
+            with leases.hold(key, token):
+                yield
+        finally:
+            held.discard(database.id)
@@ -18,17 +18,25 @@ from __future__ import annotations
 
 import inspect
 import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
 from datetime import datetime, timedelta
 from functools import wraps
 from typing import Any, Callable
+from uuid import uuid4
 
-from flask import current_app as app, request
+from flask import current_app as app, g, has_app_context, request
 from flask_caching import Cache
 from flask_caching.backends import NullCache
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 from werkzeug.wrappers import Response
 
 from superset import db
-from superset.constants import CACHE_DISABLED_TIMEOUT
+from superset.constants import CACHE_DISABLED_TIMEOUT, LRU_CACHE_MAX_SIZE
 from superset.extensions import cache_manager
 from superset.models.cache import CacheKey
 from superset.utils.hashing import md5_sha_from_dict
@@ -69,12 +77,7 @@ def set_and_log_cache(
         stats_logger.incr("set_cache_key")
 
         if datasource_uid and app.config["STORE_CACHE_KEYS_IN_METADATA_DB"]:
-            ck = CacheKey(
-                cache_key=cache_key,
-                cache_timeout=cache_timeout,
-                datasource_uid=datasource_uid,
-            )
-            db.session.add(ck)
+            log_cache_key(cache_key, timeout, datasource_uid)
     except Exception as ex:  # pylint: disable=broad-except
         # cache.set call can fail if the backend is down or if
         # the key is too large or whatever other reasons
@@ -82,6 +85,208 @@ def set_and_log_cache(
         logger.exception(ex)
 
 
+def log_cache_key(cache_key: str, cache_timeout: int, datasource_uid: str) -> None:
+    """
+    Record a cache key of a datasource in the `cache_keys` table, refreshing its record
+    when it's already there, and prune the records of the datasource whose keys have
+    expired.
+
+    The records are written in their own transaction, as the callers only read the
+    metadata database and don't commit.
+    """
+    table = CacheKey.__table__  # pylint: disable=no-member
+    now = datetime.now()
+    with db.engine.begin() as connection:
+        updated = connection.execute(
+            table.update()
+            .where(
+                table.c.datasource_uid == datasource_uid,
+                table.c.cache_key == cache_key,
+            )
+            .values(cache_timeout=cache_timeout, created_on=now)
+        )
+        if not updated.rowcount:
+            connection.execute(
+                table.insert().values(
+                    cache_key=cache_key,
+                    cache_timeout=cache_timeout,
+                    datasource_uid=datasource_uid,
+                    created_on=now,
+                )
+            )
+
+        # records that lasted longer than this key's timeout have expired if their own
+        # timeout isn't longer; the others are pruned by keys with longer timeouts
+        if cache_timeout > 0:
+            connection.execute(
+                table.delete().where(
+                    table.c.datasource_uid == datasource_uid,
+                    table.c.cache_timeout > 0,
+                    table.c.cache_timeout <= cache_timeout,
+                    table.c.created_on < now - timedelta(seconds=cache_timeout),
+                )
+            )
+
+
+class VersionedCache:
+    """
+    A two-level cache for small values derived from the metadata database.
+
+    Entries live in a bounded in-process LRU and in the shared ``CACHE_CONFIG``
+    backend. Every key is prefixed with a version stamp kept in the shared backend, so
+    calling ``invalidate`` evicts all entries in every worker at once. The stamp is
+    read at most once per application context.
+
+    Because invalidation relies on the shared backend, the cache is bypassed entirely
+    when ``CACHE_CONFIG`` is a ``NullCache``; otherwise a worker could keep serving
+    values that were invalidated in another process.
+
+    :param namespace: prefix used for the version stamp and the shared cache keys
+    :param timeout_config_key: config key holding the entry timeout in seconds; a
+        value of ``CACHE_DISABLED_TIMEOUT`` disables the cache
+    :param maxsize: maximum number of entries kept in process
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        timeout_config_key: str,
+        maxsize: int = LRU_CACHE_MAX_SIZE,
+    ) -> None:
+        self.namespace = namespace
+        self.timeout_config_key = timeout_config_key
+        self.maxsize = maxsize
+        self._local: OrderedDict[tuple[str, Hashable], tuple[float, Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def _version_key(self) -> str:
+        return f"{self.namespace}:version"
+
+    @property
+    def _g_attribute(self) -> str:
+        return f"_versioned_cache_{self.namespace}"
+
+    @property
+    def timeout(self) -> int:
+        return app.config[self.timeout_config_key]
+
+    @property
+    def enabled(self) -> bool:
+        return self.timeout != CACHE_DISABLED_TIMEOUT and not isinstance(
+            cache_manager.cache.cache, NullCache
+        )
+
+    def _get_version(self) -> str:
+        if has_app_context() and (version := getattr(g, self._g_attribute, None)):
+            return version
+
+        version = cache_manager.cache.get(self._version_key)
+        if version is None:
+            version = uuid4().hex
+            # ``add`` is a no-op if another worker set the stamp concurrently
+            if not cache_manager.cache.add(self._version_key, version, timeout=0):
+                version = cache_manager.cache.get(self._version_key) or version
+
+        if has_app_context():
+            setattr(g, self._g_attribute, version)
+        return version
+
+    def get_or_set(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for ``key``, computing and storing it on a miss.
+
+        :param key: a hashable key; its ``repr`` is used for the shared cache key
+        :param func: callable computing the value, must return a picklable value
+        :returns: the cached or computed value
+        """
+        if not self.enabled:
+            return func()
+
+        try:
+            version = self._get_version()
+        except Exception:  # pylint: disable=broad-except
+            # without a version stamp entries can't be invalidated, so don't cache
+            logger.warning("Could not read version of cache %s", self.namespace)
+            return func()
+
+        stats_logger = app.config["STATS_LOGGER"]
+        local_key = (version, key)
+        now = time.monotonic()
+
+        with self._lock:
+            if (entry := self._local.get(local_key)) and entry[0] > now:
+                self._local.move_to_end(local_key)
+                stats_logger.incr(f"{self.namespace}_cache_hit")
+                return entry[1]
+
+        shared_key = f"{self.namespace}:{version}:{key!r}"
+        try:
+            value = cache_manager.cache.get(shared_key)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Could not read key %s from cache", shared_key)
+            value = None
+
+        if value is None:
+            stats_logger.incr(f"{self.namespace}_cache_miss")
+            value = func()
+            try:
+                cache_manager.cache.set(shared_key, value, timeout=self.timeout)
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Could not cache key %s", shared_key)
+        else:
+            stats_logger.incr(f"{self.namespace}_cache_hit")
+
+        expires = now + self.timeout if self.timeout else math.inf
+        with self._lock:
+            self._local[local_key] = (expires, value)
+            self._local.move_to_end(local_key)
+            while len(self._local) > self.maxsize:
+                self._local.popitem(last=False)
+
+        return value
+
+    def invalidate(self, session: Session | None = None) -> None:
+        """
+        Evict every entry, in this process and in all other workers.
+
+        :param session: the session with the pending changes the entries derive from.
+            As other workers may refill the cache with the data read before these are
+            committed, the entries are evicted again once the session commits
+        """
+        if session is not None:
+            session.info.setdefault(PENDING_INVALIDATIONS, set()).add(self)
+
+        version = uuid4().hex
+        with self._lock:
+            self._local.clear()
+
+        if not has_app_context():
+            logger.warning(
+                "Could not bump version of cache %s outside of an app context",
+                self.namespace,
+            )
+            return
+
+        setattr(g, self._g_attribute, version)
+        try:
+            cache_manager.cache.set(self._version_key, version, timeout=0)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Could not bump version of cache %s", self.namespace)
+
+
+# the versioned caches to invalidate once a session commits
+PENDING_INVALIDATIONS = "pending_cache_invalidations"
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_after_commit(session: Session) -> None:
+    for cache in session.info.pop(PENDING_INVALIDATIONS, ()):
+        cache.invalidate()
+
+
 # If a user sets `max_age` to 0, for long the browser should cache the
 # resource? Flask-Caching will cache forever, but for the HTTP header we need
 # to specify a "far future" date.
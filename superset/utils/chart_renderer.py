@@ -0,0 +1,180 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Render simple charts to PNG on the server, without a browser.
+
+Only a handful of viz types are supported, and the output doesn't try to match the
+frontend pixel for pixel: it's meant for reports where skipping the webdriver matters
+more than the exact look of the chart.
+"""
+
+from __future__ import annotations
+
+import logging
+from io import BytesIO
+from typing import Any, Callable, TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+from flask import current_app as app
+
+from superset.utils.core import override_user
+from superset.utils.webdriver import WindowSize
+
+if TYPE_CHECKING:
+    from flask_appbuilder.security.sqla.models import User
+
+    from superset.models.slice import Slice
+
+logger = logging.getLogger(__name__)
+
+try:
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+except ModuleNotFoundError:
+    Figure = None  # type: ignore
+    logger.info("No matplotlib installation found")
+
+DPI = 100
+TABLE_MAX_ROWS = 50
+
+
+def _render_table(figure: Figure, df: pd.DataFrame) -> None:
+    axes = figure.add_subplot()
+    axes.axis("off")
+    rows = df.head(TABLE_MAX_ROWS)
+    table = axes.table(
+        cellText=rows.astype(str).values,
+        colLabels=[str(column) for column in rows.columns],
+        cellLoc="left",
+        loc="upper center",
+    )
+    table.auto_set_font_size(False)
+    table.set_fontsize(9)
+
+
+def _render_big_number(figure: Figure, df: pd.DataFrame) -> None:
+    # with a trendline the first column holds the timestamps
+    values = df.iloc[:, -1].dropna()
+    value = values.iloc[-1] if len(values) else None
+    text = "N/A" if value is None else f"{value:,.6g}"
+    figure.text(0.5, 0.6, text, ha="center", va="center", fontsize=48)
+
+    if len(df.columns) > 1:
+        axes = figure.add_axes((0.05, 0.05, 0.9, 0.3))
+        axes.plot(df.iloc[:, 0], df.iloc[:, -1])
+        axes.axis("off")
+
+
+def _render_timeseries_line(figure: Figure, df: pd.DataFrame) -> None:
+    series = df.set_index(df.columns[0])
+    axes = figure.add_subplot()
+    for column in series.columns:
+        axes.plot(series.index, series[column], label=str(column))
+    if len(series.columns) > 1:
+        axes.legend()
+    figure.autofmt_xdate()
+
+
+def _render_timeseries_bar(figure: Figure, df: pd.DataFrame) -> None:
+    series = df.set_index(df.columns[0])
+    axes = figure.add_subplot()
+    positions = np.arange(len(series))
+    width = 0.8 / max(len(series.columns), 1)
+    for i, column in enumerate(series.columns):
+        axes.bar(positions + i * width, series[column], width, label=str(column))
+    axes.set_xticks(
+        positions + width * (len(series.columns) - 1) / 2,
+        labels=[str(label) for label in series.index],
+    )
+    if len(series.columns) > 1:
+        axes.legend()
+    figure.autofmt_xdate()
+
+
+RENDERERS: dict[str, Callable[[Figure, pd.DataFrame], None]] = {
+    "table": _render_table,
+    "big_number_total": _render_big_number,
+    "big_number": _render_big_number,
+    "echarts_timeseries_line": _render_timeseries_line,
+    "echarts_timeseries_bar": _render_timeseries_bar,
+}
+
+
+def can_render_chart(chart: Slice) -> bool:
+    """
+    Whether a chart can be rendered on the server: matplotlib needs to be installed,
+    the viz type supported and enabled, and the chart saved with a query context.
+    """
+    return (
+        Figure is not None
+        and chart.viz_type in RENDERERS
+        and chart.viz_type
+        in app.config["ALERT_REPORTS_SERVER_SIDE_RENDERING_VIZ_TYPES"]
+        and bool(chart.query_context)
+    )
+
+
+def render_dataframe(
+    viz_type: str,
+    df: pd.DataFrame,
+    window_size: WindowSize,
+    title: str | None = None,
+) -> bytes:
+    """
+    Render a DataFrame as a PNG image.
+
+    :param viz_type: one of the supported viz types
+    :param df: the chart data, with the x axis as the first column for timeseries
+    :param window_size: the size of the image in pixels
+    :param title: an optional title drawn above the chart
+    :return: the PNG image
+    """
+    width, height = window_size
+    figure = Figure(figsize=(width / DPI, height / DPI), dpi=DPI)
+    FigureCanvasAgg(figure)
+    if title:
+        figure.suptitle(title)
+    RENDERERS[viz_type](figure, df)
+
+    buffer = BytesIO()
+    figure.savefig(buffer, format="png")
+    return buffer.getvalue()
+
+
+def get_chart_dataframe(chart: Slice) -> pd.DataFrame:
+    # pylint: disable=import-outside-toplevel
+    from superset.commands.chart.data.get_data_command import ChartDataCommand
+
+    query_context = chart.get_query_context()
+    if query_context is None:
+        raise ValueError(f"Chart {chart.id} has no query context")
+
+    command = ChartDataCommand(query_context)
+    command.validate()
+    result: dict[str, Any] = command.run()
+    query = result["queries"][0]
+    return pd.DataFrame(query["data"], columns=query["colnames"])
+
+
+def render_chart(chart: Slice, user: User, window_size: WindowSize) -> bytes:
+    """
+    Query the data of a chart as the given user and render it as a PNG image.
+    """
+    with override_user(user):
+        df = get_chart_dataframe(chart)
+    return render_dataframe(chart.viz_type, df, window_size, title=chart.slice_name)
@@ -17,6 +17,8 @@
 import hashlib
 from typing import Any, Callable, Optional
 
+import pandas as pd
+
 from superset.utils import json
 
 
@@ -34,3 +36,9 @@ def md5_sha_from_dict(
     )
 
     return md5_sha_from_str(json_data)
+
+
+def md5_sha_from_dataframe(df: pd.DataFrame, index: bool = True) -> str:
+    return hashlib.md5(  # noqa: S324
+        pd.util.hash_pandas_object(df, index=index).values.tobytes()
+    ).hexdigest()
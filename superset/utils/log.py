@@ -16,17 +16,21 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
 import functools
 import inspect
 import logging
+import os
+import queue
 import textwrap
+import threading
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Any, Callable, cast, Literal, TYPE_CHECKING
 
-from flask import g, has_request_context, request
+from flask import current_app, Flask, g, has_request_context, request
 from flask_appbuilder.const import API_URI_RIS_KEY
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -35,7 +39,7 @@ from superset.utils import json
 from superset.utils.core import get_user_id, LoggerLevel, to_int
 
 if TYPE_CHECKING:
-    pass
+    from superset.models.core import Log
 
 logger = logging.getLogger(__name__)
 
@@ -381,7 +385,6 @@ class DBEventLogger(AbstractEventLogger):
         **kwargs: Any,
     ) -> None:
         # pylint: disable=import-outside-toplevel
-        from superset import db
         from superset.models.core import Log
 
         records = kwargs.get("records", [])
@@ -402,6 +405,15 @@ class DBEventLogger(AbstractEventLogger):
                 user_id=user_id,
             )
             logs.append(log)
+        self.save_logs(logs)
+
+    def save_logs(self, logs: list[Log]) -> None:
+        """
+        Persist the logs to the metadata database.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+
         try:
             db.session.bulk_save_objects(logs)
             db.session.commit()  # pylint: disable=consider-using-transaction
@@ -410,6 +422,110 @@ class DBEventLogger(AbstractEventLogger):
             logging.exception(ex)
 
 
+class BufferedDBEventLogger(DBEventLogger):
+    """
+    Event logger that queues logs in memory and commits them to Superset DB in batches
+    from a background thread, instead of in the request that logged them.
+
+    The queue holds at most `max_queue_size` logs; logs are dropped when it's full, or
+    when saving a batch fails, and counted in `dropped` and the `event_logger.dropped`
+    gauge. Queued logs are saved when the process exits.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 5,
+    ) -> None:
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: queue.Queue[Log] = queue.Queue(maxsize=max_queue_size)
+        self._app: Flask | None = None
+        self._writer: threading.Thread | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        atexit.register(self.shutdown)
+
+    def save_logs(self, logs: list[Log]) -> None:
+        self._start_writer()
+        for log in logs:
+            # stamped now rather than when the batch is inserted, maybe seconds later
+            log.dttm = datetime.utcnow()
+            try:
+                self._queue.put_nowait(log)
+            except queue.Full:
+                self._drop(1)
+
+    def _drop(self, count: int) -> None:
+        with self._lock:
+            self.dropped += count
+            dropped = self.dropped
+        stats_logger_manager.instance.gauge("event_logger.dropped", dropped)
+
+    def _start_writer(self) -> None:
+        # the thread doesn't survive forking, eg gunicorn workers of a preloaded app
+        if self._writer and self._writer.is_alive() and self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._writer and self._writer.is_alive() and self._pid == os.getpid():
+                return
+            self._app = current_app._get_current_object()  # pylint: disable=protected-access
+            self._pid = os.getpid()
+            self._stopped.clear()
+            self._writer = threading.Thread(
+                target=self._write,
+                name="event-logger",
+                daemon=True,
+            )
+            self._writer.start()
+
+    def _write(self) -> None:
+        while not self._stopped.is_set():
+            self._stopped.wait(self.flush_interval)
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Save the queued logs, in batches of `batch_size`.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+
+        if self._app is None:
+            return
+
+        while not self._queue.empty():
+            batch: list[Log] = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            with self._app.app_context():
+                try:
+                    db.session.bulk_save_objects(batch)
+                    db.session.commit()  # pylint: disable=consider-using-transaction
+                except SQLAlchemyError:
+                    db.session.rollback()
+                    logger.exception("BufferedDBEventLogger failed to log event(s)")
+                    self._drop(len(batch))
+
+    def shutdown(self) -> None:
+        """
+        Stop the background thread and save the logs left in the queue.
+        """
+        self._stopped.set()
+        if self._writer and self._writer.is_alive() and self._pid == os.getpid():
+            self._writer.join(timeout=self.flush_interval)
+        self.flush()
+
+
 class StdOutEventLogger(AbstractEventLogger):
     """Event logger that prints to stdout for debugging purposes"""
 
@@ -0,0 +1,222 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Callable
+
+from flask_babel import gettext as _
+from pandas import DataFrame
+from pandas._typing import Level
+
+from superset.exceptions import InvalidPostProcessingError
+
+
+@dataclass
+class PostProcessingStep:
+    operation: str
+    options: dict[str, Any]
+    func: Callable[..., DataFrame]
+    # number of steps of the original list that were fused into this one
+    fused: int = 1
+
+
+@dataclass
+class PostProcessingStepStats:
+    operation: str
+    fused: int
+    duration_ms: float
+    rows: int
+    memory_bytes: int
+
+
+def _resolve_operation(operation: str | None) -> Callable[..., DataFrame]:
+    # pylint: disable=import-outside-toplevel
+    from superset.utils import pandas_postprocessing
+
+    if not operation:
+        raise InvalidPostProcessingError(
+            _("`operation` property of post processing object undefined")
+        )
+    func = getattr(pandas_postprocessing, operation, None)
+    if not callable(func) or isinstance(func, ModuleType):
+        raise InvalidPostProcessingError(
+            _(
+                "Unsupported post processing operation: %(operation)s",
+                operation=operation,
+            )
+        )
+    return func
+
+
+def _is_noop(step: PostProcessingStep) -> bool:
+    if step.operation == "rename":
+        return not step.options.get("columns")
+    if step.operation == "sort":
+        return not step.options.get("is_sort_index") and not step.options.get("by")
+    return False
+
+
+def _fused_rename(
+    df: DataFrame,
+    columns: dict[str, str | None],
+    renames: list[dict[str, str | None]],
+    level: Level | None = None,
+    inplace: bool = False,
+) -> DataFrame:
+    """
+    Apply fused renames at once, after validating each of them against the labels
+    left by the previous ones, as if they were applied one after the other.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.utils.pandas_postprocessing import rename
+
+    try:
+        labels = list(df.columns.get_level_values(level=level))
+    except (IndexError, KeyError) as err:
+        raise InvalidPostProcessingError from err
+
+    for mapping in renames:
+        if all(new_name in labels for new_name in mapping.values()):
+            raise InvalidPostProcessingError(_("Label already exists"))
+        labels = [mapping.get(label, label) for label in labels]
+
+    return rename(df, columns=columns, inplace=inplace, level=level)
+
+
+def _fuse_rename(
+    previous: PostProcessingStep, step: PostProcessingStep
+) -> PostProcessingStep | None:
+    """
+    Fuse two consecutive renames into a single one, when the second one doesn't
+    reference any of the labels introduced by the first one.
+    """
+    if previous.options.get("level") != step.options.get("level"):
+        return None
+
+    columns = previous.options["columns"]
+    other_columns = step.options["columns"]
+    if set(columns.values()) & set(other_columns) or set(columns) & set(other_columns):
+        return None
+
+    return PostProcessingStep(
+        operation="rename",
+        options={
+            **previous.options,
+            "columns": {**columns, **other_columns},
+            "renames": [*previous.options.get("renames", [columns]), other_columns],
+        },
+        func=_fused_rename,
+        fused=previous.fused + step.fused,
+    )
+
+
+FUSABLE_OPERATIONS: dict[
+    str,
+    Callable[[PostProcessingStep, PostProcessingStep], PostProcessingStep | None],
+] = {
+    "rename": _fuse_rename,
+}
+
+# operations that can modify a DataFrame owned by the pipeline instead of copying it
+INPLACE_OPERATIONS = {"rename"}
+
+
+class PostProcessingPipeline:
+    """
+    Plans and executes a list of post processing operations.
+
+    The whole list is validated before any operation runs, no-op steps are dropped and
+    compatible consecutive steps are fused. Once an operation has returned a new
+    DataFrame the pipeline owns it, so subsequent operations that support it are run
+    in place instead of copying the frame again. Timing and memory usage are recorded
+    per executed step in ``stats``.
+
+    :param post_processing: list of post processing objects, with the `operation`
+           and `options` keys
+    """
+
+    def __init__(self, post_processing: list[dict[str, Any]]) -> None:
+        self.steps = self.plan(post_processing)
+        self.stats: list[PostProcessingStepStats] = []
+
+    @staticmethod
+    def plan(post_processing: list[dict[str, Any]]) -> list[PostProcessingStep]:
+        """
+        Validate the post processing operations and build the execution plan.
+
+        :param post_processing: list of post processing objects
+        :return: the steps to execute
+        :raises InvalidPostProcessingError: If an operation is undefined or unsupported
+        """
+        steps: list[PostProcessingStep] = []
+        for post_process in post_processing:
+            operation = post_process.get("operation")
+            step = PostProcessingStep(
+                operation=operation,  # type: ignore
+                options=post_process.get("options", {}),
+                func=_resolve_operation(operation),
+            )
+            if _is_noop(step):
+                continue
+
+            if (
+                steps
+                and steps[-1].operation == step.operation
+                and (fuse := FUSABLE_OPERATIONS.get(step.operation))
+                and (fused := fuse(steps[-1], step))
+            ):
+                steps[-1] = fused
+                continue
+
+            steps.append(step)
+
+        return steps
+
+    def execute(self, df: DataFrame) -> DataFrame:
+        """
+        Apply the planned operations to a DataFrame.
+
+        :param df: DataFrame returned from the database
+        :return: the post processed DataFrame
+        """
+        self.stats = []
+        owned = False
+        for step in self.steps:
+            options = step.options
+            if owned and step.operation in INPLACE_OPERATIONS:
+                options = {**options, "inplace": True}
+
+            start = time.perf_counter()
+            result = step.func(df, **options)
+            duration_ms = (time.perf_counter() - start) * 1000
+
+            owned = owned or result is not df
+            df = result
+            self.stats.append(
+                PostProcessingStepStats(
+                    operation=step.operation,
+                    fused=step.fused,
+                    duration_ms=duration_ms,
+                    rows=len(df),
+                    memory_bytes=int(df.memory_usage(index=True).sum()),
+                )
+            )
+
+        return df
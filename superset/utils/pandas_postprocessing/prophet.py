@@ -15,17 +15,24 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
-from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Optional, Union
 
 import pandas as pd
+from flask import current_app, has_app_context
 from flask_babel import gettext as _
 from pandas import DataFrame
 
+from superset.constants import CACHE_DISABLED_TIMEOUT
 from superset.exceptions import InvalidPostProcessingError
 from superset.utils.core import DTTM_ALIAS
 from superset.utils.decorators import suppress_logging
+from superset.utils.hashing import md5_sha_from_dataframe
 from superset.utils.pandas_postprocessing.utils import PROPHET_TIME_GRAIN_MAP
 
+logger = logging.getLogger(__name__)
+
 
 def _prophet_parse_seasonality(
     input_value: Optional[Union[bool, int]],
@@ -40,17 +47,11 @@ def _prophet_parse_seasonality(
         return input_value
 
 
-def _prophet_fit_and_predict(  # pylint: disable=too-many-arguments
-    df: DataFrame,
-    confidence_interval: float,
-    yearly_seasonality: Union[bool, str, int],
-    weekly_seasonality: Union[bool, str, int],
-    daily_seasonality: Union[bool, str, int],
-    periods: int,
-    freq: str,
-) -> DataFrame:
+@lru_cache(maxsize=1)
+def _import_prophet() -> Any:
     """
-    Fit a prophet model and return a DataFrame with predicted results.
+    Import the `Prophet` model once, as silencing the `prophet` logger while doing it
+    isn't thread safe.
     """
     try:
         # `prophet` complains about `plotly` not being installed
@@ -63,7 +64,22 @@ def _prophet_fit_and_predict(  # pylint: disable=too-many-arguments
         prophet_logger.setLevel(logging.NOTSET)
     except ModuleNotFoundError as ex:
         raise InvalidPostProcessingError(_("`prophet` package not installed")) from ex
-    model = Prophet(
+    return Prophet
+
+
+def _prophet_fit_and_predict(  # pylint: disable=too-many-arguments
+    df: DataFrame,
+    confidence_interval: float,
+    yearly_seasonality: Union[bool, str, int],
+    weekly_seasonality: Union[bool, str, int],
+    daily_seasonality: Union[bool, str, int],
+    periods: int,
+    freq: str,
+) -> DataFrame:
+    """
+    Fit a prophet model and return a DataFrame with predicted results.
+    """
+    model = _import_prophet()(
         interval_width=confidence_interval,
         yearly_seasonality=yearly_seasonality,
         weekly_seasonality=weekly_seasonality,
@@ -77,6 +93,86 @@ def _prophet_fit_and_predict(  # pylint: disable=too-many-arguments
     return forecast.join(df.set_index("ds"), on="ds").set_index(["ds"])
 
 
+def _prophet_forecast_cache_key(df: DataFrame, **kwargs: Any) -> str:
+    """
+    Generate a cache key for the forecast of a series, made out of a hash of the
+    series data and the model and prediction parameters.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.utils.cache import generate_cache_key
+
+    series_hash = md5_sha_from_dataframe(df, index=False)
+    return generate_cache_key({"series": series_hash, **kwargs}, "prophet_")
+
+
+def _prophet_forecasts(
+    series: dict[str, DataFrame], **kwargs: Any
+) -> dict[str, DataFrame]:
+    """
+    Fit a prophet model for each series and return the predicted results.
+
+    Forecasts are cached in the data cache, keyed by the series data and the model
+    parameters, so unchanged series aren't fitted again when the underlying query is
+    rerun. The remaining series are fitted concurrently; the heavy lifting happens in
+    the Stan subprocess spawned for each fit, so threads are enough to run them in
+    parallel.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.extensions import cache_manager
+    from superset.utils.cache import set_and_log_cache
+
+    timeout = CACHE_DISABLED_TIMEOUT
+    max_workers = 1
+    if has_app_context():
+        timeout = current_app.config["PROPHET_FORECAST_CACHE_TIMEOUT"]
+        max_workers = current_app.config["PROPHET_FORECAST_MAX_WORKERS"]
+
+    forecasts: dict[str, DataFrame] = {}
+    cache_keys: dict[str, str] = {}
+    if timeout != CACHE_DISABLED_TIMEOUT:
+        for column, df in series.items():
+            cache_keys[column] = _prophet_forecast_cache_key(df, **kwargs)
+            try:
+                cache_value = cache_manager.data_cache.get(cache_keys[column])
+            except Exception:  # pylint: disable=broad-except
+                logger.warning(
+                    "Could not read cache key %s", cache_keys[column], exc_info=True
+                )
+                cache_value = None
+            if cache_value is not None:
+                forecasts[column] = cache_value["forecast"]
+
+    pending = [column for column in series if column not in forecasts]
+    if len(pending) > 1 and max_workers > 1:
+        # before the threads fit the models concurrently
+        _import_prophet()
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+            results = list(
+                pool.map(
+                    lambda column: _prophet_fit_and_predict(
+                        df=series[column], **kwargs
+                    ),
+                    pending,
+                )
+            )
+    else:
+        results = [
+            _prophet_fit_and_predict(df=series[column], **kwargs) for column in pending
+        ]
+
+    for column, forecast in zip(pending, results, strict=True):
+        forecasts[column] = forecast
+        if column in cache_keys:
+            set_and_log_cache(
+                cache_manager.data_cache,
+                cache_keys[column],
+                {"forecast": forecast},
+                timeout,
+            )
+
+    return {column: forecasts[column] for column in series}
+
+
 def prophet(  # pylint: disable=too-many-arguments
     df: DataFrame,
     time_grain: str,
@@ -139,21 +235,22 @@ def prophet(  # pylint: disable=too-many-arguments
 
     target_df = DataFrame()
 
-    for column in [
-        column
-        for column in df.columns
-        if column != index
-        and pd.to_numeric(df[column], errors="coerce").notnull().all()
-    ]:
-        fit_df = _prophet_fit_and_predict(
-            df=df[[index, column]].rename(columns={index: "ds", column: "y"}),
-            confidence_interval=confidence_interval,
-            yearly_seasonality=_prophet_parse_seasonality(yearly_seasonality),
-            weekly_seasonality=_prophet_parse_seasonality(weekly_seasonality),
-            daily_seasonality=_prophet_parse_seasonality(daily_seasonality),
-            periods=periods,
-            freq=freq,
-        )
+    forecasts = _prophet_forecasts(
+        {
+            column: df[[index, column]].rename(columns={index: "ds", column: "y"})
+            for column in df.columns
+            if column != index
+            and pd.to_numeric(df[column], errors="coerce").notnull().all()
+        },
+        confidence_interval=confidence_interval,
+        yearly_seasonality=_prophet_parse_seasonality(yearly_seasonality),
+        weekly_seasonality=_prophet_parse_seasonality(weekly_seasonality),
+        daily_seasonality=_prophet_parse_seasonality(daily_seasonality),
+        periods=periods,
+        freq=freq,
+    )
+    for column, forecast in forecasts.items():
+        fit_df = forecast.copy()
         new_columns = [
             f"{column}__yhat",
             f"{column}__yhat_lower",
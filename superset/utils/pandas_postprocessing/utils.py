@@ -14,7 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from collections.abc import Sequence
+from collections.abc import Hashable, Sequence
 from functools import partial
 from typing import Any, Callable
 
@@ -116,12 +116,14 @@ def validate_column_args(*argnames: str) -> Callable[..., Any]:
         def wrapped(df: DataFrame, **options: Any) -> Any:
             if _is_multi_index_on_columns(df):
                 # MultiIndex column validate first level
-                columns = df.columns.get_level_values(0)
+                columns = set(df.columns.get_level_values(0))
             else:
-                columns = df.columns.tolist()
+                columns = set(df.columns)
             for name in argnames:
+                # unhashable values, eg column specs sent by clients, aren't columns
                 if name in options and not all(
-                    elem in columns for elem in scalar_to_sequence(options.get(name))
+                    isinstance(elem, Hashable) and elem in columns
+                    for elem in scalar_to_sequence(options.get(name))
                 ):
                     raise InvalidPostProcessingError(
                         _("Referenced columns not available in DataFrame.")
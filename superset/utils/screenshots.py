@@ -21,9 +21,10 @@ import logging
 from datetime import datetime
 from enum import Enum
 from io import BytesIO
-from typing import cast, TYPE_CHECKING, TypedDict
+from typing import Callable, cast, TYPE_CHECKING, TypedDict
 
 from flask import current_app as app
+from typing_extensions import NotRequired
 
 from superset import feature_flag_manager, thumbnail_cache
 from superset.exceptions import ScreenshotImageNotAvailableException
@@ -79,6 +80,7 @@ class ScreenshotCachePayloadType(TypedDict):
     image: str | None
     timestamp: str
     status: str
+    data_digest: NotRequired[str | None]
 
 
 class ScreenshotCachePayload:
@@ -87,10 +89,13 @@ class ScreenshotCachePayload:
         image: bytes | None = None,
         status: StatusValues = StatusValues.PENDING,
         timestamp: str = "",
+        data_digest: str | None = None,
     ):
         self._image = image
         self._timestamp = timestamp or datetime.now().isoformat()
         self.status = StatusValues.UPDATED if image else status
+        # digest of the data displayed in the image, see `get_chart_data_digest`
+        self.data_digest = data_digest
 
     @classmethod
     def from_dict(cls, payload: ScreenshotCachePayloadType) -> ScreenshotCachePayload:
@@ -98,6 +103,7 @@ class ScreenshotCachePayload:
             image=base64.b64decode(payload["image"]) if payload["image"] else None,
             status=StatusValues(payload["status"]),
             timestamp=payload["timestamp"],
+            data_digest=payload.get("data_digest"),
         )
 
     def to_dict(self) -> ScreenshotCachePayloadType:
@@ -107,6 +113,7 @@ class ScreenshotCachePayload:
             else None,
             "timestamp": self._timestamp,
             "status": self.status.value,
+            "data_digest": self.data_digest,
         }
 
     def update_timestamp(self) -> None:
@@ -251,6 +258,7 @@ class BaseScreenshot:
         window_size: WindowSize | None = None,
         thumb_size: WindowSize | None = None,
         cache_key: str | None = None,
+        data_digest: Callable[[], str | None] | None = None,
     ) -> None:
         """
         Computes the thumbnail and caches the result
@@ -260,6 +268,8 @@ class BaseScreenshot:
         :param window_size: The window size from which will process the thumb
         :param thumb_size: The final thumbnail size
         :param force: Will force the computation even if it's already cached
+        :param data_digest: Returns a digest of the displayed data. A forced
+            computation is skipped when it matches the digest of the cached image
         :return: Image payload
         """
         cache_key = cache_key or self.get_cache_key(window_size, thumb_size)
@@ -272,6 +282,16 @@ class BaseScreenshot:
                 "Skipping compute - already processed for thumbnail: %s", cache_key
             )
             return
+        if (
+            data_digest
+            and cache_payload.status == StatusValues.UPDATED
+            and cache_payload.data_digest
+            and cache_payload.data_digest == data_digest()
+        ):
+            logger.info(
+                "Skipping compute - data unchanged for thumbnail: %s", cache_key
+            )
+            return
 
         window_size = window_size or self.window_size
         thumb_size = thumb_size or self.thumb_size
@@ -299,6 +319,9 @@ class BaseScreenshot:
             logger.info("Caching thumbnail: %s", cache_key)
             with event_logger.log_context(f"screenshot.cache.{self.thumbnail_type}"):
                 cache_payload.update(image)
+                # rendering the page populated the results cache, so the digest now
+                # matches the data in the image
+                cache_payload.data_digest = data_digest() if data_digest else None
         self.cache.set(cache_key, cache_payload.to_dict())
         logger.info("Updated thumbnail cache; Status: %s", cache_payload.get_status())
         return
@@ -18,10 +18,14 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from enum import Enum
-from time import sleep
+from time import monotonic, sleep
 from typing import Any, TYPE_CHECKING
+from urllib.parse import urlparse
 
 from flask import current_app as app
 from packaging import version
@@ -117,6 +121,13 @@ def check_playwright_availability() -> bool:
 PLAYWRIGHT_AVAILABLE = check_playwright_availability()
 
 
+def is_login_url(url: str) -> bool:
+    """
+    Whether the browser landed on the login page, eg as its session expired.
+    """
+    return "login" in urlparse(url).path.split("/")
+
+
 def validate_webdriver_config() -> dict[str, Any]:
     """
     Validate webdriver configuration and dependencies.
@@ -139,6 +150,19 @@ def validate_webdriver_config() -> dict[str, Any]:
     }
 
 
+# JS function checking that the charts are mounted and that every one of them has
+# reached a final status, as reported by the `data-chart-status` attribute of the
+# chart containers
+CHARTS_RENDERED_FUNCTION = """() => {
+    const charts = Array.from(
+        document.querySelectorAll('[data-test="chart-container"]')
+    );
+    return charts.length > 0 && charts.every(
+        chart => ['rendered', 'failed', 'stopped'].includes(chart.dataset.chartStatus)
+    );
+}"""
+
+
 class DashboardStandaloneMode(Enum):
     HIDE_NAV = 1
     HIDE_NAV_AND_TITLE = 2
@@ -158,6 +182,28 @@ class WebDriverProxy(ABC):
         self._screenshot_locate_wait = app.config["SCREENSHOT_LOCATE_WAIT"]
         self._screenshot_load_wait = app.config["SCREENSHOT_LOAD_WAIT"]
 
+    @property
+    def driver_type(self) -> str:
+        return self._driver_type
+
+    @staticmethod
+    def get_headstart() -> int:
+        """
+        Seconds to wait after loading the page, before looking for the charts.
+        """
+        if app.config.get("SCREENSHOT_WAIT_FOR_RENDERED_CHARTS", False):
+            return 0
+        return app.config["SCREENSHOT_SELENIUM_HEADSTART"]
+
+    @staticmethod
+    def get_animation_wait() -> int:
+        """
+        Seconds to wait for chart animations, once the charts are loaded.
+        """
+        if app.config.get("SCREENSHOT_WAIT_FOR_RENDERED_CHARTS", False):
+            return app.config["SCREENSHOT_RENDERED_CHARTS_ANIMATION_WAIT"]
+        return app.config["SCREENSHOT_SELENIUM_ANIMATION_WAIT"]
+
     @abstractmethod
     def get_screenshot(self, url: str, element_name: str, user: User) -> bytes | None:
         """
@@ -265,7 +311,7 @@ class WebDriverPlaywright(WebDriverProxy):
                 )
 
             img: bytes | None = None
-            selenium_headstart = app.config["SCREENSHOT_SELENIUM_HEADSTART"]
+            selenium_headstart = self.get_headstart()
             logger.debug("Sleeping for %i seconds", selenium_headstart)
             page.wait_for_timeout(selenium_headstart * 1000)
             element: Locator
@@ -306,9 +352,20 @@ class WebDriverPlaywright(WebDriverProxy):
                     )
                     raise
 
-                selenium_animation_wait = app.config[
-                    "SCREENSHOT_SELENIUM_ANIMATION_WAIT"
-                ]
+                if app.config.get("SCREENSHOT_WAIT_FOR_RENDERED_CHARTS", False):
+                    try:
+                        logger.debug("Wait for charts to render at url: %s", url)
+                        page.wait_for_function(
+                            CHARTS_RENDERED_FUNCTION,
+                            timeout=self._screenshot_load_wait * 1000,
+                        )
+                    except PlaywrightTimeout:
+                        # take the screenshot anyway, as with the fixed waits
+                        logger.warning(
+                            "Timed out waiting for charts to render at url %s", url
+                        )
+
+                selenium_animation_wait = self.get_animation_wait()
                 logger.debug(
                     "Wait %i seconds for chart animation", selenium_animation_wait
                 )
@@ -392,6 +449,225 @@ class WebDriverPlaywright(WebDriverProxy):
             return img
 
 
+@dataclass
+class PooledWebDriver:
+    driver: WebDriver
+    driver_type: str
+    created_at: float
+    last_used_at: float
+    usage_count: int = 0
+    # id of the user the driver cookies were set for
+    user_id: int | None = None
+
+
+class WebDriverPool:
+    """
+    A per process pool of warm Selenium webdrivers.
+
+    Starting a browser takes seconds, so instead of creating and destroying one per
+    screenshot, idle drivers are kept around and reused. A driver that was last
+    authenticated as the requested user is preferred, so its session cookies can be
+    reused as is. Drivers are recycled after `max_usage` pages, after being idle for
+    `max_idle_seconds`, when the JS heap of the last page grew over
+    `max_js_heap_bytes` (Chrome only) or when a screenshot failed.
+
+    The pool is configured with `WEBDRIVER_POOL`, a `max_size` of 0 disables it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._idle: list[PooledWebDriver] = []
+        self._leased: dict[int, PooledWebDriver] = {}
+        self.created = 0
+        self.reused = 0
+        self.recycled = 0
+
+    @property
+    def config(self) -> dict[str, Any]:
+        return app.config["WEBDRIVER_POOL"]
+
+    @property
+    def enabled(self) -> bool:
+        return self.config["max_size"] > 0
+
+    def _reset_after_fork(self) -> None:
+        # drivers inherited from the parent process belong to it, forget about them
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._idle = []
+            self._leased = {}
+
+    def _is_expired(self, pooled: PooledWebDriver, now: float) -> bool:
+        return (
+            pooled.usage_count >= self.config["max_usage"]
+            or now - pooled.last_used_at > self.config["max_idle_seconds"]
+        )
+
+    def _is_bloated(self, pooled: PooledWebDriver) -> bool:
+        if not (max_js_heap_bytes := self.config.get("max_js_heap_bytes")):
+            return False
+        try:
+            used_js_heap_bytes = pooled.driver.execute_script(
+                "return window.performance.memory"
+                " && window.performance.memory.usedJSHeapSize"
+            )
+        except WebDriverException:
+            return True
+        return bool(used_js_heap_bytes) and used_js_heap_bytes > max_js_heap_bytes
+
+    def _recycle(self, pooled: PooledWebDriver) -> None:
+        self.recycled += 1
+        WebDriverSelenium.destroy(
+            pooled.driver, app.config["SCREENSHOT_SELENIUM_RETRIES"]
+        )
+
+    def _log_stats(self) -> None:
+        stats_logger = app.config["STATS_LOGGER"]
+        for key, value in self.stats().items():
+            stats_logger.gauge(f"webdriver_pool.{key}", value)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the health metrics of the pool in the current process.
+        """
+        return {
+            "idle": len(self._idle),
+            "leased": len(self._leased),
+            "created": self.created,
+            "reused": self.reused,
+            "recycled": self.recycled,
+        }
+
+    def warm(self, proxy: WebDriverSelenium) -> None:
+        """
+        Start unauthenticated drivers until `warm_size` drivers are idle.
+        """
+        warm_size = min(self.config.get("warm_size", 0), self.config["max_size"])
+        for _ in range(warm_size - len(self._idle)):
+            now = monotonic()
+            pooled = PooledWebDriver(
+                driver=proxy.create(),
+                driver_type=proxy.driver_type,
+                created_at=now,
+                last_used_at=now,
+            )
+            with self._lock:
+                self.created += 1
+                self._idle.append(pooled)
+        self._log_stats()
+
+    def acquire(self, proxy: WebDriverSelenium, user: User) -> WebDriver:
+        """
+        Lease a driver authenticated as `user`, reusing an idle one when possible.
+        """
+        now = monotonic()
+        pooled: PooledWebDriver | None = None
+        with self._lock:
+            self._reset_after_fork()
+            expired = [
+                candidate
+                for candidate in self._idle
+                if self._is_expired(candidate, now)
+            ]
+            self._idle = [
+                candidate
+                for candidate in self._idle
+                if not self._is_expired(candidate, now)
+            ]
+            candidates = [
+                candidate
+                for candidate in self._idle
+                if candidate.driver_type == proxy.driver_type
+            ]
+            candidates.sort(key=lambda candidate: candidate.user_id != user.id)
+            if candidates:
+                pooled = candidates[0]
+                self._idle.remove(pooled)
+                self.reused += 1
+
+        for candidate in expired:
+            self._recycle(candidate)
+
+        if pooled is None:
+            pooled = PooledWebDriver(
+                driver=proxy.create(),
+                driver_type=proxy.driver_type,
+                created_at=now,
+                last_used_at=now,
+            )
+            self.created += 1
+
+        if pooled.user_id != user.id:
+            try:
+                self._authenticate(pooled, user)
+            except Exception:
+                self._recycle(pooled)
+                raise
+
+        with self._lock:
+            self._leased[id(pooled.driver)] = pooled
+        self._log_stats()
+        return pooled.driver
+
+    @staticmethod
+    def _authenticate(pooled: PooledWebDriver, user: User) -> None:
+        if pooled.user_id is not None:
+            pooled.driver.delete_all_cookies()
+        pooled.user_id = None
+        machine_auth_provider_factory.instance.authenticate_webdriver(
+            pooled.driver, user
+        )
+        pooled.user_id = user.id
+
+    def authenticate(self, driver: WebDriver, user: User) -> None:
+        """
+        Authenticate a leased driver again, eg when its session cookie expired.
+        """
+        with self._lock:
+            pooled = self._leased[id(driver)]
+        self._authenticate(pooled, user)
+
+    def release(self, driver: WebDriver, healthy: bool = True) -> None:
+        """
+        Return a leased driver to the pool, or recycle it.
+
+        :param driver: The driver returned by `acquire`
+        :param healthy: Whether the driver was used without errors
+        """
+        with self._lock:
+            pooled = self._leased.pop(id(driver), None)
+        if pooled is None:
+            WebDriverSelenium.destroy(driver, app.config["SCREENSHOT_SELENIUM_RETRIES"])
+            return
+
+        pooled.usage_count += 1
+        pooled.last_used_at = monotonic()
+        if not healthy or self._is_bloated(pooled):
+            self._recycle(pooled)
+        else:
+            with self._lock:
+                if len(self._idle) < self.config["max_size"]:
+                    self._idle.append(pooled)
+                    pooled = None
+            if pooled is not None:
+                self._recycle(pooled)
+        self._log_stats()
+
+    def clear(self) -> None:
+        """
+        Destroy all idle drivers, e.g. when the worker process shuts down.
+        """
+        with self._lock:
+            self._reset_after_fork()
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            WebDriverSelenium.destroy(pooled.driver)
+
+
+webdriver_pool = WebDriverPool()
+
+
 class WebDriverSelenium(WebDriverProxy):
     def _create_firefox_driver(
         self, pixel_density: float
@@ -587,15 +863,22 @@ class WebDriverSelenium(WebDriverProxy):
         return error_messages
 
     def get_screenshot(self, url: str, element_name: str, user: User) -> bytes | None:  # noqa: C901
-        driver = self.auth(user)
-        driver.set_window_size(*self._window)
-        driver.get(url)
+        pooled = webdriver_pool.enabled
+        driver = webdriver_pool.acquire(self, user) if pooled else self.auth(user)
         img: bytes | None = None
-        selenium_headstart = app.config["SCREENSHOT_SELENIUM_HEADSTART"]
-        logger.debug("Sleeping for %i seconds", selenium_headstart)
-        sleep(selenium_headstart)
 
         try:
+            driver.set_window_size(*self._window)
+            driver.get(url)
+            if pooled and is_login_url(driver.current_url):
+                # the session of the reused driver expired
+                logger.info("Authenticating the pooled driver again at url %s", url)
+                webdriver_pool.authenticate(driver, user)
+                driver.get(url)
+            selenium_headstart = self.get_headstart()
+            logger.debug("Sleeping for %i seconds", selenium_headstart)
+            sleep(selenium_headstart)
+
             try:
                 # page didn't load
                 logger.debug(
@@ -646,7 +929,22 @@ class WebDriverSelenium(WebDriverProxy):
                 )
                 raise
 
-            selenium_animation_wait = app.config["SCREENSHOT_SELENIUM_ANIMATION_WAIT"]
+            if app.config.get("SCREENSHOT_WAIT_FOR_RENDERED_CHARTS", False):
+                try:
+                    logger.debug("Wait for charts to render at url: %s", url)
+                    WebDriverWait(driver, self._screenshot_load_wait).until(
+                        lambda driver: driver.execute_script(
+                            f"return ({CHARTS_RENDERED_FUNCTION})()"
+                        )
+                    )
+                except TimeoutException:
+                    # take the screenshot anyway, as with the fixed waits
+                    logger.warning(
+                        "Selenium timed out waiting for charts to render at url %s",
+                        url,
+                    )
+
+            selenium_animation_wait = self.get_animation_wait()
             logger.debug("Wait %i seconds for chart animation", selenium_animation_wait)
             sleep(selenium_animation_wait)
             logger.debug(
@@ -684,5 +982,8 @@ class WebDriverSelenium(WebDriverProxy):
             )
             raise
         finally:
-            self.destroy(driver, app.config["SCREENSHOT_SELENIUM_RETRIES"])
+            if pooled:
+                webdriver_pool.release(driver, healthy=img is not None)
+            else:
+                self.destroy(driver, app.config["SCREENSHOT_SELENIUM_RETRIES"])
         return img
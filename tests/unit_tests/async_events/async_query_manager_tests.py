@@ -166,3 +166,81 @@ def test_submit_explore_json_job_as_guest_user(
     )
 
     assert "guest_token" not in job_meta
+
+
+@mark.parametrize(
+    "last_id, xread_id",
+    [(None, "0-0"), ("1607477697866-0", "1607477697866-0")],
+)
+def test_read_events_long_polling(async_query_manager, last_id, xread_id):
+    cache_backend = mock.Mock(spec=RedisCacheBackend)
+    cache_backend.xread.return_value = [
+        (
+            b"async-events-test_channel_id",
+            [(b"1607477697867-0", {b"data": b'{"job_id": "1", "status": "done"}'})],
+        )
+    ]
+    async_query_manager._cache = cache_backend
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._long_polling_timeout = 1000
+
+    events = async_query_manager.read_events("test_channel_id", last_id, block=True)
+
+    cache_backend.xread.assert_called_once_with(
+        {"async-events-test_channel_id": xread_id}, 100, 1000
+    )
+    cache_backend.xrange.assert_not_called()
+    assert events == [{"id": "1607477697867-0", "job_id": "1", "status": "done"}]
+
+    # an expired timeout returns no events
+    cache_backend.xread.return_value = []
+    assert async_query_manager.read_events("test_channel_id", last_id, block=True) == []
+
+
+def test_read_events_polling(async_query_manager):
+    cache_backend = mock.Mock(spec=RedisCacheBackend)
+    cache_backend.xrange.return_value = []
+    async_query_manager._cache = cache_backend
+    async_query_manager._stream_prefix = "async-events-"
+
+    assert async_query_manager.read_events("test_channel_id", None, block=True) == []
+    cache_backend.xrange.assert_called_once_with(
+        "async-events-test_channel_id", "-", "+", 100
+    )
+    cache_backend.xread.assert_not_called()
+
+
+@mock.patch("superset.is_feature_enabled")
+def test_submit_chart_data_jobs_as_guest_user(
+    is_feature_enabled_mock, async_query_manager
+):
+    is_feature_enabled_mock.return_value = True
+    set_current_as_guest_user()
+
+    job_mock = Mock()
+    async_query_manager._load_chart_data_batch_into_cache_job = job_mock
+    async_query_manager._query_timeout = 30
+    jobs_meta = async_query_manager.submit_chart_data_jobs(
+        channel_id="test_channel_id",
+        form_datas=[{"slice_id": 1}, {"slice_id": 2}],
+    )
+
+    assert len(jobs_meta) == 2
+    assert jobs_meta[0]["job_id"] != jobs_meta[1]["job_id"]
+    assert all("guest_token" not in job_meta for job_meta in jobs_meta)
+    job_mock.apply_async.assert_called_once_with(
+        (
+            [
+                {
+                    **job_meta,
+                    "guest_token": {
+                        "resources": [{"id": "some-uuid", "type": "dashboard"}],
+                        "user": {},
+                    },
+                }
+                for job_meta in jobs_meta
+            ],
+            [{"slice_id": 1}, {"slice_id": 2}],
+        ),
+        soft_time_limit=60,
+    )
@@ -0,0 +1,142 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# pylint: disable=unused-argument, import-outside-toplevel
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from superset import security_manager
+from superset.charts.data.api import ChartDataRestApi
+from superset.commands.chart.exceptions import ChartDataCacheLoadError
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.exceptions import QueryObjectValidationError
+
+
+@pytest.fixture
+def batch_mocks(mocker: MockerFixture) -> MagicMock:
+    """
+    Mock the query contexts, cache lookups and async jobs of the batch endpoint.
+
+    A form data has the query of a datasource, which is cached when it's
+    "cached" and invalid when the form data has no datasource.
+    """
+    mocker.patch("superset.charts.data.api.is_feature_enabled", return_value=True)
+    mocker.patch.object(security_manager, "is_guest_user", return_value=False)
+
+    def create_query_context(form_data: dict[str, Any]) -> MagicMock:
+        if "datasource" not in form_data:
+            raise QueryObjectValidationError("Invalid query context")
+        query_context = MagicMock(
+            result_format=ChartDataResultFormat.JSON,
+            result_type=ChartDataResultType.FULL,
+            queries=[form_data["query"]],
+        )
+        query_context.datasource.uid = form_data["datasource"]
+        query_context.query_cache_key.side_effect = lambda query: query
+        return query_context
+
+    mocker.patch.object(
+        ChartDataRestApi,
+        "_create_query_context_from_form",
+        side_effect=create_query_context,
+    )
+
+    def create_command(query_context: MagicMock) -> MagicMock:
+        command = MagicMock()
+        if query_context.queries == ["cached"]:
+            command.run.return_value = {"queries": [{"data": "cached"}]}
+        else:
+            command.run.side_effect = ChartDataCacheLoadError("Not cached")
+        return command
+
+    mocker.patch(
+        "superset.charts.data.api.ChartDataCommand", side_effect=create_command
+    )
+    async_command = mocker.patch(
+        "superset.charts.data.api.CreateAsyncChartDataJobCommand"
+    ).return_value
+    async_command.run_batch.side_effect = lambda form_datas, user_id: [
+        {"status": "pending", "job_id": form_data["id"]} for form_data in form_datas
+    ]
+    return async_command
+
+
+def test_data_batch(client: Any, full_api_access: None, batch_mocks: MagicMock) -> None:
+    """
+    Test that the batch endpoint returns cached results, errors and jobs in the order
+    of the query contexts, with one job per distinct query.
+    """
+    queries = [
+        {"id": 0, "datasource": "1__table", "query": "a"},
+        {"id": 1, "datasource": "1__table", "query": "cached"},
+        {"id": 2},
+        {"id": 3, "datasource": "1__table", "query": "a"},
+        {"id": 4, "datasource": "2__table", "query": "a"},
+        {"id": 5, "datasource": "1__table", "query": "b"},
+    ]
+    response = client.post("/api/v1/chart/data/batch", json={"queries": queries})
+
+    assert response.status_code == 200
+    assert response.json["result"] == [
+        {"status": "pending", "job_id": 0},
+        {"status": "done", "result": [{"data": "cached"}]},
+        {"status": "error", "errors": [{"message": "Invalid query context"}]},
+        {"status": "pending", "job_id": 0},
+        {"status": "pending", "job_id": 4},
+        {"status": "pending", "job_id": 5},
+    ]
+    # the jobs are submitted once per datasource, and identical queries share one
+    assert [call.args[0] for call in batch_mocks.run_batch.call_args_list] == [
+        [queries[0], queries[5]],
+        [queries[4]],
+    ]
+
+
+def test_data_batch_not_enabled(
+    client: Any,
+    full_api_access: None,
+    mocker: MockerFixture,
+) -> None:
+    """
+    Test that the batch endpoint requires global async queries.
+    """
+    mocker.patch("superset.charts.data.api.is_feature_enabled", return_value=False)
+
+    response = client.post("/api/v1/chart/data/batch", json={"queries": []})
+
+    assert response.status_code == 400
+    assert response.json == {"message": "Async queries are not enabled"}
+
+
+def test_data_batch_invalid_payload(
+    client: Any,
+    full_api_access: None,
+    batch_mocks: MagicMock,
+) -> None:
+    """
+    Test that the batch endpoint requires a list of query contexts.
+    """
+    response = client.post("/api/v1/chart/data/batch", json={"queries": {}})
+
+    assert response.status_code == 400
+    batch_mocks.run_batch.assert_not_called()
@@ -0,0 +1,85 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from unittest.mock import MagicMock, PropertyMock
+
+from cachelib import SimpleCache
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
+
+from superset.commands.cachekeys.invalidate import CacheInvalidateCommand
+from superset.connectors.sqla.models import SqlaTable
+from superset.models.cache import CacheKey
+from superset.models.core import Database
+from superset.models.dashboard import Dashboard
+from superset.models.slice import Slice
+from superset.utils.screenshots import ChartScreenshot, DashboardScreenshot
+
+
+def test_invalidate_database(mocker: MockerFixture, session: Session) -> None:
+    """
+    Test that the cached data and thumbnails of the datasets of a database are
+    invalidated, and only them.
+    """
+    Database.metadata.create_all(session.bind)
+    caches = MagicMock(data_cache=SimpleCache(), cache=SimpleCache())
+    mocker.patch("superset.commands.cachekeys.invalidate.cache_manager", caches)
+    thumbnail_cache = SimpleCache()
+    mocker.patch(
+        "superset.commands.cachekeys.invalidate.thumbnail_cache", thumbnail_cache
+    )
+    mocker.patch.object(Slice, "digest", new_callable=PropertyMock, return_value="1")
+    mocker.patch.object(
+        Dashboard, "digest", new_callable=PropertyMock, return_value="2"
+    )
+
+    database = Database(database_name="etl", sqlalchemy_uri="sqlite://")
+    other_database = Database(database_name="other", sqlalchemy_uri="sqlite://")
+    dataset = SqlaTable(database=database, table_name="sales")
+    other_dataset = SqlaTable(database=other_database, table_name="sales")
+    chart = Slice(slice_name="sales", datasource_type="table", viz_type="table")
+    session.add_all([dataset, other_dataset, chart])
+    session.flush()
+    chart.datasource_id = dataset.id
+    dashboard = Dashboard(dashboard_title="sales", slices=[chart])
+    session.add(dashboard)
+    session.add_all(
+        [
+            CacheKey(cache_key="data", datasource_uid=dataset.uid),
+            CacheKey(cache_key="formatted", datasource_uid=dataset.uid),
+            CacheKey(cache_key="other", datasource_uid=other_dataset.uid),
+        ]
+    )
+    session.commit()
+    for key in ("data", "formatted", "other"):
+        caches.data_cache.set(key, "value")
+    chart_key = ChartScreenshot(chart.url, "1").get_cache_key()
+    dashboard_key = DashboardScreenshot(dashboard.url, "2").get_cache_key()
+    thumbnail_cache.set(chart_key, "thumbnail")
+    thumbnail_cache.set(dashboard_key, "thumbnail")
+
+    assert CacheInvalidateCommand(database_ids=[database.id]).run() == {
+        "datasources": 1,
+        "cache_keys": 2,
+        "thumbnails": 2,
+    }
+
+    assert caches.data_cache.get("data") is None
+    assert caches.data_cache.get("formatted") is None
+    assert caches.data_cache.get("other") == "value"
+    assert thumbnail_cache.get(chart_key) is None
+    assert thumbnail_cache.get(dashboard_key) is None
+    assert [key.cache_key for key in session.query(CacheKey)] == ["other"]
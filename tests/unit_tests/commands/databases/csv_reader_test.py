@@ -267,6 +267,65 @@ def test_csv_reader_file_to_dataframe(file, options, expected_cols, expected_val
     file.close()
 
 
+def test_csv_reader_file_to_dataframes(mocker, app):
+    """
+    Test that CSV files are read in chunks, each with its columns cast.
+    """
+    mocker.patch.dict(app.config, {"READ_CSV_CHUNK_SIZE": 2})
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(column_data_types={"Age": "float64"}),
+    )
+    with app.app_context():
+        chunks = list(csv_reader.file_to_dataframes(create_csv_file(CSV_DATA)))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert all(chunk["Age"].dtype == "float64" for chunk in chunks)
+    assert pd.concat(chunks)["Age"].tolist() == [30.0, 25.0, 20.0]
+
+
+@pytest.mark.parametrize(
+    "values,dtype,expected",
+    [
+        (["1", "2", "3", "1.5"], "float64", [1.0, 2.0, 3.0, 1.5]),
+        (["", "", "", "1"], "float64", None),
+        (["1", "2", "3", "text"], "object", ["1", "2", "3", "text"]),
+        (["", "", "", "text"], "object", None),
+    ],
+)
+def test_csv_reader_file_to_dataframes_types(mocker, app, values, dtype, expected):
+    """
+    Test that all the chunks of a CSV file get the types holding the values of the
+    whole file, when they only appear after the first chunk.
+    """
+    mocker.patch.dict(app.config, {"READ_CSV_CHUNK_SIZE": 2})
+    csv_reader = CSVReader(options=CSVReaderOptions())
+    with app.app_context():
+        chunks = list(
+            csv_reader.file_to_dataframes(
+                create_csv_file([["a", "b"], *[[value, "x"] for value in values]])
+            )
+        )
+
+    assert [len(chunk) for chunk in chunks] == [2, 2]
+    assert all(chunk["a"].dtype == dtype for chunk in chunks)
+    if expected:
+        assert pd.concat(chunks)["a"].tolist() == expected
+
+
+def test_csv_reader_file_to_dataframes_header_only(mocker, app):
+    """
+    Test that a CSV file without rows is read as an empty chunk with its columns.
+    """
+    mocker.patch.dict(app.config, {"READ_CSV_CHUNK_SIZE": 2})
+    csv_reader = CSVReader(options=CSVReaderOptions())
+    with app.app_context():
+        chunks = list(csv_reader.file_to_dataframes(create_csv_file([CSV_DATA[0]])))
+
+    assert len(chunks) == 1
+    assert chunks[0].empty
+    assert chunks[0].columns.tolist() == CSV_DATA[0]
+
+
 def test_csv_reader_index_column():
     csv_reader = CSVReader(
         options=CSVReaderOptions(index_column="Name"),
@@ -17,6 +17,7 @@
 
 import json  # noqa: TID251
 from datetime import datetime
+from typing import Any
 from unittest.mock import patch
 from uuid import UUID
 
@@ -503,6 +504,214 @@ def test_screenshot_width_calculation(
                 )
 
 
+@pytest.mark.parametrize("concurrency", [1, 2])
+def test_get_screenshots_per_image_failures(
+    app: SupersetApp, mocker: MockerFixture, concurrency: int
+) -> None:
+    """
+    Test that dashboard tabs are captured in order, possibly concurrently, and that
+    a failing tab doesn't fail the whole report.
+    """
+    from superset.commands.report.exceptions import (
+        ReportScheduleScreenshotFailedError,
+    )
+
+    app.config.update(
+        {
+            "ALERT_REPORTS_EXECUTORS": {},
+            "ALERT_REPORTS_SCREENSHOT_CONCURRENCY": concurrency,
+        }
+    )
+    report_schedule = ReportSchedule()
+    report_schedule.type = ReportScheduleType.REPORT
+    report_schedule.chart = None
+    report_schedule.dashboard = mocker.MagicMock(digest="digest")
+    report_state = BaseReportState(
+        report_schedule=report_schedule,
+        scheduled_dttm=datetime.now(),
+        execution_id=UUID("084e7ee6-5557-4ecd-9632-b7f39c9ec524"),
+    )
+    mocker.patch.object(
+        report_state,
+        "get_dashboard_urls",
+        return_value=["http://tab/1", "http://tab/2", "http://tab/3"],
+    )
+    mocker.patch("superset.commands.report.execute.security_manager")
+    mocker.patch(
+        "superset.commands.report.execute.get_executor",
+        return_value=("executor", "username"),
+    )
+
+    def get_screenshot(self, user):
+        tab = self.url.removeprefix("http://tab/")[0]
+        if tab == "2":
+            raise Exception("Tab failed")  # noqa: TRY002
+        return tab.encode()
+
+    mocker.patch(
+        "superset.utils.screenshots.DashboardScreenshot.get_screenshot",
+        get_screenshot,
+    )
+    assert report_state._get_screenshots() == [b"1", b"3"]
+    assert str(report_state._screenshots_error) == (
+        "Failed taking 1 out of 3 screenshots Tab failed"
+    )
+
+    # the images that could be taken are sent, but the execution still fails
+    mocker.patch.object(report_state, "_get_notification_content")
+    send = mocker.patch.object(report_state, "_send")
+    with pytest.raises(ReportScheduleScreenshotFailedError, match="1 out of 3"):
+        report_state.send()
+    send.assert_called_once()
+
+    mocker.patch.object(
+        report_state, "get_dashboard_urls", return_value=["http://tab/2"]
+    )
+    with pytest.raises(ReportScheduleScreenshotFailedError, match="Tab failed"):
+        report_state._get_screenshots()
+
+
+def test_get_screenshots_server_side_rendering(
+    app: SupersetApp, mocker: MockerFixture
+) -> None:
+    """
+    Test that enabled charts are rendered on the server, falling back to a
+    screenshot when rendering fails.
+    """
+    app.config.update({"ALERT_REPORTS_EXECUTORS": {}})
+    report_schedule = ReportSchedule()
+    report_schedule.type = ReportScheduleType.REPORT
+    report_schedule.chart = mocker.MagicMock(digest="digest")
+    report_state = BaseReportState(
+        report_schedule=report_schedule,
+        scheduled_dttm=datetime.now(),
+        execution_id=UUID("084e7ee6-5557-4ecd-9632-b7f39c9ec524"),
+    )
+    mocker.patch.object(report_state, "_get_url", return_value="http://chart")
+    mocker.patch("superset.commands.report.execute.security_manager")
+    mocker.patch(
+        "superset.commands.report.execute.get_executor",
+        return_value=("executor", "username"),
+    )
+    mocker.patch("superset.commands.report.execute.can_render_chart", return_value=True)
+    render_chart = mocker.patch(
+        "superset.commands.report.execute.render_chart", return_value=b"rendered"
+    )
+    get_screenshot = mocker.patch(
+        "superset.utils.screenshots.ChartScreenshot.get_screenshot",
+        return_value=b"screenshot",
+    )
+
+    assert report_state._get_screenshots() == [b"rendered"]
+    get_screenshot.assert_not_called()
+
+    render_chart.side_effect = Exception("Rendering failed")
+    assert report_state._get_screenshots() == [b"screenshot"]
+
+
+def test_get_screenshots_unchanged_data(
+    app: SupersetApp, mocker: MockerFixture
+) -> None:
+    """
+    Test that report images are sent again while their data is unchanged, keyed by
+    the screenshot URL and cached with the digest computed after rendering.
+    """
+    from flask_caching.backends import SimpleCache
+
+    from superset.utils.screenshots import BaseScreenshot
+
+    mocker.patch.dict(
+        app.config,
+        {
+            "ALERT_REPORTS_EXECUTORS": {},
+            "ALERT_REPORTS_SCREENSHOT_CONCURRENCY": 1,
+            "THUMBNAIL_SKIP_UNCHANGED_DATA": True,
+        },
+    )
+    cache = SimpleCache()
+    thumbnail_cache = mocker.MagicMock(cache=cache, get=cache.get, set=cache.set)
+    mocker.patch("superset.commands.report.execute.thumbnail_cache", thumbnail_cache)
+    mocker.patch.object(BaseScreenshot, "cache", thumbnail_cache)
+    mocker.patch("superset.commands.report.execute.security_manager")
+    mocker.patch(
+        "superset.commands.report.execute.get_executor",
+        return_value=("executor", "username"),
+    )
+    get_screenshot = mocker.patch(
+        "superset.utils.screenshots.DashboardScreenshot.get_screenshot",
+        side_effect=[b"first", b"other tab"],
+    )
+
+    report_schedule = ReportSchedule(id=1, force_screenshot=False)
+    report_schedule.type = ReportScheduleType.REPORT
+    report_schedule.chart = None
+    report_schedule.dashboard = mocker.MagicMock(digest="digest")
+    report_state = BaseReportState(
+        report_schedule=report_schedule,
+        scheduled_dttm=datetime.now(),
+        execution_id=UUID("084e7ee6-5557-4ecd-9632-b7f39c9ec524"),
+    )
+    mocker.patch.object(
+        report_state, "get_dashboard_urls", return_value=["http://tab/1"]
+    )
+    # the results cache is cold before the first rendering
+    get_data_digest = mocker.patch.object(
+        report_state, "_get_data_digest", side_effect=[None, "data"]
+    )
+    assert report_state._get_screenshots() == [b"first"]
+    assert get_screenshot.call_count == 1
+
+    get_data_digest.side_effect = ["data"]
+    assert report_state._get_screenshots() == [b"first"]
+    assert get_screenshot.call_count == 1
+
+    # selecting another tab renders it even though the data is unchanged
+    mocker.patch.object(
+        report_state, "get_dashboard_urls", return_value=["http://tab/2"]
+    )
+    get_data_digest.side_effect = ["data", "data"]
+    assert report_state._get_screenshots() == [b"other tab"]
+    assert get_screenshot.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "extra, expected",
+    [
+        ({}, 2),
+        ({"screenshot_concurrency": 3}, 3),
+        ({"screenshot_concurrency": "3"}, 3),
+        ({"screenshot_concurrency": 10}, 4),
+        ({"screenshot_concurrency": 0}, 1),
+        ({"screenshot_concurrency": -2}, 1),
+        ({"screenshot_concurrency": "many"}, 2),
+        ({"screenshot_concurrency": None}, 2),
+    ],
+)
+def test_get_screenshot_concurrency(
+    app: SupersetApp,
+    mocker: MockerFixture,
+    extra: dict[str, Any],
+    expected: int,
+) -> None:
+    """
+    Test that the screenshot concurrency of a report is validated and capped.
+    """
+    mocker.patch.dict(
+        app.config,
+        {
+            "ALERT_REPORTS_SCREENSHOT_CONCURRENCY": 2,
+            "ALERT_REPORTS_MAX_SCREENSHOT_CONCURRENCY": 4,
+        },
+    )
+    report_schedule = ReportSchedule(extra_json=json.dumps(extra))
+    report_state = BaseReportState(
+        report_schedule=report_schedule,
+        scheduled_dttm=datetime.now(),
+        execution_id=UUID("084e7ee6-5557-4ecd-9632-b7f39c9ec524"),
+    )
+    assert report_state._get_screenshot_concurrency(5) == expected
+
+
 def test_update_recipient_to_slack_v2(mocker: MockerFixture):
     """
     Test converting a Slack recipient to Slack v2 format.
@@ -0,0 +1,94 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from flask_caching import Cache
+from pytest_mock import MockerFixture
+
+from superset.common.chart_data import ChartDataResultFormat
+from superset.common.query_actions import _get_formatted_data
+
+
+@pytest.fixture
+def data_cache(mocker: MockerFixture, app: Any) -> Cache:
+    cache = Cache(app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch("superset.common.query_actions.cache_manager._data_cache", cache)
+    return cache
+
+
+def get_df_payload(**kwargs: Any) -> dict[str, Any]:
+    return {
+        "cache_key": "df_key",
+        "cached_dttm": "2024-01-01T00:00:00",
+        "cache_timeout": 60,
+        "df": pd.DataFrame({"a": [1, 2]}),
+        "is_cached": True,
+        **kwargs,
+    }
+
+
+@pytest.mark.usefixtures("app_context")
+def test_get_formatted_data_cached(
+    mocker: MockerFixture, data_cache: Cache, app: Any
+) -> None:
+    """
+    Test that the formatted data of a cached DataFrame is served from the cache.
+    """
+    mocker.patch.dict(app.config, {"CACHE_FORMATTED_CHART_DATA": True})
+    query_context = MagicMock(result_format=ChartDataResultFormat.JSON)
+    query_context.get_data.side_effect = lambda df, _: df.to_dict(orient="records")
+    datasource = MagicMock(uid="1__table")
+
+    expected = {
+        "colnames": ["a"],
+        "indexnames": [0, 1],
+        "coltypes": [0],
+        "data": [{"a": 1}, {"a": 2}],
+    }
+    assert _get_formatted_data(query_context, datasource, get_df_payload()) == expected
+    assert _get_formatted_data(query_context, datasource, get_df_payload()) == expected
+    query_context.get_data.assert_called_once()
+
+    # a refreshed DataFrame is formatted again
+    payload = get_df_payload(
+        cached_dttm="2024-01-01T00:05:00",
+        df=pd.DataFrame({"a": [3]}),
+    )
+    assert _get_formatted_data(query_context, datasource, payload)["data"] == [{"a": 3}]
+    assert query_context.get_data.call_count == 2
+
+    # so is a DataFrame that was just loaded from the database
+    payload = get_df_payload(is_cached=False, cached_dttm=None)
+    _get_formatted_data(query_context, datasource, payload)
+    assert query_context.get_data.call_count == 3
+
+
+@pytest.mark.usefixtures("app_context")
+def test_get_formatted_data_disabled(data_cache: Cache) -> None:
+    """
+    Test that the formatted data isn't cached by default.
+    """
+    query_context = MagicMock(result_format=ChartDataResultFormat.CSV)
+    query_context.get_data.return_value = "a\n1\n2\n"
+    datasource = MagicMock(uid="1__table")
+
+    _get_formatted_data(query_context, datasource, get_df_payload())
+    _get_formatted_data(query_context, datasource, get_df_payload())
+    assert query_context.get_data.call_count == 2
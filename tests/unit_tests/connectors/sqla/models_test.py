@@ -22,7 +22,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.session import Session
 
-from superset.connectors.sqla.models import SqlaTable, TableColumn
+from superset.connectors.sqla.models import SqlaTable, SqlMetric, TableColumn
 from superset.daos.dataset import DatasetDAO
 from superset.exceptions import OAuth2RedirectError
 from superset.models.core import Database
@@ -266,6 +266,34 @@ def test_dataset_uniqueness(session: Session) -> None:
     )
 
 
+def test_dataset_change_clears_macro_results(
+    mocker: MockerFixture,
+    session: Session,
+) -> None:
+    """
+    Test that changes to a dataset, its columns or metrics drop its macro results.
+    """
+    Database.metadata.create_all(session.bind)
+    clear_macro_results = mocker.patch(
+        "superset.connectors.sqla.models.clear_macro_results"
+    )
+
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    dataset = SqlaTable(database=database, table_name="table")
+    session.add(dataset)
+    session.commit()
+    clear_macro_results.assert_not_called()
+
+    dataset.description = "A table"
+    session.commit()
+    clear_macro_results.assert_called_once_with(dataset.id)
+
+    clear_macro_results.reset_mock()
+    dataset.metrics.append(SqlMetric(metric_name="cnt", expression="COUNT(*)"))
+    session.commit()
+    clear_macro_results.assert_called_with(dataset.id)
+
+
 def test_normalize_prequery_result_type_custom_sql() -> None:
     """
     Test that the `_normalize_prequery_result_type` can hanndle custom SQL.
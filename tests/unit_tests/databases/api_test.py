@@ -1108,6 +1108,109 @@ def test_csv_upload(
     reader_mock.assert_called_with(*reader_called_with)
 
 
+def test_csv_upload_async(
+    mocker: MockerFixture,
+    app: Any,
+    client: Any,
+    full_api_access: None,
+    tmp_path: Any,
+) -> None:
+    """
+    Test that CSV files are uploaded in a Celery task when CSV_UPLOAD_ASYNC is on.
+    """
+    from cachelib import SimpleCache
+
+    mocker.patch("superset.tasks.uploads._get_status_cache", return_value=SimpleCache())
+    mocker.patch.dict(
+        app.config,
+        {
+            "CSV_UPLOAD_ASYNC": {
+                "enabled": True,
+                "status_timeout": 60,
+                "cache_backend": None,
+            },
+            "UPLOAD_FOLDER": str(tmp_path),
+        },
+    )
+    validate = mocker.patch.object(UploadCommand, "validate")
+    run = mocker.patch.object(UploadCommand, "run")
+    upload_csv_file = mocker.patch("superset.databases.api.upload_csv_file")
+
+    response = client.post(
+        "/api/v1/database/1/upload/",
+        data={
+            "type": "csv",
+            "file": (create_csv_file(), "out.csv"),
+            "table_name": "table1",
+            "delimiter": ",",
+        },
+        content_type="multipart/form-data",
+    )
+
+    assert response.status_code == 202
+    job_id = response.json["job_id"]
+    validate.assert_called_once()
+    run.assert_not_called()
+    file_path = str(tmp_path / f"{job_id}.csv")
+    upload_csv_file.delay.assert_called_once_with(
+        job_id, ANY, 1, "table1", None, file_path, ANY
+    )
+    with open(file_path, "rb") as stream:
+        assert stream.read() == create_csv_file().read()
+
+    response = client.get(f"/api/v1/database/upload/{job_id}/")
+    assert response.json == {
+        "result": {"status": "pending", "rows": 0, "error": None},
+    }
+    assert client.get("/api/v1/database/upload/unknown/").status_code == 404
+
+
+def test_csv_upload_async_no_cache_backend(
+    mocker: MockerFixture,
+    app: Any,
+    client: Any,
+    full_api_access: None,
+    tmp_path: Any,
+) -> None:
+    """
+    Test that asynchronous CSV uploads are rejected without a Redis cache.
+    """
+    mocker.patch.dict(
+        app.config,
+        {
+            "CSV_UPLOAD_ASYNC": {
+                "enabled": True,
+                "status_timeout": 60,
+                "cache_backend": None,
+            },
+            "GLOBAL_ASYNC_QUERIES_CACHE_BACKEND": {"CACHE_TYPE": "SimpleCache"},
+            "UPLOAD_FOLDER": str(tmp_path),
+        },
+    )
+    mocker.patch.dict(app.extensions)
+    app.extensions.pop("superset_upload_status_cache", None)
+    mocker.patch.object(UploadCommand, "validate")
+    upload_csv_file = mocker.patch("superset.databases.api.upload_csv_file")
+
+    response = client.post(
+        "/api/v1/database/1/upload/",
+        data={
+            "type": "csv",
+            "file": (create_csv_file(), "out.csv"),
+            "table_name": "table1",
+            "delimiter": ",",
+        },
+        content_type="multipart/form-data",
+    )
+
+    assert response.status_code == 500
+    assert response.json == {
+        "message": "Asynchronous uploads require a Redis cache for their status"
+    }
+    upload_csv_file.delay.assert_not_called()
+    assert list(tmp_path.iterdir()) == []
+
+
 @pytest.mark.parametrize(
     "payload,expected_response",
     [
@@ -894,3 +894,102 @@ def test_extract_errors_no_match_falls_back(mocker: MockerFixture) -> None:
         engine_name="ExampleEngine",
     )
     assert result == [expected]
+
+
+@pytest.mark.parametrize(
+    "limit, expected",
+    [
+        (None, [[(1,), (2,)], [(3,), (4,)], [(5,)]]),
+        (3, [[(1,), (2,)], [(3,)]]),
+        (4, [[(1,), (2,)], [(3,), (4,)]]),
+    ],
+)
+def test_fetch_data_in_chunks(
+    mocker: MockerFixture, limit: int | None, expected: list[list[tuple[int]]]
+) -> None:
+    """
+    Test that `fetch_data_in_chunks` fetches at most `limit` rows.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    rows = [(1,), (2,), (3,), (4,), (5,)]
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "INTEGER")]
+    cursor.fetchmany.side_effect = lambda size: [
+        rows.pop(0) for _ in range(min(size, len(rows)))
+    ]
+
+    assert list(BaseEngineSpec.fetch_data_in_chunks(cursor, 2, limit)) == expected
+
+    cursor.description = None
+    assert list(BaseEngineSpec.fetch_data_in_chunks(cursor, 2, limit)) == []
+
+
+def test_df_chunks_to_sql(mocker: MockerFixture) -> None:
+    """
+    Test that chunks are appended to the table in a single transaction.
+    """
+    import pandas as pd
+    from sqlalchemy import create_engine
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    engine = create_engine("sqlite://")
+    get_engine = mocker.patch.object(BaseEngineSpec, "get_engine")
+    get_engine.return_value.__enter__.return_value = engine
+    on_progress = mocker.MagicMock()
+
+    def chunks(fail: bool = False) -> Any:
+        yield pd.DataFrame({"a": [1, 2]})
+        if fail:
+            raise ValueError("Broken file")
+        yield pd.DataFrame({"a": [3]})
+
+    BaseEngineSpec.df_chunks_to_sql(
+        mocker.MagicMock(),
+        Table("t"),
+        chunks(),
+        {"if_exists": "replace", "index": False},
+        on_progress,
+    )
+    assert engine.execute("SELECT a FROM t").fetchall() == [(1,), (2,), (3,)]
+    assert on_progress.call_args_list == [mocker.call(2), mocker.call(3)]
+
+    with pytest.raises(ValueError, match="Broken file"):
+        BaseEngineSpec.df_chunks_to_sql(
+            mocker.MagicMock(),
+            Table("t"),
+            chunks(fail=True),
+            {"if_exists": "append", "index": False},
+        )
+    assert engine.execute("SELECT COUNT(*) FROM t").scalar() == 3
+
+
+def test_df_chunks_to_sql_custom_df_to_sql(mocker: MockerFixture) -> None:
+    """
+    Test that engines overriding `df_to_sql`, which may not support appending, upload
+    all the chunks at once with it.
+    """
+    import pandas as pd
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class TestEngineSpec(BaseEngineSpec):
+        df_to_sql = mocker.MagicMock()
+
+    database = mocker.MagicMock()
+    on_progress = mocker.MagicMock()
+    chunks = [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3]})]
+    TestEngineSpec.df_chunks_to_sql(
+        database,
+        Table("t"),
+        chunks,
+        {"if_exists": "replace"},
+        on_progress=on_progress,
+    )
+
+    TestEngineSpec.df_to_sql.assert_called_once_with(
+        database, Table("t"), mocker.ANY, {"if_exists": "replace"}
+    )
+    assert TestEngineSpec.df_to_sql.call_args.args[2]["a"].tolist() == [1, 2, 3]
+    on_progress.assert_called_once_with(3)
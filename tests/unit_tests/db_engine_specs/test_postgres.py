@@ -280,3 +280,43 @@ SELECT * \nFROM my_schema.my_table
  LIMIT :param_1
     """.strip()
     )
+
+
+def test_df_to_sql_copy(mocker: MockerFixture) -> None:
+    """
+    Test that uploads to Postgres are loaded with `COPY`, keeping NULLs apart from
+    any string.
+    """
+    from sqlalchemy.dialects import postgresql
+
+    from superset.db_engine_specs.cockroachdb import CockroachDbEngineSpec
+    from superset.db_engine_specs.postgres import copy_from_stdin
+    from superset.db_engine_specs.risingwave import RisingWaveDbEngineSpec
+
+    engine = mocker.MagicMock()
+    engine.dialect.driver = "psycopg2"
+    assert spec.get_df_to_sql_method(engine) is copy_from_stdin
+    engine.dialect.driver = "pg8000"
+    assert spec.get_df_to_sql_method(engine) == "multi"
+    engine.dialect.driver = "psycopg2"
+    assert CockroachDbEngineSpec.get_df_to_sql_method(engine) == "multi"
+    assert RisingWaveDbEngineSpec.get_df_to_sql_method(engine) == "multi"
+
+    conn = mocker.MagicMock()
+    conn.dialect = postgresql.dialect()
+    cursor = conn.connection.cursor.return_value.__enter__.return_value
+    contents: list[str] = []
+    cursor.copy_expert.side_effect = lambda sql, buffer: contents.append(buffer.read())
+    table = mocker.MagicMock(schema="public")
+    table.name = "my table"
+
+    rows = copy_from_stdin(
+        table, conn, ["a", "b"], [(1, 'x,"y"'), (None, ""), (2, "\\N")]
+    )
+
+    assert rows == 3
+    cursor.copy_expert.assert_called_once_with(
+        'COPY public."my table" (a, b) FROM STDIN WITH (FORMAT csv)',
+        mocker.ANY,
+    )
+    assert contents == ['"1","x,""y"""\n,""\n"2","\\N"\n']
@@ -16,9 +16,10 @@
 # under the License.
 # pylint: disable=invalid-name, unused-argument, import-outside-toplevel, redefined-outer-name
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 import pytest
+from pytest_mock import MockerFixture
 from sqlalchemy.engine import create_engine
 
 from superset.constants import TimeGrain
@@ -129,3 +130,28 @@ def test_time_grain_expressions(dttm: str, grain: str, expected: str) -> None:
     sql = f"SELECT {expression} FROM t"  # noqa: S608
     result = connection.execute(sql).scalar()
     assert result == expected
+
+
+def test_df_to_sql(mocker: MockerFixture) -> None:
+    """
+    Test that uploads to SQLite insert the rows with `executemany`.
+    """
+    import pandas as pd
+
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+    from superset.sql.parse import Table
+
+    engine = create_engine("sqlite://")
+    get_engine = mocker.patch.object(SqliteEngineSpec, "get_engine")
+    get_engine.return_value.__enter__.return_value = engine
+    df = pd.DataFrame({"a": range(1000), "b": ["x"] * 1000})
+
+    to_sql_kwargs: dict[str, Any] = {"chunksize": 100, "index": False}
+    SqliteEngineSpec.df_to_sql(mocker.MagicMock(), Table("t"), df, to_sql_kwargs)
+
+    assert "method" not in to_sql_kwargs
+    with engine.connect() as conn:
+        assert conn.execute("SELECT COUNT(*), SUM(a) FROM t").fetchone() == (
+            1000,
+            499500,
+        )
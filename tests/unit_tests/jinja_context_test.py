@@ -17,6 +17,7 @@
 # pylint: disable=invalid-name, unused-argument
 from __future__ import annotations
 
+import time
 from datetime import datetime
 from typing import Any
 
@@ -1560,11 +1561,11 @@ def test_jinja2_undefined_error_handling(mocker: MockerFixture) -> None:
     from superset.jinja_context import BaseTemplateProcessor
 
     processor = BaseTemplateProcessor(database=database)
-    template = "SELECT * FROM table"
+    template = "SELECT * FROM {{ table }}"
 
-    # Mock the Environment.from_string to raise UndefinedError
+    # Mock the template compilation to raise UndefinedError
     with patch.object(
-        processor.env, "from_string", side_effect=UndefinedError("Variable not defined")
+        processor, "get_template", side_effect=UndefinedError("Variable not defined")
     ):
         with pytest.raises(SupersetSyntaxErrorException) as exc_info:
             processor.process_template(template)
@@ -1593,11 +1594,11 @@ def test_jinja2_security_error_handling(mocker: MockerFixture) -> None:
     from superset.jinja_context import BaseTemplateProcessor
 
     processor = BaseTemplateProcessor(database=database)
-    template = "SELECT * FROM table"
+    template = "SELECT * FROM {{ table }}"
 
-    # Mock the Environment.from_string to raise SecurityError
+    # Mock the template compilation to raise SecurityError
     with patch.object(
-        processor.env, "from_string", side_effect=SecurityError("Access denied")
+        processor, "get_template", side_effect=SecurityError("Access denied")
     ):
         with pytest.raises(SupersetSyntaxErrorException) as exc_info:
             processor.process_template(template)
@@ -1624,11 +1625,11 @@ def test_jinja2_server_error_handling(mocker: MockerFixture) -> None:
     from superset.jinja_context import BaseTemplateProcessor
 
     processor = BaseTemplateProcessor(database=database)
-    template = "SELECT * FROM table"
+    template = "SELECT * FROM {{ table }}"
 
-    # Mock the Environment.from_string to raise MemoryError (server error)
+    # Mock the template compilation to raise MemoryError (server error)
     with patch.object(
-        processor.env, "from_string", side_effect=MemoryError("Out of memory")
+        processor, "get_template", side_effect=MemoryError("Out of memory")
     ):
         with pytest.raises(SupersetTemplateException) as exc_info:
             processor.process_template(template)
@@ -1639,3 +1640,111 @@ def test_jinja2_server_error_handling(mocker: MockerFixture) -> None:
         assert "Internal Jinja2 template error" in str(exception)
         assert "MemoryError" in str(exception)
         assert "Out of memory" in str(exception)
+
+
+def test_process_template_compiled_once(mocker: MockerFixture) -> None:
+    """
+    Test that a template is compiled once per engine, and reused by processors.
+    """
+    from superset.jinja_context import (
+        BaseTemplateProcessor,
+        compiled_templates,
+        PrestoTemplateProcessor,
+    )
+
+    compiled_templates().clear()
+    compile_ = mocker.spy(SandboxedEnvironment, "compile")
+    database = mocker.MagicMock()
+    template = "SELECT '{{ value }}' AS value"
+
+    for value in ("a", "b"):
+        processor = BaseTemplateProcessor(database=database)
+        assert processor.process_template(template, value=value) == (
+            f"SELECT '{value}' AS value"
+        )
+    assert compile_.call_count == 1
+
+    PrestoTemplateProcessor(database=database).process_template(template)
+    assert compile_.call_count == 2
+
+
+def test_process_template_not_templated(mocker: MockerFixture) -> None:
+    """
+    Test that SQL without Jinja syntax renders as is, without compiling it.
+    """
+    from superset.jinja_context import BaseTemplateProcessor
+
+    compile_ = mocker.spy(SandboxedEnvironment, "compile")
+    processor = BaseTemplateProcessor(database=mocker.MagicMock())
+
+    sqls = ["SELECT 1", "SELECT 1\n", "SELECT\r\n  1\n\n", "SELECT '{' AS a"]
+    rendered = [processor.process_template(sql) for sql in sqls]
+    assert compile_.call_count == 0
+    assert rendered == [processor.env.from_string(sql).render() for sql in sqls]
+
+    assert processor.is_templated("SELECT 1 {# comment #}")
+    assert not processor.is_templated("SELECT '{' AS a")
+
+
+def test_dataset_macro_cached(mocker: MockerFixture) -> None:
+    """
+    Test that the SQL of a dataset is generated once per change of the dataset or its
+    database, until it expires, and not kept for datasets using Jinja or DHIS2.
+    """
+    from superset.jinja_context import clear_macro_results, macro_results
+
+    macro_results().clear()
+    mocker.patch(
+        "superset.jinja_context.security_manager.get_rls_cache_key",
+        return_value=[],
+    )
+    dataset = mocker.MagicMock(
+        id=1,
+        sql="SELECT 1 AS a",
+        changed_on=datetime(2024, 1, 1),
+        columns=[TableColumn(column_name="a")],
+        metrics=[],
+    )
+    dataset.database.backend = "postgresql"
+    dataset.database.changed_on = datetime(2024, 1, 1)
+    dataset.get_query_str_extended.return_value.sql = "SELECT a FROM t"
+    DatasetDAO = mocker.patch("superset.daos.dataset.DatasetDAO")  # noqa: N806
+    DatasetDAO.find_by_id.return_value = dataset
+
+    sql = "(\nSELECT a FROM t\n) AS dataset_1"
+    assert dataset_macro(1) == sql
+    assert dataset_macro(1) == sql
+    assert dataset.get_query_str_extended.call_count == 1
+
+    dataset.changed_on = datetime(2024, 1, 2)
+    assert dataset_macro(1) == sql
+    assert dataset.get_query_str_extended.call_count == 2
+
+    clear_macro_results(1)
+    assert dataset_macro(1) == sql
+    assert dataset.get_query_str_extended.call_count == 3
+
+    dataset.database.changed_on = datetime(2024, 1, 2)
+    assert dataset_macro(1) == sql
+    assert dataset.get_query_str_extended.call_count == 4
+
+    # entries expire after JINJA_MACRO_CACHE_TIMEOUT
+    later = time.monotonic() + 3600
+    mocker.patch("superset.jinja_context.time.monotonic", return_value=later)
+    assert dataset_macro(1) == sql
+    assert dataset.get_query_str_extended.call_count == 5
+    assert dataset_macro(1) == sql
+    assert dataset.get_query_str_extended.call_count == 5
+
+    dataset.database.backend = "dhis2"
+    dataset.changed_on = datetime(2024, 1, 3)
+    dataset_macro(1)
+    dataset_macro(1)
+    assert dataset.get_query_str_extended.call_count == 7
+
+    dataset.database.backend = "postgresql"
+    dataset.sql = "SELECT '{{ current_username() }}' AS a"
+    dataset.changed_on = datetime(2024, 1, 4)
+    dataset_macro(1)
+    dataset_macro(1)
+    assert dataset.get_query_str_extended.call_count == 9
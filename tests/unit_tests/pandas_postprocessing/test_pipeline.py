@@ -0,0 +1,103 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pytest
+
+from superset.exceptions import InvalidPostProcessingError
+from superset.utils import pandas_postprocessing as pp
+from superset.utils.pandas_postprocessing.pipeline import PostProcessingPipeline
+from tests.unit_tests.fixtures.dataframes import categories_df, timeseries_df
+
+
+def test_plan_validates_all_operations():
+    with pytest.raises(InvalidPostProcessingError):
+        PostProcessingPipeline([{"operation": "sort", "options": {"by": "y"}}, {}])
+
+    with pytest.raises(InvalidPostProcessingError):
+        PostProcessingPipeline([{"operation": "foobar"}])
+
+    # submodules of the package aren't operations
+    with pytest.raises(InvalidPostProcessingError):
+        PostProcessingPipeline([{"operation": "utils"}])
+
+
+def test_plan_drops_noops_and_fuses_renames():
+    pipeline = PostProcessingPipeline(
+        [
+            {"operation": "rename", "options": {"columns": {"constant": "c"}}},
+            {"operation": "sort", "options": {}},
+            {"operation": "rename", "options": {"columns": {"dept": "d"}}},
+            {"operation": "rename", "options": {"columns": {"c": "cc"}}},
+        ]
+    )
+    assert [(step.operation, step.fused) for step in pipeline.steps] == [
+        ("rename", 2),
+        ("rename", 1),
+    ]
+    assert pipeline.steps[0].options["columns"] == {"constant": "c", "dept": "d"}
+
+
+def test_execute_fused_renames_validates_each_rename():
+    post_processing = [
+        {"operation": "rename", "options": {"columns": {"constant": "c"}}},
+        {"operation": "rename", "options": {"columns": {"category": "dept"}}},
+    ]
+    pipeline = PostProcessingPipeline(post_processing)
+    assert [step.fused for step in pipeline.steps] == [2]
+
+    with pytest.raises(InvalidPostProcessingError, match="Label already exists"):
+        pp.rename(
+            pp.rename(categories_df, **post_processing[0]["options"]),
+            **post_processing[1]["options"],
+        )
+    with pytest.raises(InvalidPostProcessingError, match="Label already exists"):
+        pipeline.execute(categories_df.copy())
+
+
+def test_execute():
+    post_processing = [
+        {"operation": "cum", "options": {"operator": "sum", "columns": {"y": "y"}}},
+        {"operation": "rename", "options": {"columns": {"y": "cum_y"}}},
+        {"operation": "rename", "options": {"columns": {"label": "name"}}},
+        {"operation": "sort", "options": {"by": "cum_y", "ascending": False}},
+    ]
+    _timeseries_df = timeseries_df.copy()
+    pipeline = PostProcessingPipeline(post_processing)
+    df = pipeline.execute(_timeseries_df)
+
+    expected = timeseries_df
+    for post_process in post_processing:
+        expected = getattr(pp, post_process["operation"])(
+            expected, **post_process["options"]
+        )
+    assert df.equals(expected)
+    assert _timeseries_df.equals(timeseries_df)
+
+    assert [(stats.operation, stats.fused) for stats in pipeline.stats] == [
+        ("cum", 1),
+        ("rename", 2),
+        ("sort", 1),
+    ]
+    assert all(stats.rows == len(timeseries_df) for stats in pipeline.stats)
+    assert all(stats.memory_bytes > 0 for stats in pipeline.stats)
+
+
+def test_execute_does_not_modify_input_inplace():
+    _categories_df = categories_df.copy()
+    PostProcessingPipeline(
+        [{"operation": "rename", "options": {"columns": {"constant": "c"}}}]
+    ).execute(_categories_df)
+    assert _categories_df.equals(categories_df)
@@ -15,10 +15,14 @@
 # specific language governing permissions and limitations
 # under the License.
 from datetime import datetime
+from importlib import import_module
 from importlib.util import find_spec
+from typing import Any
 
 import pandas as pd
 import pytest
+from flask_caching import Cache
+from pytest_mock import MockerFixture
 
 from superset.exceptions import InvalidPostProcessingError
 from superset.utils.core import DTTM_ALIAS
@@ -184,3 +188,53 @@ def test_prophet_incorrect_time_grain():
             periods=10,
             confidence_interval=0.8,
         )
+
+
+@pytest.mark.usefixtures("app_context")
+def test_prophet_cached_forecasts(mocker: MockerFixture, app: Any) -> None:
+    """
+    Test that forecasts are cached per series and model parameters.
+    """
+    mocker.patch(
+        "superset.extensions.cache_manager._data_cache",
+        Cache(app, config={"CACHE_TYPE": "SimpleCache"}),
+    )
+    # the package exports the `prophet` function under the name of the module
+    prophet_module = import_module("superset.utils.pandas_postprocessing.prophet")
+    fit_and_predict = mocker.patch.object(
+        prophet_module,
+        "_prophet_fit_and_predict",
+        wraps=prophet_module._prophet_fit_and_predict,
+    )
+
+    df = prophet(df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9)
+    assert fit_and_predict.call_count == 2
+    assert list(df.columns) == [
+        DTTM_ALIAS,
+        "a__yhat",
+        "a__yhat_lower",
+        "a__yhat_upper",
+        "a",
+        "b__yhat",
+        "b__yhat_lower",
+        "b__yhat_upper",
+        "b",
+    ]
+
+    cached_df = prophet(
+        df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9
+    )
+    assert fit_and_predict.call_count == 2
+    pd.testing.assert_frame_equal(df, cached_df)
+
+    # only the series that changed is fitted again
+    prophet(
+        df=prophet_df.assign(b=prophet_df["b"] + 1),
+        time_grain="P1M",
+        periods=3,
+        confidence_interval=0.9,
+    )
+    assert fit_and_predict.call_count == 3
+
+    prophet(df=prophet_df, time_grain="P1M", periods=4, confidence_interval=0.9)
+    assert fit_and_predict.call_count == 5
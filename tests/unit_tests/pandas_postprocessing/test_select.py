@@ -50,6 +50,10 @@ def test_select():
     with pytest.raises(InvalidPostProcessingError):
         select(df=timeseries_df, columns=["abc"], rename={"abc": "qwerty"})
 
+    # unhashable columns
+    with pytest.raises(InvalidPostProcessingError):
+        select(df=timeseries_df, columns=[{"label": "label"}])
+
     # select renamed column by new name
     with pytest.raises(InvalidPostProcessingError):
         select(df=timeseries_df, columns=["label_new"], rename={"label": "label_new"})
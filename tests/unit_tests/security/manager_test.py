@@ -21,6 +21,7 @@ import json  # noqa: TID251
 
 import pytest
 from flask_appbuilder.security.sqla.models import Role, User
+from flask_login import AnonymousUserMixin
 from pytest_mock import MockerFixture
 
 from superset.common.query_object import QueryObject
@@ -32,7 +33,7 @@ from superset.security.manager import (
     query_context_modified,
     SupersetSecurityManager,
 )
-from superset.sql.parse import Table
+from superset.sql.parse import process_jinja_sql, Table
 from superset.superset_typing import AdhocColumn, AdhocMetric
 from superset.utils.core import DatasourceName, override_user
 
@@ -441,6 +442,48 @@ def test_raise_for_access_jinja_sql(mocker: MockerFixture, app_context: None) ->
     get_table_access_error_object.assert_called_with({Table("ab_user", "public", None)})
 
 
+def test_get_query_tables_cached(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the tables of a query are parsed once per database and SQL, unless the
+    SQL uses Jinja, and qualified with the default schema on every call.
+    """
+    sm = SupersetSecurityManager(appbuilder)
+    entries: dict[tuple[object, ...], set[Table]] = {}
+    sm.query_tables_cache = mocker.MagicMock()
+    sm.query_tables_cache.get_or_set.side_effect = lambda key, func: (
+        entries[key] if key in entries else entries.setdefault(key, func())
+    )
+    parse = mocker.patch(
+        "superset.security.manager.process_jinja_sql",
+        wraps=process_jinja_sql,
+    )
+
+    database = mocker.MagicMock(id=1, impersonate_user=False)
+    database.get_default_schema_for_query.return_value = "public"
+    query = mocker.MagicMock(catalog=None, schema=None, database=database)
+
+    query.sql = "SELECT * FROM ab_user"
+    for _ in range(2):
+        assert sm.get_query_tables(database, query, None) == {
+            Table("ab_user", "public", None)
+        }
+    assert parse.call_count == 1
+
+    database.get_default_schema_for_query.return_value = "other"
+    assert sm.get_query_tables(database, query, None) == {
+        Table("ab_user", "other", None)
+    }
+    assert parse.call_count == 1
+
+    query.sql = "SELECT * FROM {{ 'ab_user' }}"
+    for _ in range(2):
+        assert sm.get_query_tables(database, query, None) == {
+            Table("ab_user", "other", None)
+        }
+    assert parse.call_count == 3
+    assert len(entries) == 1
+
+
 def test_raise_for_access_chart_for_datasource_permission(
     mocker: MockerFixture,
     app_context: None,
@@ -1186,3 +1229,70 @@ def test_get_catalogs_accessible_by_user_schema_access(
     catalogs = {"catalog1", "catalog2"}
 
     assert sm.get_catalogs_accessible_by_user(database, catalogs) == {"catalog2"}
+
+
+def test_can_access_permissions_snapshot(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that `can_access` and `user_view_menu_names` use the cached permissions
+    snapshot, querying the permissions only once per set of roles.
+    """
+    sm = SupersetSecurityManager(appbuilder)
+    permissions_cache = mocker.MagicMock()
+    permissions_cache.enabled = True
+    permissions_cache.get_or_set.side_effect = lambda key, func: func()
+    sm.permissions_cache = permissions_cache
+    get_role_ids_permissions = mocker.patch.object(
+        sm,
+        "_get_role_ids_permissions",
+        return_value={"datasource_access": frozenset({"[db1].[table1](id:1)"})},
+    )
+
+    user = User(username="alice", roles=[Role(id=2, name="b"), Role(id=1, name="a")])
+    with override_user(user):
+        assert sm.can_access("datasource_access", "[db1].[table1](id:1)")
+        assert not sm.can_access("datasource_access", "[db1].[table2](id:2)")
+        assert not sm.can_access("database_access", "[db1].(id:1)")
+        assert sm.user_view_menu_names("datasource_access") == {"[db1].[table1](id:1)"}
+
+    permissions_cache.get_or_set.assert_called_with((1, 2), mocker.ANY)
+    get_role_ids_permissions.assert_called_with((1, 2))
+
+
+def test_can_access_permissions_snapshot_no_public_role(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that anonymous users have no access when there's no public role.
+    """
+    sm = SupersetSecurityManager(appbuilder)
+    permissions_cache = mocker.MagicMock()
+    permissions_cache.enabled = True
+    permissions_cache.get_or_set.side_effect = lambda key, func: func()
+    sm.permissions_cache = permissions_cache
+    mocker.patch.object(sm, "get_user_roles", return_value=[None])
+
+    with override_user(AnonymousUserMixin()):
+        assert not sm.can_access("can_read", "Dashboard")
+
+    permissions_cache.get_or_set.assert_called_with((), mocker.ANY)
+
+
+def test_permissions_cache_invalidated_on_role_change(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that granting a permission to a role invalidates the permissions cache.
+    """
+    sm = SupersetSecurityManager(appbuilder)
+    sm.permissions_cache = mocker.MagicMock()
+    sm.register_permissions_cache_listeners()
+
+    role = Role(name="role")
+    role.permissions.append(sm.permissionview_model())
+
+    sm.permissions_cache.invalidate.assert_called_once()
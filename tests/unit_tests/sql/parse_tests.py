@@ -26,10 +26,12 @@ from superset.jinja_context import JinjaTemplateProcessor
 from superset.sql.parse import (
     CTASMethod,
     extract_tables_from_statement,
+    get_parse_stats,
     JinjaSQLResult,
     KQLTokenType,
     KustoKQLStatement,
     LimitMethod,
+    parse_sql,
     process_jinja_sql,
     remove_quotes,
     RLSMethod,
@@ -1629,6 +1631,37 @@ def test_set_limit_value(
     assert statement.format() == expected
 
 
+def test_parsed_sql_cache() -> None:
+    """
+    Test that a script is parsed once, and that modifying its statements doesn't
+    change the statements of the same script parsed later.
+    """
+    parse_sql.cache_clear()
+    sql = "WITH t AS (SELECT 1 AS a) SELECT a FROM t"
+
+    statement = SQLStatement(sql, "postgresql")
+    statement.set_limit_value(10)
+    cte = SQLStatement(sql, "postgresql").as_cte()
+    assert SQLScript(sql, "postgresql").statements[0].optimize().format() == (
+        "WITH t AS (\n  SELECT\n    1 AS a\n)\nSELECT\n  a\nFROM t"
+    )
+
+    assert statement.format().endswith("LIMIT 10")
+    assert cte.format().startswith("WITH t AS (")
+    assert SQLStatement(sql, "postgresql").format() == (
+        "WITH t AS (\n  SELECT\n    1 AS a\n)\nSELECT\n  a\nFROM t"
+    )
+
+    stats = get_parse_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 3
+    assert stats["parse_time"] > 0
+
+    # the same SQL is parsed again for other engines
+    SQLStatement(sql, "mysql")
+    assert get_parse_stats()["misses"] == 2
+
+
 @pytest.mark.parametrize(
     "kql, limit, expected",
     [
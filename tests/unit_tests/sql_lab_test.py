@@ -26,7 +26,7 @@ from pytest_mock import MockerFixture
 
 from superset.common.db_query_status import QueryStatus
 from superset.db_engine_specs.postgres import PostgresEngineSpec
-from superset.errors import ErrorLevel, SupersetErrorType
+from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import OAuth2Error, SupersetErrorException
 from superset.models.core import Database
 from superset.sql.parse import SQLStatement, Table
@@ -34,6 +34,7 @@ from superset.sql_lab import (
     execute_query,
     execute_sql_statements,
     get_sql_results,
+    SqlLabQueryStoppedException,
 )
 from superset.utils.rls import apply_rls, get_predicates_for_table
 from tests.conftest import with_config
@@ -66,6 +67,74 @@ def test_execute_query(mocker: MockerFixture, app: None) -> None:
     SupersetResultSet.assert_called_with([(42,)], cursor.description, db_engine_spec)
 
 
+def test_execute_query_memory_cap(mocker: MockerFixture, app) -> None:
+    """
+    Test that the results of a query are fetched in chunks when the memory cap is
+    enabled, and that the cap is enforced.
+    """
+    mocker.patch.dict(
+        app.config,
+        {
+            "SQLLAB_RESULTS_MEMORY_CAP": {
+                "enabled": True,
+                "chunk_size": 2,
+                "max_memory_mb": 1,
+            }
+        },
+    )
+    mocker.patch.object(PostgresEngineSpec, "execute_with_cursor")
+    query = mocker.MagicMock()
+    query.executed_sql = "SELECT a FROM t"
+    query.limit = 3
+    query.database.db_engine_spec = PostgresEngineSpec
+
+    def make_cursor() -> MagicMock:
+        rows = [(1,), (2,), (3,), (4,), (5,)]
+        cursor = mocker.MagicMock()
+        cursor.description = [("a", 23, None, None, None, None, None)]
+        cursor.fetchmany.side_effect = lambda size: [
+            rows.pop(0) for _ in range(min(size, len(rows)))
+        ]
+        return cursor
+
+    cursor = make_cursor()
+    result_set = execute_query(query, cursor, {})
+    assert result_set.size == 3
+    assert [call.args for call in cursor.fetchmany.call_args_list] == [(2,), (2,)]
+
+    # the size of a row is estimated from the first chunk, 8 bytes per row here
+    mocker.patch("superset.sql_lab.BYTES_IN_MB", 31)
+    with pytest.raises(SupersetErrorException) as excinfo:
+        execute_query(query, make_cursor(), {})
+    assert excinfo.value.error.error_type == SupersetErrorType.RESULT_TOO_LARGE_ERROR
+
+    mocker.patch("superset.sql_lab.BYTES_IN_MB", 32)
+    assert execute_query(query, make_cursor(), {}).size == 3
+
+
+def test_execute_query_stopped(mocker: MockerFixture, app) -> None:
+    """
+    Test that errors raised by the engine of a stopped query stop it.
+    """
+    mocker.patch("superset.sql_lab.db")
+    mocker.patch.object(
+        PostgresEngineSpec,
+        "execute_with_cursor",
+        side_effect=SupersetErrorException(
+            SupersetError(
+                message="canceled",
+                error_type=SupersetErrorType.GENERIC_DB_ENGINE_ERROR,
+                level=ErrorLevel.ERROR,
+            )
+        ),
+    )
+    query = mocker.MagicMock(status=QueryStatus.STOPPED)
+    query.database.db_engine_spec = PostgresEngineSpec
+
+    with pytest.raises(SqlLabQueryStoppedException):
+        execute_query(query, mocker.MagicMock(), {})
+
+
 @with_config(
     {
         "SQLLAB_PAYLOAD_MAX_MB": 50,
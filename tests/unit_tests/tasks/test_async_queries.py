@@ -53,3 +53,52 @@ def test_load_chart_data_into_cache_with_error(
     mock_async_query_manager.update_job.assert_called_once_with(
         job_metadata, "error", errors=expected_errors
     )
+
+
+@mock.patch("superset.tasks.async_queries._load_chart_data_into_cache")
+@mock.patch("superset.tasks.async_queries.async_query_manager")
+def test_load_chart_data_batch_into_cache(
+    mock_async_query_manager, mock_load_chart_data_into_cache
+):
+    """Test that a failing chart of a batch doesn't fail the other charts"""
+    from superset.tasks.async_queries import load_chart_data_batch_into_cache
+
+    jobs_metadata = [{"job_id": "1"}, {"job_id": "2"}, {"job_id": "3"}]
+    form_datas = [{"slice_id": 1}, {"slice_id": 2}, {"slice_id": 3}]
+    mock_load_chart_data_into_cache.side_effect = [
+        None,
+        ChartDataQueryFailedError(_("Something went wrong")),
+        None,
+    ]
+
+    load_chart_data_batch_into_cache(jobs_metadata, form_datas)
+
+    assert mock_load_chart_data_into_cache.call_args_list == [
+        mock.call(job_metadata, form_data)
+        for job_metadata, form_data in zip(jobs_metadata, form_datas, strict=True)
+    ]
+    mock_async_query_manager.update_job.assert_not_called()
+
+
+@mock.patch("superset.tasks.async_queries._load_chart_data_into_cache")
+@mock.patch("superset.tasks.async_queries.async_query_manager")
+def test_load_chart_data_batch_into_cache_timeout(
+    mock_async_query_manager, mock_load_chart_data_into_cache
+):
+    """Test that the charts left in a batch are marked failed on timeout"""
+    from celery.exceptions import SoftTimeLimitExceeded
+
+    from superset.tasks.async_queries import load_chart_data_batch_into_cache
+
+    jobs_metadata = [{"job_id": "1"}, {"job_id": "2"}, {"job_id": "3"}]
+    mock_async_query_manager.STATUS_ERROR = "error"
+    mock_load_chart_data_into_cache.side_effect = [None, SoftTimeLimitExceeded()]
+
+    with pytest.raises(SoftTimeLimitExceeded):
+        load_chart_data_batch_into_cache(jobs_metadata, [{}, {}, {}])
+
+    mock_async_query_manager.update_job.assert_called_once_with(
+        {"job_id": "3"},
+        "error",
+        errors=[{"message": "A timeout occurred while loading chart data"}],
+    )
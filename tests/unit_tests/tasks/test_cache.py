@@ -0,0 +1,164 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+from pytest_mock import MockerFixture
+
+from superset.tasks.cache import (
+    CacheWarmupTask,
+    PredictedQueriesStrategy,
+    warm_up_charts,
+)
+from superset.utils import json
+
+
+def make_chart(chart_id: int, database_id: int, cache_key: str) -> MagicMock:
+    chart = MagicMock(id=chart_id, viz_type="echarts_timeseries_line")
+    chart.datasource.database_id = database_id
+    query_context = chart.get_query_context.return_value
+    query_context.queries = [MagicMock()]
+    query_context.query_cache_key.return_value = cache_key
+    return chart
+
+
+def make_task(chart_id: int, dashboard_id: int | None = None) -> CacheWarmupTask:
+    return {
+        "payload": {"chart_id": chart_id, "dashboard_id": dashboard_id},
+        "username": "admin",
+    }
+
+
+@pytest.mark.usefixtures("app_context")
+def test_warm_up_charts(mocker: MockerFixture, app: Flask) -> None:
+    """
+    Test that charts are run once per cache key, with at most
+    `max_concurrent_per_database` charts of a database at the same time.
+    """
+    mocker.patch.dict(
+        app.config,
+        CACHE_WARMUP_IN_PROCESS={
+            "enabled": True,
+            "max_workers": 4,
+            "max_concurrent_per_database": 1,
+        },
+    )
+    charts = {
+        1: make_chart(1, database_id=1, cache_key="a"),
+        2: make_chart(2, database_id=1, cache_key="b"),
+        3: make_chart(3, database_id=2, cache_key="c"),
+    }
+    db = mocker.patch("superset.tasks.cache.db")
+    db.session.query.return_value.get.side_effect = charts.get
+    mocker.patch("superset.tasks.cache.security_manager")
+
+    running: dict[int, int] = {1: 0, 2: 0}
+    max_running: dict[int, int] = {1: 0, 2: 0}
+    lock = threading.Lock()
+
+    def run(chart_id: int, *args: Any) -> MagicMock:
+        database_id = charts[chart_id].datasource.database_id
+
+        def run_chart() -> dict[str, Any]:
+            with lock:
+                running[database_id] += 1
+                max_running[database_id] = max(
+                    max_running[database_id], running[database_id]
+                )
+            time.sleep(0.05)
+            with lock:
+                running[database_id] -= 1
+            return {"chart_id": chart_id, "viz_error": None, "viz_status": "success"}
+
+        return MagicMock(run=run_chart)
+
+    command = mocker.patch(
+        "superset.commands.chart.warm_up_cache.ChartWarmUpCacheCommand",
+        side_effect=run,
+    )
+
+    results = warm_up_charts(
+        [make_task(1, 1), make_task(2, 1), make_task(1, 2), make_task(3, 2)]
+    )
+
+    assert sorted(call.args[0] for call in command.call_args_list) == [1, 2, 3]
+    assert max_running == {1: 1, 2: 1}
+    assert {
+        (result["chart_id"], result["dashboard_id"], result["status"])
+        for result in results
+    } == {(1, 1, "success"), (2, 1, "success"), (1, 2, "duplicate"), (3, 2, "success")}
+    assert all(
+        result["duration"] > 0 for result in results if result["status"] == "success"
+    )
+
+
+def test_predicted_queries_strategy(mocker: MockerFixture) -> None:
+    """
+    Test that the frequent chart data requests made around the same time of the day
+    are warmed up with their filters.
+    """
+    now = datetime.utcnow()
+    filtered = {
+        "datasource": {"id": 1, "type": "table"},
+        "queries": [{"filters": [{"col": "country", "op": "IN", "val": ["UG"]}]}],
+        "form_data": {"slice_id": 1, "dashboardId": 3},
+    }
+    unfiltered = {
+        "datasource": {"id": 1, "type": "table"},
+        "queries": [{"filters": []}],
+        "form_data": {"slice_id": 1},
+    }
+    logs = [
+        # requested on two days in the next hour
+        (1, now + timedelta(days=-1, minutes=10), json.dumps(filtered)),
+        (1, now + timedelta(days=-2, minutes=20), json.dumps(filtered)),
+        # requested once in the next hour
+        (1, now + timedelta(days=-1, minutes=30), json.dumps(unfiltered)),
+        # requested a few hours later
+        (1, now + timedelta(days=-1, hours=3), json.dumps(unfiltered)),
+        (1, now + timedelta(days=-2, hours=3), json.dumps(unfiltered)),
+        # the datasource of the chart changed since
+        (2, now + timedelta(days=-1, minutes=10), json.dumps(filtered)),
+        (2, now + timedelta(days=-2, minutes=10), json.dumps(filtered)),
+    ]
+    db = mocker.patch("superset.tasks.cache.db")
+    query = db.session.query.return_value.filter.return_value
+    query.yield_per.return_value = logs
+    query.__iter__.return_value = [
+        MagicMock(id=1, datasource_id=1),
+        MagicMock(id=2, datasource_id=4),
+    ]
+    mocker.patch(
+        "superset.tasks.cache.get_task",
+        side_effect=lambda chart: {
+            "payload": {"chart_id": chart.id},
+            "username": "admin",
+        },
+    )
+
+    strategy = PredictedQueriesStrategy(window=60, min_requests=2)
+    assert strategy.get_tasks() == [
+        {
+            "payload": {"chart_id": 1, "dashboard_id": 3, "query_context": filtered},
+            "username": "admin",
+        },
+    ]
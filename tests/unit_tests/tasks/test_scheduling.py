@@ -0,0 +1,221 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from celery.exceptions import Retry
+from flask_caching import Cache
+from pytest_mock import MockerFixture
+
+from superset.async_events.async_query_manager import UnsupportedCacheBackendError
+from superset.tasks.scheduling import (
+    PUBLISHED_AT_HEADER,
+    TaskScheduler,
+    USER_ID_HEADER,
+)
+from tests.unit_tests.utils.admission_control_test import FakeSlots
+
+SCHEDULING_CONFIG = {
+    "enabled": True,
+    "queue_prefix": "superset.",
+    "priorities": {"interactive": 9},
+    "user_concurrency": {"sqllab": 1},
+    "retry_delay": 5,
+    "max_retries": 3,
+    "lease_timeout": 60,
+    "cache_backend": None,
+}
+
+
+@pytest.fixture
+def slots(mocker: MockerFixture) -> FakeSlots:
+    slots = FakeSlots()
+    mocker.patch("superset.tasks.scheduling.get_cache_backend", return_value=slots)
+    return slots
+
+
+@pytest.fixture
+def scheduler(mocker: MockerFixture, app: Any, slots: FakeSlots) -> TaskScheduler:
+    mocker.patch(
+        "superset.extensions.cache_manager._cache",
+        Cache(app, config={"CACHE_TYPE": "SimpleCache"}),
+    )
+    mocker.patch.dict(
+        app.config,
+        {
+            "CELERY_TASK_SCHEDULING": SCHEDULING_CONFIG,
+            "CACHE_CONFIG": {"CACHE_TYPE": "RedisCache"},
+        },
+    )
+    mocker.patch("superset.tasks.scheduling.before_task_publish")
+    scheduler = TaskScheduler()
+    scheduler.init_app(app)
+    return scheduler
+
+
+def make_task(name: str, headers: dict[str, Any], task_id: str = "1") -> MagicMock:
+    task = MagicMock()
+    task.name = name
+    task.request.id = task_id
+    task.request.headers = headers
+    task.request.called_directly = False
+    task.request.is_eager = False
+    task.retry.side_effect = Retry()
+    return task
+
+
+def test_route(scheduler: TaskScheduler) -> None:
+    """
+    Test that each task class is routed to its own queue.
+    """
+    assert scheduler.route("load_chart_data_into_cache", (), {}, {}) == {
+        "queue": "superset.interactive",
+        "priority": 9,
+    }
+    assert scheduler.route("sql_lab.get_sql_results", (), {}, {}) == {
+        "queue": "superset.sqllab"
+    }
+    assert scheduler.route("reports.execute", (), {}, {}) == {"queue": "superset.batch"}
+    assert scheduler.route("sync_database_permissions", (), {}, {}) is None
+
+
+def test_on_publish(mocker: MockerFixture, scheduler: TaskScheduler) -> None:
+    """
+    Test that the user is kept in the headers of retried tasks.
+    """
+    mocker.patch("superset.tasks.scheduling.get_user_id", return_value=1)
+    headers: dict[str, Any] = {}
+    scheduler.on_publish(sender="sql_lab.get_sql_results", headers=headers)
+    assert headers[USER_ID_HEADER] == 1
+    assert PUBLISHED_AT_HEADER in headers
+
+    headers = {USER_ID_HEADER: 2}
+    scheduler.on_publish(sender="sql_lab.get_sql_results", headers=headers)
+    assert headers[USER_ID_HEADER] == 2
+
+    headers = {}
+    scheduler.on_publish(sender="sync_database_permissions", headers=headers)
+    assert headers == {}
+
+
+@pytest.mark.usefixtures("app_context")
+def test_admit_user_concurrency(scheduler: TaskScheduler) -> None:
+    """
+    Test that a user can't run more tasks of a class than allowed.
+    """
+    task = make_task("sql_lab.get_sql_results", {USER_ID_HEADER: 1})
+    other_task = make_task("sql_lab.get_sql_results", {USER_ID_HEADER: 1}, "2")
+    other_user_task = make_task("sql_lab.get_sql_results", {USER_ID_HEADER: 2}, "3")
+    chart_task = make_task("load_chart_data_into_cache", {USER_ID_HEADER: 1}, "4")
+
+    with scheduler.admit(task):
+        with pytest.raises(Retry):
+            with scheduler.admit(other_task):
+                pass
+        other_task.retry.assert_called_once_with(countdown=5, max_retries=3)
+
+        # other users and uncapped classes aren't affected
+        with scheduler.admit(other_user_task), scheduler.admit(chart_task):
+            pass
+
+    # the slot is released once the task is done
+    with scheduler.admit(other_task):
+        pass
+
+
+@pytest.mark.usefixtures("app_context")
+def test_admit_crashed_task(scheduler: TaskScheduler, slots: FakeSlots) -> None:
+    """
+    Test that the slot of a task whose worker died is released once its lease expires.
+    """
+    slots.slots["superset_tasks_running_sqllab_1"] = {"crashed": time.time() - 1}
+
+    with scheduler.admit(make_task("sql_lab.get_sql_results", {USER_ID_HEADER: 1})):
+        assert list(slots.slots["superset_tasks_running_sqllab_1"]) == ["1"]
+
+
+@pytest.mark.usefixtures("app_context")
+@pytest.mark.usefixtures("slots")
+def test_admit_eager_task_queue_depth(mocker: MockerFixture, app: Any) -> None:
+    """
+    Test that a published task is removed from the queue depth even when it runs
+    eagerly.
+    """
+    from superset.extensions import cache_manager
+
+    stats_logger = MagicMock()
+    mocker.patch.dict(
+        app.config,
+        {
+            "CELERY_TASK_SCHEDULING": SCHEDULING_CONFIG,
+            "CACHE_CONFIG": {"CACHE_TYPE": "RedisCache"},
+            "STATS_LOGGER": stats_logger,
+        },
+    )
+    mocker.patch(
+        "superset.extensions.cache_manager._cache",
+        Cache(app, config={"CACHE_TYPE": "SimpleCache"}),
+    )
+    mocker.patch("superset.tasks.scheduling.before_task_publish")
+    scheduler = TaskScheduler()
+    scheduler.init_app(app)
+
+    headers: dict[str, Any] = {}
+    scheduler.on_publish(sender="reports.execute", headers=headers)
+    scheduler.on_publish(sender="reports.execute", headers={})
+    assert cache_manager.cache.get("superset_tasks_queued_batch") == 2
+
+    task = make_task("reports.execute", headers)
+    task.request.is_eager = True
+    with scheduler.admit(task):
+        pass
+    assert cache_manager.cache.get("superset_tasks_queued_batch") == 1
+    stats_logger.gauge.assert_called_once_with("celery_tasks.batch.queue_depth", 1)
+
+
+def test_init_app_local_cache(
+    mocker: MockerFixture, app: Any, caplog: pytest.LogCaptureFixture
+) -> None:
+    """
+    Test that the queue depths are disabled when the cache isn't shared between
+    processes, and the per user caps without a Redis cache.
+    """
+    mocker.patch(
+        "superset.tasks.scheduling.get_cache_backend",
+        side_effect=UnsupportedCacheBackendError(),
+    )
+    mocker.patch.dict(
+        app.config,
+        {
+            "CELERY_TASK_SCHEDULING": SCHEDULING_CONFIG,
+            "CACHE_CONFIG": {"CACHE_TYPE": "SimpleCache"},
+        },
+    )
+    before_task_publish = mocker.patch("superset.tasks.scheduling.before_task_publish")
+    scheduler = TaskScheduler()
+    scheduler.init_app(app)
+
+    assert "requires CACHE_CONFIG to be shared" in caplog.text
+    assert "requires a Redis cache backend" in caplog.text
+    before_task_publish.connect.assert_not_called()
+    # tasks are still routed, but never capped
+    assert scheduler.route("reports.execute", (), {}, {}) == {"queue": "superset.batch"}
+    task = make_task("sql_lab.get_sql_results", {USER_ID_HEADER: 1})
+    with scheduler.admit(task), scheduler.admit(task):
+        pass
@@ -0,0 +1,87 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from pathlib import Path
+
+import pytest
+from cachelib import SimpleCache
+from pytest_mock import MockerFixture
+
+from superset.commands.database.exceptions import DatabaseUploadFailed
+from superset.tasks.uploads import (
+    get_upload_status,
+    set_upload_status,
+    upload_csv_file,
+    UploadStatus,
+)
+
+
+@pytest.fixture
+def csv_file(mocker: MockerFixture, tmp_path: Path) -> Path:
+    mocker.patch("superset.tasks.uploads._get_status_cache", return_value=SimpleCache())
+    mocker.patch("superset.tasks.uploads.security_manager")
+    file_path = tmp_path / "job.csv"
+    file_path.write_text("a\n1\n2\n")
+    return file_path
+
+
+@pytest.mark.usefixtures("app_context")
+def test_upload_csv_file(mocker: MockerFixture, csv_file: Path) -> None:
+    """
+    Test that the progress of an upload is reported, and its file removed.
+    """
+    upload_command = mocker.patch(
+        "superset.commands.database.uploaders.base.UploadCommand"
+    )
+
+    def run() -> None:
+        upload_command.call_args.kwargs["on_progress"](2)
+
+    upload_command.return_value.run.side_effect = run
+    set_upload_status("job", user_id=1, status=UploadStatus.PENDING, rows=0)
+
+    upload_csv_file("job", 1, 1, "table1", None, str(csv_file), {"delimiter": ","})
+
+    assert get_upload_status("job") == {
+        "user_id": 1,
+        "status": UploadStatus.SUCCESS,
+        "rows": 2,
+    }
+    assert not csv_file.exists()
+
+
+@pytest.mark.usefixtures("app_context")
+def test_upload_csv_file_failed(mocker: MockerFixture, csv_file: Path) -> None:
+    """
+    Test that the error of a failed upload is reported.
+    """
+    upload_command = mocker.patch(
+        "superset.commands.database.uploaders.base.UploadCommand"
+    )
+    upload_command.return_value.run.side_effect = DatabaseUploadFailed(
+        message="Parsing error"
+    )
+    set_upload_status("job", user_id=1, status=UploadStatus.PENDING, rows=0)
+
+    upload_csv_file("job", 1, 1, "table1", None, str(csv_file), {})
+
+    assert get_upload_status("job") == {
+        "user_id": 1,
+        "status": UploadStatus.FAILED,
+        "rows": 0,
+        "error": "Parsing error",
+    }
+    assert not csv_file.exists()
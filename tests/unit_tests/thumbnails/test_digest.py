@@ -422,3 +422,31 @@ def test_chart_digest(
         )
         with cm:
             assert get_chart_digest(chart=chart) == expected_result
+
+
+def test_chart_data_digest(app_context: None) -> None:
+    import pandas as pd
+
+    from superset.models.slice import Slice
+    from superset.thumbnails.digest import get_chart_data_digest
+
+    chart = Slice(**_DEFAULT_CHART_KWARGS)
+    query_context = MagicMock(queries=[MagicMock()])
+    query_context.query_cache_key.return_value = "cache_key"
+    data_cache = {"cache_key": {"df": pd.DataFrame({"a": [1, 2]})}}
+
+    with (
+        patch("superset.thumbnails.digest.get_chart_digest", return_value="digest"),
+        patch.object(Slice, "get_query_context", return_value=query_context),
+        patch("superset.extensions.cache_manager._data_cache", data_cache),
+    ):
+        digest = get_chart_data_digest(chart)
+        assert digest
+        assert get_chart_data_digest(chart) == digest
+
+        data_cache["cache_key"] = {"df": pd.DataFrame({"a": [1, 3]})}
+        assert get_chart_data_digest(chart) not in {None, digest}
+
+        # the data can't be compared when it isn't cached
+        del data_cache["cache_key"]
+        assert get_chart_data_digest(chart) is None
@@ -0,0 +1,196 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.exceptions import SupersetTimeoutException
+from superset.utils.admission_control import (
+    ACQUIRE_SCRIPT,
+    DatabaseAdmissionController,
+    RELEASE_SCRIPT,
+    RENEW_SCRIPT,
+)
+
+
+class FakeSlots:
+    """
+    Runs the admission scripts against an in memory sorted set.
+    """
+
+    def __init__(self) -> None:
+        self.slots: dict[str, dict[str, float]] = {}
+
+    def register_script(self, script: str) -> Any:
+        if script == ACQUIRE_SCRIPT:
+            return self.acquire
+        if script == RENEW_SCRIPT:
+            return self.renew
+        assert script == RELEASE_SCRIPT
+        return self.release
+
+    def acquire(self, keys: list[str], args: list[Any]) -> int:
+        now, expiry, limit, token = args
+        slots = {
+            token: score
+            for token, score in self.slots.get(keys[0], {}).items()
+            if score > now
+        }
+        self.slots[keys[0]] = slots
+        if len(slots) < limit:
+            slots[token] = expiry
+            return 1
+        return 0
+
+    def release(self, keys: list[str], args: list[Any]) -> int:
+        return int(self.slots.get(keys[0], {}).pop(args[0], None) is not None)
+
+    def renew(self, keys: list[str], args: list[Any]) -> int:
+        token, expiry, _ = args
+        slots = self.slots.get(keys[0], {})
+        if token not in slots:
+            return 0
+        slots[token] = expiry
+        return 1
+
+
+@pytest.fixture
+def slots(mocker: MockerFixture) -> FakeSlots:
+    slots = FakeSlots()
+    mocker.patch(
+        "superset.utils.admission_control.get_cache_backend", return_value=slots
+    )
+    return slots
+
+
+def make_controller(**config: Any) -> DatabaseAdmissionController:
+    app = MagicMock(
+        config={
+            "DATABASE_ADMISSION_CONTROL": {
+                "enabled": True,
+                "max_in_flight": 1,
+                "queue_timeout": 0,
+                "poll_interval": 0,
+                "lease_timeout": 60,
+                "key_prefix": "slots_",
+                "cache_backend": None,
+                **config,
+            },
+            "GLOBAL_ASYNC_QUERIES_CACHE_BACKEND": {},
+            "STATS_LOGGER": MagicMock(),
+        }
+    )
+    controller = DatabaseAdmissionController()
+    controller.init_app(app)
+    return controller
+
+
+def make_database(database_id: int, **extra: Any) -> MagicMock:
+    return MagicMock(id=database_id, database_name="examples", get_extra=lambda: extra)
+
+
+def admit_in_thread(
+    controller: DatabaseAdmissionController, database: MagicMock
+) -> Exception | None:
+    errors: list[Exception] = []
+
+    def admit() -> None:
+        try:
+            with controller.admit(database):
+                pass
+        except Exception as ex:  # pylint: disable=broad-except
+            errors.append(ex)
+
+    thread = threading.Thread(target=admit)
+    thread.start()
+    thread.join()
+    return errors[0] if errors else None
+
+
+def test_admit(slots: FakeSlots) -> None:
+    """
+    Test that a database runs at most `max_in_flight` queries at the same time.
+    """
+    controller = make_controller()
+    database = make_database(1)
+
+    with controller.admit(database):
+        assert len(slots.slots["slots_1"]) == 1
+        error = admit_in_thread(controller, database)
+        assert isinstance(error, SupersetTimeoutException)
+        assert "too many queries" in error.message
+
+        # other databases have their own slots
+        assert admit_in_thread(controller, make_database(2)) is None
+
+        # nested connections of the same thread don't wait for themselves
+        with controller.admit(database):
+            pass
+
+    assert slots.slots["slots_1"] == {}
+    assert admit_in_thread(controller, database) is None
+    controller._stats_logger.incr.assert_called_once_with(
+        "database_admission.1.rejected"
+    )
+
+
+def test_admit_heartbeat(slots: FakeSlots) -> None:
+    """
+    Test that a held slot is renewed past its lease timeout, and stops being renewed
+    once released.
+    """
+    controller = make_controller(lease_timeout=0.3)
+    database = make_database(1)
+
+    with controller.admit(database):
+        time.sleep(0.5)
+        # the slot would have expired without the heartbeat
+        assert admit_in_thread(controller, database) is not None
+        (expiry,) = slots.slots["slots_1"].values()
+        assert expiry > time.time()
+
+    assert slots.slots["slots_1"] == {}
+    time.sleep(0.2)
+    assert slots.slots["slots_1"] == {}
+
+
+def test_admit_database_limit(slots: FakeSlots) -> None:
+    """
+    Test that the limit can be set per database, 0 disabling it.
+    """
+    controller = make_controller()
+
+    assert controller.get_limit(make_database(1)) == 1
+    assert controller.get_limit(make_database(1, max_concurrent_queries=5)) == 5
+
+    with controller.admit(make_database(1, max_concurrent_queries=0)):
+        pass
+    assert slots.slots == {}
+
+
+def test_admit_disabled(slots: FakeSlots) -> None:
+    """
+    Test that queries are admitted right away when admission control is disabled.
+    """
+    controller = make_controller(enabled=False)
+    with controller.admit(make_database(1)), controller.admit(make_database(1)):
+        pass
+    assert slots.slots == {}
@@ -18,6 +18,7 @@
 # pylint: disable=import-outside-toplevel, unused-argument
 
 from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
 
 
 def test_memoized_func(mocker: MockerFixture) -> None:
@@ -49,3 +50,149 @@ def test_memoized_func(mocker: MockerFixture) -> None:
     cache.get.return_value = 43
     result = decorated(self, "public", cache=True)
     assert result == 43
+
+
+def test_versioned_cache(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that ``VersionedCache`` caches values and invalidates them across workers.
+    """
+    from flask import current_app, g
+    from flask_caching import Cache
+
+    from superset.utils.cache import VersionedCache
+
+    shared = Cache(config={"CACHE_TYPE": "SimpleCache"})
+    shared.init_app(current_app)
+    cache_manager = mocker.patch("superset.utils.cache.cache_manager")
+    cache_manager.cache = shared
+    mocker.patch.dict(current_app.config, {"TEST_CACHE_TIMEOUT": 60})
+
+    cache = VersionedCache("test", "TEST_CACHE_TIMEOUT")
+    func = mocker.MagicMock(return_value=[(1, None, "a = 1")])
+
+    assert cache.get_or_set((1, (2, 3)), func) == [(1, None, "a = 1")]
+    assert cache.get_or_set((1, (2, 3)), func) == [(1, None, "a = 1")]
+    func.assert_called_once()
+
+    # a different worker shares the entries through the shared cache
+    other = VersionedCache("test", "TEST_CACHE_TIMEOUT")
+    assert other.get_or_set((1, (2, 3)), func) == [(1, None, "a = 1")]
+    func.assert_called_once()
+
+    # invalidating in one worker bumps the version seen by the others
+    cache.invalidate()
+    del g._versioned_cache_test  # simulate a new request
+    assert other.get_or_set((1, (2, 3)), func) == [(1, None, "a = 1")]
+    assert func.call_count == 2
+
+
+def test_versioned_cache_disabled(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that ``VersionedCache`` is bypassed when the shared cache is a ``NullCache``.
+    """
+    from flask import current_app
+
+    from superset.utils.cache import VersionedCache
+
+    mocker.patch.dict(current_app.config, {"TEST_CACHE_TIMEOUT": 60})
+
+    cache = VersionedCache("test", "TEST_CACHE_TIMEOUT")
+    func = mocker.MagicMock(return_value=42)
+
+    assert cache.get_or_set("key", func) == 42
+    assert cache.get_or_set("key", func) == 42
+    assert func.call_count == 2
+
+
+def test_versioned_cache_invalidate_after_commit(
+    mocker: MockerFixture, app_context: None, session: Session
+) -> None:
+    """
+    Test that ``VersionedCache`` evicts the entries again once the session commits,
+    dropping the values refilled from the data read before the commit.
+    """
+    from flask import current_app, g
+    from flask_caching import Cache
+
+    from superset.utils.cache import VersionedCache
+
+    shared = Cache(config={"CACHE_TYPE": "SimpleCache"})
+    shared.init_app(current_app)
+    cache_manager = mocker.patch("superset.utils.cache.cache_manager")
+    cache_manager.cache = shared
+    mocker.patch.dict(current_app.config, {"TEST_CACHE_TIMEOUT": 60})
+
+    cache = VersionedCache("test", "TEST_CACHE_TIMEOUT")
+    other = VersionedCache("test", "TEST_CACHE_TIMEOUT")
+    func = mocker.MagicMock(return_value=42)
+
+    # flush time invalidation, another worker refills the cache before the commit
+    cache.invalidate(session)
+    del g._versioned_cache_test
+    other.get_or_set("key", func)
+    session.commit()
+
+    del g._versioned_cache_test
+    other.get_or_set("key", func)
+    assert func.call_count == 2
+
+
+def test_log_cache_key(
+    mocker: MockerFixture, app_context: None, session: Session
+) -> None:
+    """
+    Test that cache keys are recorded once, that records of keys set again are
+    refreshed, and that the expired records of the datasource are pruned.
+    """
+    from datetime import datetime, timedelta
+
+    from superset.models.cache import CacheKey
+    from superset.utils.cache import log_cache_key
+
+    CacheKey.metadata.create_all(session.bind)
+    mocker.patch("superset.utils.cache.db", mocker.MagicMock(engine=session.bind))
+    two_minutes_ago = datetime.now() - timedelta(minutes=2)
+    session.add_all(
+        [
+            CacheKey(
+                cache_key="expired",
+                cache_timeout=60,
+                datasource_uid="1__table",
+                created_on=two_minutes_ago,
+            ),
+            CacheKey(
+                cache_key="live",
+                cache_timeout=3600,
+                datasource_uid="1__table",
+                created_on=two_minutes_ago,
+            ),
+            CacheKey(
+                cache_key="other",
+                cache_timeout=60,
+                datasource_uid="2__table",
+                created_on=two_minutes_ago,
+            ),
+        ]
+    )
+    session.commit()
+
+    log_cache_key("key", 60, "1__table")
+    log_cache_key("key", 60, "1__table")
+
+    assert sorted(
+        (record.cache_key, record.datasource_uid) for record in session.query(CacheKey)
+    ) == [("key", "1__table"), ("live", "1__table"), ("other", "2__table")]
+
+    # a key set again before it expired, eg by a forced refresh, isn't pruned with
+    # its first timeout
+    session.query(CacheKey).filter_by(cache_key="key").update(
+        {"created_on": two_minutes_ago}
+    )
+    session.commit()
+    log_cache_key("key", 3600, "1__table")
+    log_cache_key("new", 60, "1__table")
+    session.expire_all()
+
+    (record,) = session.query(CacheKey).filter_by(cache_key="key").all()
+    assert record.cache_timeout == 3600
+    assert record.created_on > two_minutes_ago
@@ -0,0 +1,118 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from io import BytesIO
+from typing import Any
+
+import pandas as pd
+import pytest
+from PIL import Image
+from pytest_mock import MockerFixture
+
+from superset.utils.chart_renderer import (
+    can_render_chart,
+    render_chart,
+    render_dataframe,
+    RENDERERS,
+)
+
+pytest.importorskip("matplotlib")
+
+TIMESERIES_DF = pd.DataFrame(
+    {
+        "__timestamp": pd.date_range("2024-01-01", periods=3, freq="D"),
+        "boys": [1, 2, 3],
+        "girls": [3, 2, None],
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "viz_type, df",
+    [
+        ("table", pd.DataFrame({"name": ["a", "b"], "count": [1, 2]})),
+        ("big_number_total", pd.DataFrame({"count": [42]})),
+        ("big_number", TIMESERIES_DF[["__timestamp", "boys"]]),
+        ("big_number", pd.DataFrame({"count": [None]})),
+        ("echarts_timeseries_line", TIMESERIES_DF),
+        ("echarts_timeseries_bar", TIMESERIES_DF),
+    ],
+)
+def test_render_dataframe(viz_type: str, df: pd.DataFrame) -> None:
+    """
+    Test that every supported viz type renders a PNG of the requested size.
+    """
+    image = Image.open(
+        BytesIO(render_dataframe(viz_type, df, (800, 600), title="My chart"))
+    )
+    assert image.format == "PNG"
+    assert image.size == (800, 600)
+
+
+def test_can_render_chart(mocker: MockerFixture, app: Any) -> None:
+    """
+    Test that only enabled viz types of charts with a query context are rendered.
+    """
+    chart = mocker.MagicMock(viz_type="table", query_context='{"queries": []}')
+    with app.app_context():
+        mocker.patch.dict(
+            app.config, {"ALERT_REPORTS_SERVER_SIDE_RENDERING_VIZ_TYPES": []}
+        )
+        assert not can_render_chart(chart)
+
+        mocker.patch.dict(
+            app.config,
+            {"ALERT_REPORTS_SERVER_SIDE_RENDERING_VIZ_TYPES": list(RENDERERS)},
+        )
+        assert can_render_chart(chart)
+
+        chart.query_context = None
+        assert not can_render_chart(chart)
+
+        chart.query_context = '{"queries": []}'
+        chart.viz_type = "deck_arc"
+        mocker.patch.dict(
+            app.config, {"ALERT_REPORTS_SERVER_SIDE_RENDERING_VIZ_TYPES": ["deck_arc"]}
+        )
+        assert not can_render_chart(chart)
+
+
+def test_render_chart(mocker: MockerFixture) -> None:
+    """
+    Test that the chart data is queried as the report user before rendering.
+    """
+    command = mocker.patch(
+        "superset.commands.chart.data.get_data_command.ChartDataCommand"
+    )
+    command.return_value.run.return_value = {
+        "queries": [{"data": [{"count": 42}], "colnames": ["count"]}]
+    }
+    override_user = mocker.patch("superset.utils.chart_renderer.override_user")
+    render_dataframe = mocker.patch(
+        "superset.utils.chart_renderer.render_dataframe", return_value=b"png"
+    )
+    chart = mocker.MagicMock(viz_type="big_number_total", slice_name="Total")
+    user = mocker.MagicMock()
+
+    assert render_chart(chart, user, (800, 600)) == b"png"
+    override_user.assert_called_once_with(user)
+    command.assert_called_once_with(chart.get_query_context.return_value)
+    command.return_value.validate.assert_called_once()
+    df = render_dataframe.call_args.args[1]
+    assert df.to_dict(orient="records") == [{"count": 42}]
+    render_dataframe.assert_called_once_with(
+        "big_number_total", df, (800, 600), title="Total"
+    )
@@ -14,9 +14,11 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy.exc import OperationalError
 
-
-from superset.utils.log import get_logger_from_status
+from superset.utils.log import BufferedDBEventLogger, get_logger_from_status
 
 
 def test_log_from_status_exception() -> None:
@@ -35,3 +37,58 @@ def test_log_from_status_info() -> None:
     (func, log_level) = get_logger_from_status(300)
     assert func.__name__ == "info"
     assert log_level == "info"
+
+
+def log_records(event_logger: BufferedDBEventLogger, count: int) -> None:
+    event_logger.log(
+        user_id=1,
+        action="test",
+        dashboard_id=None,
+        duration_ms=10,
+        slice_id=None,
+        referrer=None,
+        records=[{"index": index} for index in range(count)],
+    )
+
+
+@pytest.mark.usefixtures("app_context")
+def test_buffered_event_logger(mocker: MockerFixture) -> None:
+    """
+    Test that logs are saved in batches, with the time they were logged, and dropped
+    when the queue is full.
+    """
+    db = mocker.patch("superset.db")
+    event_logger = BufferedDBEventLogger(
+        max_queue_size=3,
+        batch_size=2,
+        flush_interval=60,
+    )
+
+    log_records(event_logger, 4)
+    db.session.bulk_save_objects.assert_not_called()
+    assert event_logger.dropped == 1
+
+    event_logger.shutdown()
+    batches = [call.args[0] for call in db.session.bulk_save_objects.call_args_list]
+    assert [[log.json for log in batch] for batch in batches] == [
+        ['{"index": 0}', '{"index": 1}'],
+        ['{"index": 2}'],
+    ]
+    assert all(log.dttm for batch in batches for log in batch)
+    assert db.session.commit.call_count == 2
+
+
+@pytest.mark.usefixtures("app_context")
+def test_buffered_event_logger_failed(mocker: MockerFixture) -> None:
+    """
+    Test that the logs of a batch that failed to be saved are dropped.
+    """
+    db = mocker.patch("superset.db")
+    db.session.commit.side_effect = OperationalError("INSERT", {}, Exception())
+    event_logger = BufferedDBEventLogger(flush_interval=60)
+
+    log_records(event_logger, 2)
+    event_logger.shutdown()
+
+    db.session.rollback.assert_called_once()
+    assert event_logger.dropped == 2
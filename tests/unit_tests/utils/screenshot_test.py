@@ -182,6 +182,20 @@ class TestComputeAndCache:
         cache_payload: ScreenshotCachePayloadType = screenshot_obj.cache.get("key")
         assert cache_payload["image"] != b"initial_value"
 
+    def test_skips_if_data_unchanged(self, mocker: MockerFixture, screenshot_obj):
+        mocks = self._setup_compute_and_cache(mocker, screenshot_obj)
+        mocks["get_from_cache_key"].return_value = ScreenshotCachePayload(
+            image=b"old_image_data", data_digest="digest"
+        )
+        screenshot_obj.compute_and_cache(force=True, data_digest=lambda: "digest")
+        mocks["get_screenshot"].assert_not_called()
+
+        screenshot_obj.compute_and_cache(force=True, data_digest=lambda: "new_digest")
+        mocks["get_screenshot"].assert_called_once()
+        cache_payload: ScreenshotCachePayloadType = screenshot_obj.cache.get("key")
+        assert cache_payload["status"] == "Updated"
+        assert cache_payload["data_digest"] == "new_digest"
+
     def test_resize(self, mocker: MockerFixture, screenshot_obj):
         mocks = self._setup_compute_and_cache(mocker, screenshot_obj)
         window_size = thumb_size = (10, 10)
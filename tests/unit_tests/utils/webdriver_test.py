@@ -18,13 +18,16 @@
 from unittest.mock import MagicMock, patch, PropertyMock
 
 import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
 from superset.utils.webdriver import (
+    CHARTS_RENDERED_FUNCTION,
     check_playwright_availability,
     PLAYWRIGHT_AVAILABLE,
     PLAYWRIGHT_INSTALL_MESSAGE,
     validate_webdriver_config,
     WebDriverPlaywright,
+    WebDriverPool,
     WebDriverSelenium,
 )
 
@@ -497,6 +500,101 @@ class TestWebDriverPlaywrightFallback:
             "http://example.com", wait_until="networkidle"
         )
 
+    @patch("superset.utils.webdriver.PLAYWRIGHT_AVAILABLE", True)
+    @patch("superset.utils.webdriver.sync_playwright")
+    @patch("superset.utils.webdriver.app")
+    def test_get_screenshot_waits_for_rendered_charts(
+        self, mock_app, mock_sync_playwright
+    ):
+        """Test that the rendered charts signal replaces the fixed waits."""
+        mock_user = MagicMock()
+        mock_user.username = "test_user"
+
+        mock_app.config = {
+            "WEBDRIVER_OPTION_ARGS": [],
+            "WEBDRIVER_WINDOW": {"pixel_density": 1},
+            "SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT": 30000,
+            "SCREENSHOT_PLAYWRIGHT_WAIT_EVENT": "networkidle",
+            "SCREENSHOT_SELENIUM_HEADSTART": 5,
+            "SCREENSHOT_SELENIUM_ANIMATION_WAIT": 5,
+            "SCREENSHOT_WAIT_FOR_RENDERED_CHARTS": True,
+            "SCREENSHOT_RENDERED_CHARTS_ANIMATION_WAIT": 1,
+            "SCREENSHOT_REPLACE_UNEXPECTED_ERRORS": False,
+            "SCREENSHOT_TILED_ENABLED": False,
+            "SCREENSHOT_LOCATE_WAIT": 10,
+            "SCREENSHOT_LOAD_WAIT": 60,
+        }
+
+        mock_playwright_instance = MagicMock()
+        mock_sync_playwright.return_value.__enter__.return_value = (
+            mock_playwright_instance
+        )
+        mock_browser = mock_playwright_instance.chromium.launch.return_value
+        mock_context = mock_browser.new_context.return_value
+        mock_page = mock_context.new_page.return_value
+        mock_page.locator.return_value.screenshot.return_value = b"fake_screenshot"
+
+        with patch.object(WebDriverPlaywright, "auth"):
+            driver = WebDriverPlaywright("chrome")
+            result = driver.get_screenshot(
+                "http://example.com", "test-element", mock_user
+            )
+
+        assert result == b"fake_screenshot"
+        mock_page.wait_for_function.assert_called_once_with(
+            CHARTS_RENDERED_FUNCTION, timeout=60000
+        )
+        assert [call.args[0] for call in mock_page.wait_for_timeout.call_args_list] == [
+            0,
+            1000,
+        ]
+
+    @patch("superset.utils.webdriver.PLAYWRIGHT_AVAILABLE", True)
+    @patch("superset.utils.webdriver.sync_playwright")
+    @patch("superset.utils.webdriver.app")
+    def test_get_screenshot_rendered_charts_timeout(
+        self, mock_app, mock_sync_playwright
+    ):
+        """Test that the screenshot is taken when the charts don't render in time."""
+        from superset.utils.webdriver import PlaywrightTimeout
+
+        mock_user = MagicMock()
+        mock_user.username = "test_user"
+
+        mock_app.config = {
+            "WEBDRIVER_OPTION_ARGS": [],
+            "WEBDRIVER_WINDOW": {"pixel_density": 1},
+            "SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT": 30000,
+            "SCREENSHOT_PLAYWRIGHT_WAIT_EVENT": "networkidle",
+            "SCREENSHOT_SELENIUM_HEADSTART": 5,
+            "SCREENSHOT_SELENIUM_ANIMATION_WAIT": 5,
+            "SCREENSHOT_WAIT_FOR_RENDERED_CHARTS": True,
+            "SCREENSHOT_RENDERED_CHARTS_ANIMATION_WAIT": 1,
+            "SCREENSHOT_REPLACE_UNEXPECTED_ERRORS": False,
+            "SCREENSHOT_TILED_ENABLED": False,
+            "SCREENSHOT_LOCATE_WAIT": 10,
+            "SCREENSHOT_LOAD_WAIT": 60,
+        }
+
+        mock_playwright_instance = MagicMock()
+        mock_sync_playwright.return_value.__enter__.return_value = (
+            mock_playwright_instance
+        )
+        mock_browser = mock_playwright_instance.chromium.launch.return_value
+        mock_context = mock_browser.new_context.return_value
+        mock_page = mock_context.new_page.return_value
+        mock_page.locator.return_value.screenshot.return_value = b"fake_screenshot"
+        mock_page.wait_for_function.side_effect = PlaywrightTimeout("Timeout")
+
+        with patch.object(WebDriverPlaywright, "auth"):
+            driver = WebDriverPlaywright("chrome")
+            result = driver.get_screenshot(
+                "http://example.com", "test-element", mock_user
+            )
+
+        assert result == b"fake_screenshot"
+        mock_page.wait_for_function.assert_called_once()
+
     @patch("superset.utils.webdriver.PLAYWRIGHT_AVAILABLE", True)
     @patch("superset.utils.webdriver.sync_playwright")
     @patch("superset.utils.webdriver.logger")
@@ -693,3 +791,131 @@ class TestWebDriverPlaywrightErrorHandling:
         assert result is None
         # Should log timeout for element wait
         assert mock_logger.exception.call_count >= 1
+
+
+class TestWebDriverPool:
+    """Test reuse and recycling of pooled Selenium webdrivers."""
+
+    @pytest.fixture
+    def pool_app(self):
+        with patch("superset.utils.webdriver.app") as mock_app:
+            mock_app.config = {
+                "SCREENSHOT_SELENIUM_RETRIES": 1,
+                "SCREENSHOT_SELENIUM_HEADSTART": 0,
+                "SCREENSHOT_LOCATE_WAIT": 10,
+                "SCREENSHOT_LOAD_WAIT": 10,
+                "STATS_LOGGER": MagicMock(),
+                "WEBDRIVER_POOL": {
+                    "max_size": 2,
+                    "warm_size": 1,
+                    "max_usage": 2,
+                    "max_idle_seconds": 300,
+                    "max_js_heap_bytes": 1000,
+                },
+            }
+            yield mock_app
+
+    @pytest.fixture
+    def proxy(self):
+        proxy = MagicMock(driver_type="chrome")
+        proxy.create.side_effect = lambda: MagicMock(
+            execute_script=MagicMock(return_value=10)
+        )
+        return proxy
+
+    @patch("superset.utils.webdriver.machine_auth_provider_factory")
+    def test_reuses_authenticated_driver(self, mock_auth, pool_app, proxy):
+        pool_app.config["WEBDRIVER_POOL"]["max_usage"] = 10
+        pool = WebDriverPool()
+        user = MagicMock(id=1)
+
+        driver = pool.acquire(proxy, user)
+        pool.release(driver)
+        assert pool.acquire(proxy, user) is driver
+        assert proxy.create.call_count == 1
+        mock_auth.instance.authenticate_webdriver.assert_called_once_with(driver, user)
+
+        # a driver authenticated as another user is authenticated again
+        pool.release(driver)
+        other_user = MagicMock(id=2)
+        other_driver = pool.acquire(proxy, other_user)
+        assert other_driver is driver
+        driver.delete_all_cookies.assert_called_once()
+        mock_auth.instance.authenticate_webdriver.assert_called_with(driver, other_user)
+        assert pool.stats() == {
+            "idle": 0,
+            "leased": 1,
+            "created": 1,
+            "reused": 2,
+            "recycled": 0,
+        }
+
+    @patch("superset.utils.webdriver.machine_auth_provider_factory")
+    @patch("superset.utils.webdriver.WebDriverSelenium.destroy")
+    def test_recycles_drivers(self, mock_destroy, mock_auth, pool_app, proxy):
+        pool = WebDriverPool()
+        user = MagicMock(id=1)
+
+        # a driver that failed isn't reused
+        driver = pool.acquire(proxy, user)
+        pool.release(driver, healthy=False)
+        mock_destroy.assert_called_once_with(driver, 1)
+
+        # neither is one that rendered `max_usage` pages
+        driver = pool.acquire(proxy, user)
+        pool.release(driver)
+        assert pool.acquire(proxy, user) is driver
+        pool.release(driver)
+        assert pool.acquire(proxy, user) is not driver
+        mock_destroy.assert_called_with(driver, 1)
+
+        # nor one that uses too much memory
+        driver = pool.acquire(proxy, user)
+        driver.execute_script.return_value = 2000
+        pool.release(driver)
+        mock_destroy.assert_called_with(driver, 1)
+        assert pool.stats()["recycled"] == 3
+
+    @patch("superset.utils.webdriver.machine_auth_provider_factory")
+    @patch.object(WebDriverSelenium, "create")
+    def test_get_screenshot_releases_driver(self, mock_create, mock_auth, pool_app):
+        pool = WebDriverPool()
+        driver = mock_create.return_value
+        driver.get.side_effect = WebDriverException("unreachable")
+
+        with patch("superset.utils.webdriver.webdriver_pool", pool):
+            with pytest.raises(WebDriverException):
+                WebDriverSelenium("chrome").get_screenshot(
+                    "http://example.com/dashboard/1/", "standalone", MagicMock(id=1)
+                )
+
+        assert pool.stats()["leased"] == 0
+
+    @patch("superset.utils.webdriver.WebDriverWait")
+    @patch("superset.utils.webdriver.machine_auth_provider_factory")
+    @patch.object(WebDriverSelenium, "create")
+    def test_get_screenshot_expired_session(
+        self, mock_create, mock_auth, mock_wait, pool_app
+    ):
+        pool = WebDriverPool()
+        user = MagicMock(id=1)
+        driver = mock_create.return_value
+        driver.current_url = "http://example.com/login/?next=/dashboard/1/"
+        mock_wait.return_value.until.side_effect = TimeoutException()
+
+        with patch("superset.utils.webdriver.webdriver_pool", pool):
+            with pytest.raises(TimeoutException):
+                WebDriverSelenium("chrome").get_screenshot(
+                    "http://example.com/dashboard/1/", "standalone", user
+                )
+
+        assert mock_auth.instance.authenticate_webdriver.call_count == 2
+        assert driver.get.call_count == 2
+        driver.delete_all_cookies.assert_called_once()
+
+    def test_warm(self, pool_app, proxy):
+        pool = WebDriverPool()
+        pool.warm(proxy)
+        pool.warm(proxy)
+        assert proxy.create.call_count == 1
+        assert pool.stats()["idle"] == 1